@@ -503,6 +503,12 @@ ARG_DB_SKIP_ARCHIVE = Arg(
     help="Don't preserve purged records in an archive table.",
     action="store_true",
 )
+ARG_DB_BATCH_SIZE = Arg(
+    ("--batch-size",),
+    type=positive_int(allow_zero=False),
+    help="Maximum number of rows to delete per transaction. "
+    "Lower values keep transactions and lock / WAL volume small on large tables.",
+)
 ARG_DB_EXPORT_FORMAT = Arg(
     ("--export-format",),
     help="The file format to export the cleaned data",
@@ -1639,6 +1645,7 @@ DB_COMMANDS = (
             ARG_VERBOSE,
             ARG_YES,
             ARG_DB_SKIP_ARCHIVE,
+            ARG_DB_BATCH_SIZE,
         ),
     ),
     ActionCommand(
@@ -33,6 +33,7 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm.attributes import set_committed_value
 
 from airflow.models.base import Base, StringID
 from airflow.utils import timezone
@@ -93,16 +94,24 @@ class TaskInstanceHistory(Base):
 
     task_display_name = Column("task_display_name", String(2000), nullable=True)
 
+    _MUTABLE_COLUMNS = frozenset({"executor_config", "next_kwargs"})
+
     def __init__(
         self,
         ti: TaskInstance | TaskInstancePydantic,
         state: str | None = None,
     ):
         super().__init__()
+        # The history row is only ever inserted, so load the values straight into the instance
+        # dict instead of going through the instrumented setters and their change tracking. Mutable
+        # columns are still assigned, so that their values get wrapped to track in-place changes.
         for column in self.__table__.columns:
             if column.name == "id":
                 continue
-            setattr(self, column.name, getattr(ti, column.name))
+            if column.name in self._MUTABLE_COLUMNS:
+                setattr(self, column.name, getattr(ti, column.name))
+            else:
+                set_committed_value(self, column.name, getattr(ti, column.name))
 
         if state:
             self.state = state
@@ -148,7 +157,9 @@ class TaskInstanceHistory(Base):
         ti_history_state = ti.state
         if ti.state not in State.finished:
             ti_history_state = TaskInstanceState.FAILED
-            ti.end_date = timezone.utcnow()
-            ti.set_duration()
+            if ti.end_date is None:
+                ti.end_date = timezone.utcnow()
+            if ti.duration is None and ti.start_date is not None:
+                ti.set_duration()
         ti_history = TaskInstanceHistory(ti, state=ti_history_state)
         session.add(ti_history)
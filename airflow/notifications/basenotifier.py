@@ -17,8 +17,10 @@
 
 from __future__ import annotations
 
+import threading
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Sequence
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, ClassVar, Sequence
 
 from airflow.template.templater import Templater
 from airflow.utils.context import context_merge
@@ -36,10 +38,39 @@ class BaseNotifier(Templater):
     template_fields: Sequence[str] = ()
     template_ext: Sequence[str] = ()
 
+    # Content of template files with their up-to-date check from the Jinja loader, keyed by the loader's
+    # search path and the template path, least recently used first. Notifiers are commonly instantiated
+    # once per task, so a file is only read again once it changed on disk.
+    _template_source_cache: ClassVar[OrderedDict[tuple, tuple[str, Callable[[], bool]]]] = OrderedDict()
+    _template_source_cache_size: ClassVar[int] = 128
+    # Notifier callbacks may run in concurrent threads, which all share the cache.
+    _template_source_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self):
         super().__init__()
         self.resolve_template_files()
 
+    def _read_template_source(self, env: jinja2.Environment, path: str) -> str:
+        import jinja2
+
+        loader = env.loader
+        if not isinstance(loader, jinja2.FileSystemLoader):
+            return super()._read_template_source(env, path)
+        cache = self._template_source_cache
+        key = (tuple(loader.searchpath), path)
+        with self._template_source_cache_lock:
+            cached = cache.get(key)
+            if cached is not None and cached[1]():
+                cache.move_to_end(key)
+                return cached[0]
+        source, _, uptodate = loader.get_source(env, path)
+        with self._template_source_cache_lock:
+            cache[key] = (source, uptodate)
+            cache.move_to_end(key)
+            if len(cache) > self._template_source_cache_size:
+                cache.popitem(last=False)
+        return source
+
     def _update_context(self, context: Context) -> Context:
         """
         Add additional context to the context.
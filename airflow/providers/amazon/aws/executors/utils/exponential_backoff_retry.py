@@ -37,7 +37,10 @@ def calculate_next_attempt_delay(
     :param max_delay: Maximum delay in seconds between retries. Default 120.
     :param exponent_base: Exponent base to calculate delay. Default 4.
     """
-    return timedelta(seconds=min((exponent_base**attempt_number), max_delay))
+    # Any integer base >= 2 raised to a power above max_delay's bit length already exceeds max_delay,
+    # so cap the exponent rather than building an ever larger int for long-failing callables.
+    exponent = min(attempt_number, int(max_delay).bit_length() + 1)
+    return timedelta(seconds=min((exponent_base**exponent), max_delay))
 
 
 def exponential_backoff_retry(
@@ -76,4 +79,4 @@ def exponential_backoff_retry(
             next_delay = calculate_next_attempt_delay(
                 attempts_since_last_successful + 1, max_delay, exponent_base
             )
-            log.info("Waiting for %s seconds before retrying.", next_delay)
+            log.info("Waiting for %s seconds before retrying.", next_delay.total_seconds())
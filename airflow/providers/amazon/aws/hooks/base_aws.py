@@ -828,6 +828,9 @@ class AwsGenericHook(BaseHook, Generic[BaseAwsConnection]):
         """Repeat requests in response to exceeding a temporary quote limit."""
 
         def retry_decorator(fun: Callable):
+            # Only depends on the decorator argument, so built once per decorated function.
+            retry_condition = tenacity.retry_if_exception(should_retry)
+
             @wraps(fun)
             def decorator_f(self, *args, **kwargs):
                 retry_args = getattr(self, "retry_args", None)
@@ -841,7 +844,7 @@ class AwsGenericHook(BaseHook, Generic[BaseAwsConnection]):
                 tenacity_after_logger = tenacity.after_log(self.log, logging.INFO) if self.log else None
                 default_kwargs = {
                     "wait": tenacity.wait_exponential(multiplier=multiplier, max=max_limit, min=min_limit),
-                    "retry": tenacity.retry_if_exception(should_retry),
+                    "retry": retry_condition,
                     "stop": tenacity.stop_after_delay(stop_after_delay),
                     "before": tenacity_before_logger,
                     "after": tenacity_after_logger,
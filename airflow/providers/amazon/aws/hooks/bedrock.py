@@ -16,10 +16,76 @@
 # under the License.
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+from functools import cached_property
+from typing import Any
+
+from botocore.config import Config
+
 from airflow.providers.amazon.aws.hooks.base_aws import AwsBaseHook
 
+# Bedrock calls are frequently fanned out (e.g. mapped InvokeModel tasks), so use a larger connection
+# pool than botocore's default of 10 and keep idle connections alive to avoid repeated TLS handshakes.
+# Any option set explicitly in the hook, operator or connection ``config_kwargs`` takes precedence.
+_DEFAULT_BOTOCORE_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+
+# boto3 clients shared by all Bedrock hooks of a process, keyed by process id, client type and connection
+# parameters, so that sequential tasks in the same worker reuse one connection pool. Each client is stored
+# with a fingerprint of the credentials it was created with, and is replaced once the connection's
+# credentials or extra change, so rotating credentials do not accumulate clients.
+_SHARED_CLIENTS: dict[tuple, tuple[str, Any]] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+class _BedrockBaseHook(AwsBaseHook):
+    """
+    Base hook for Amazon Bedrock services, tuned for connection reuse.
+
+    Hooks created without an explicit botocore ``config`` share their boto3 client with all other
+    Bedrock hooks of the same process using the same client type, connection, credentials, region
+    and SSL verification.
+
+    :param share_client: Whether to share the boto3 client with the other Bedrock hooks of the process.
+        Set to False to always create a dedicated client. (default: True)
+    """
+
+    def __init__(self, *args, share_client: bool = True, **kwargs) -> None:
+        self.share_client = share_client
+        super().__init__(*args, **kwargs)
 
-class BedrockHook(AwsBaseHook):
+    def _get_credentials_fingerprint(self) -> str:
+        """Return a digest of the credentials and extra of the connection, without exposing them."""
+        conn_config = self.conn_config
+        return hashlib.sha256(
+            json.dumps(
+                [conn_config.login, conn_config.password, conn_config.extra_config],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+
+    @cached_property
+    def conn(self):
+        if not self.share_client or self._config is not None:
+            return super().conn
+        # The process id is part of the key so that forked processes never reuse their parent's client.
+        key = (os.getpid(), self.client_type, self.aws_conn_id, self.region_name, self._verify)
+        fingerprint = self._get_credentials_fingerprint()
+        with _SHARED_CLIENTS_LOCK:
+            cached = _SHARED_CLIENTS.get(key)
+            if cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, self.get_client_type(region_name=self.region_name))
+                _SHARED_CLIENTS[key] = cached
+            return cached[1]
+
+    def _get_config(self, config: Config | None = None) -> Config:
+        return _DEFAULT_BOTOCORE_CONFIG.merge(super()._get_config(config))
+
+
+class BedrockHook(_BedrockBaseHook):
     """
     Interact with Amazon Bedrock.
 
@@ -39,7 +105,7 @@ class BedrockHook(AwsBaseHook):
         super().__init__(*args, **kwargs)
 
 
-class BedrockRuntimeHook(AwsBaseHook):
+class BedrockRuntimeHook(_BedrockBaseHook):
     """
     Interact with the Amazon Bedrock Runtime.
 
@@ -59,7 +125,7 @@ class BedrockRuntimeHook(AwsBaseHook):
         super().__init__(*args, **kwargs)
 
 
-class BedrockAgentHook(AwsBaseHook):
+class BedrockAgentHook(_BedrockBaseHook):
     """
     Interact with the Amazon Agents for Bedrock API.
 
@@ -79,7 +145,7 @@ class BedrockAgentHook(AwsBaseHook):
         super().__init__(*args, **kwargs)
 
 
-class BedrockAgentRuntimeHook(AwsBaseHook):
+class BedrockAgentRuntimeHook(_BedrockBaseHook):
     """
     Interact with the Amazon Agents for Bedrock API.
 
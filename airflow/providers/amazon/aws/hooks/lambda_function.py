@@ -23,7 +23,7 @@ import base64
 from typing import Any
 
 from airflow.providers.amazon.aws.hooks.base_aws import AwsBaseHook
-from airflow.providers.amazon.aws.utils import trim_none_values
+from airflow.providers.amazon.aws.utils import trim_none_values, trim_none_values_inplace
 from airflow.providers.amazon.aws.utils.suppress import return_on_error
 
 
@@ -80,7 +80,7 @@ class LambdaHook(AwsBaseHook):
             "Payload": payload,
             "Qualifier": qualifier,
         }
-        return self.conn.invoke(**trim_none_values(invoke_args))
+        return self.conn.invoke(**trim_none_values_inplace(invoke_args))
 
     def create_lambda(
         self,
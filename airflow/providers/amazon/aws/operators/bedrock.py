@@ -16,12 +16,24 @@
 # under the License.
 from __future__ import annotations
 
+import hashlib
 import json
-from time import sleep
-from typing import TYPE_CHECKING, Any, Sequence
+import logging
+import random
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import timedelta
+from time import monotonic, sleep, time
+from typing import TYPE_CHECKING, Any, Callable, Container, Sequence
 
 from botocore.exceptions import ClientError
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
 from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.providers.amazon.aws.hooks.bedrock import (
@@ -30,23 +42,127 @@ from airflow.providers.amazon.aws.hooks.bedrock import (
     BedrockHook,
     BedrockRuntimeHook,
 )
+from airflow.providers.amazon.aws.hooks.s3 import S3Hook
 from airflow.providers.amazon.aws.operators.base_aws import AwsBaseOperator
-from airflow.providers.amazon.aws.triggers.bedrock import (
-    BedrockCustomizeModelCompletedTrigger,
-    BedrockIngestionJobTrigger,
-    BedrockKnowledgeBaseActiveTrigger,
-    BedrockProvisionModelThroughputCompletedTrigger,
-)
 from airflow.providers.amazon.aws.utils import validate_execute_complete_event
-from airflow.providers.amazon.aws.utils.mixins import aws_template_fields
-from airflow.utils.helpers import prune_dict
-from airflow.utils.timezone import utcnow
+from airflow.providers.amazon.aws.utils.bedrock import dumps_body, extract_path, loads_body
+from airflow.providers.amazon.aws.utils.mixins import AwsHookType, aws_template_fields
 
 if TYPE_CHECKING:
+    from airflow.providers.amazon.aws.hooks.base_aws import AwsGenericHook
     from airflow.utils.context import Context
 
+BEDROCK_INVOKE_MODEL_CACHE_MODES = ("disabled", "enabled", "read_only", "write_only", "replay")
+
+# Path segment through which ijson prefixes select the elements of a list.
+_IJSON_ARRAY_ITEM = "item"
+
+
+def _get_waiter_statuses(hook: AwsGenericHook, waiter_name: str) -> tuple[set[str], set[str]]:
+    """
+    Return the success and failure statuses of one of the hook's custom waiters.
+
+    The statuses are read from the waiter model, so that polling in the operator and waiting in the
+    deferrable triggers, which use the waiter itself, always agree on how a resource ends.
+    """
+    if hook.waiter_path is None:
+        raise AirflowException(f"{type(hook).__name__} does not define custom waiters.")
+    with open(hook.waiter_path) as config_file:
+        acceptors = json.load(config_file)["waiters"][waiter_name]["acceptors"]
+    success_statuses = {acceptor["expected"] for acceptor in acceptors if acceptor["state"] == "success"}
+    failure_statuses = {acceptor["expected"] for acceptor in acceptors if acceptor["state"] == "failure"}
+    return success_statuses, failure_statuses
+
+
+def _wait_with_backoff(
+    *,
+    hook: AwsGenericHook,
+    waiter_name: str,
+    get_status: Callable[[], str],
+    waiter_delay: int,
+    waiter_max_attempts: int,
+    description: str,
+    log: logging.Logger,
+) -> None:
+    """
+    Poll a status until it reaches a success or failure status of the hook's ``waiter_name`` waiter.
 
-class BedrockInvokeModelOperator(AwsBaseOperator[BedrockRuntimeHook]):
+    Polling starts after 2 seconds and the interval doubles up to ``waiter_delay``, with 20% jitter, so
+    that resources which become ready early are noticed early. The total wait is bounded by
+    ``waiter_delay * waiter_max_attempts``, as for the equivalent boto waiter.
+    """
+    success_statuses, failure_statuses = _get_waiter_statuses(hook, waiter_name)
+    deadline = monotonic() + waiter_delay * waiter_max_attempts
+    delay = min(2, waiter_delay)
+    while True:
+        status = get_status()
+        if status in success_statuses:
+            return
+        if status in failure_statuses:
+            raise AirflowException(f"{description} failed with status {status}.")
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            raise AirflowException(f"{description} did not complete in time, last status was {status}.")
+        log.debug("%s status is %s, checking again in about %s seconds.", description, status, delay)
+        sleep(min(delay * random.uniform(0.8, 1.2), remaining))
+        delay = min(delay * 2, waiter_delay)
+
+
+def _truncate(value: Any, max_length: int = 2048) -> str:
+    text = str(value)
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}... ({len(text) - max_length} more characters)"
+
+
+def _has_nonzero_temperature(data: Any) -> bool:
+    """Check whether any ``temperature`` inference parameter in the (nested) input data is above zero."""
+    if isinstance(data, dict):
+        return any(
+            (key == "temperature" and isinstance(value, (int, float)) and value > 0)
+            or _has_nonzero_temperature(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return any(_has_nonzero_temperature(item) for item in data)
+    return False
+
+
+def _read_cached_response(cache_uri: str, key: str) -> bytes | None:
+    with closing(sqlite3.connect(cache_uri)) as db, db:
+        db.execute("CREATE TABLE IF NOT EXISTS bedrock_cache(key TEXT PRIMARY KEY, body BLOB, ts REAL)")
+        row = db.execute("SELECT body FROM bedrock_cache WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _write_cached_response(cache_uri: str, key: str, body: bytes) -> None:
+    with closing(sqlite3.connect(cache_uri)) as db, db:
+        db.execute("CREATE TABLE IF NOT EXISTS bedrock_cache(key TEXT PRIMARY KEY, body BLOB, ts REAL)")
+        db.execute(
+            "INSERT OR REPLACE INTO bedrock_cache(key, body, ts) VALUES (?, ?, ?)",
+            (key, body, time()),
+        )
+
+
+class _BedrockBaseOperator(AwsBaseOperator[AwsHookType]):
+    """
+    Base operator for Amazon Bedrock, whose hook shares its boto3 client within the worker process.
+
+    :param share_client: Whether to share the boto3 client with the other Bedrock hooks of the worker
+        process using the same connection, credentials, region and SSL verification. Set to False to
+        always create a dedicated client. (default: True)
+    """
+
+    def __init__(self, *, share_client: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.share_client = share_client
+
+    @property
+    def _hook_parameters(self) -> dict[str, Any]:
+        return {**super()._hook_parameters, "share_client": self.share_client}
+
+
+class BedrockInvokeModelOperator(_BedrockBaseOperator[BedrockRuntimeHook]):
     """
     Invoke the specified Bedrock model to run inference using the input provided.
 
@@ -63,6 +179,23 @@ class BedrockInvokeModelOperator(AwsBaseOperator[BedrockRuntimeHook]):
     :param content_type: The MIME type of the input data in the request. (templated) Default: application/json
     :param accept: The desired MIME type of the inference body in the response.
         (templated) Default: application/json
+    :param cache_mode: Whether to cache model responses, keyed by the SHA-256 of the model id, input data,
+        content type and accept type, so that identical invocations are not sent to the model again.
+        One of ``disabled``, ``enabled`` (read and write), ``read_only``, ``write_only`` or ``replay``
+        (read only, and fail on a cache miss for reproducible reruns). (default: disabled)
+    :param cache_uri: Path of the SQLite database used as the response cache. Required unless
+        ``cache_mode`` is ``disabled``.
+    :param cache_nondeterministic: Also cache invocations with a ``temperature`` above zero, whose responses
+        are not reproducible. (default: False)
+    :param response_extract_path: Dot-separated path of dict keys (e.g. ``results.embedding``) of the only
+        part of the response to return, or None if the path is not in the response. Elements of lists
+        cannot be selected. If ``ijson`` is installed, the value is parsed straight from the response
+        stream without materializing the whole body. (default: None, return the full response)
+    :param log_response_body: Whether to log the full prompt and model response. If False, both are
+        truncated to 2048 characters in the logs. (default: True)
+    :param deferrable: If True, the model is invoked asynchronously from the triggerer, so the task does not
+        occupy a worker slot while waiting for the response. This mode requires aiobotocore module to be
+        installed. (default: False)
 
     :param aws_conn_id: The Airflow connection used for AWS credentials.
         If this is ``None`` or empty then the default boto3 behaviour is used. If
@@ -87,6 +220,12 @@ class BedrockInvokeModelOperator(AwsBaseOperator[BedrockRuntimeHook]):
         input_data: dict[str, Any],
         content_type: str | None = None,
         accept_type: str | None = None,
+        cache_mode: str = "disabled",
+        cache_uri: str | None = None,
+        cache_nondeterministic: bool = False,
+        response_extract_path: str | None = None,
+        log_response_body: bool = True,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -94,24 +233,291 @@ class BedrockInvokeModelOperator(AwsBaseOperator[BedrockRuntimeHook]):
         self.input_data = input_data
         self.content_type = content_type
         self.accept_type = accept_type
+        if cache_mode not in BEDROCK_INVOKE_MODEL_CACHE_MODES:
+            raise ValueError(
+                f"Invalid cache_mode {cache_mode!r}, must be one of {BEDROCK_INVOKE_MODEL_CACHE_MODES}."
+            )
+        if cache_mode != "disabled" and not cache_uri:
+            raise ValueError(f"cache_uri is required when cache_mode is {cache_mode!r}.")
+        self.cache_mode = cache_mode
+        self.cache_uri = cache_uri
+        self.cache_nondeterministic = cache_nondeterministic
+        if response_extract_path and _IJSON_ARRAY_ITEM in response_extract_path.split("."):
+            # ijson steps into lists through "item" segments, while the parsed body is only walked
+            # through dict keys, so such a path would select different values depending on ijson.
+            raise ValueError(
+                f"Invalid response_extract_path {response_extract_path!r}, it can only contain dict keys "
+                f"and no {_IJSON_ARRAY_ITEM!r} segment."
+            )
+        self.response_extract_path = response_extract_path
+        self.log_response_body = log_response_body
+        self.deferrable = deferrable
+
+    def _get_cache_key(self) -> str | None:
+        """Return the response cache key of this invocation, or None if it must not be cached."""
+        if self.cache_mode == "disabled":
+            return None
+        if not self.cache_nondeterministic and _has_nonzero_temperature(self.input_data):
+            self.log.info("Not using the response cache, the input data has a non-zero temperature.")
+            return None
+        return hashlib.sha256(
+            b"|".join(
+                [
+                    self.model_id.encode(),
+                    json.dumps(self.input_data, sort_keys=True, separators=(",", ":")).encode(),
+                    (self.content_type or "").encode(),
+                    (self.accept_type or "").encode(),
+                ]
+            )
+        ).hexdigest()
 
     def execute(self, context: Context) -> dict[str, str | int]:
+        cache_key = self._get_cache_key()
+        if cache_key and self.cache_mode in ("enabled", "read_only", "replay"):
+            cached_body = _read_cached_response(self.cache_uri, cache_key)  # type: ignore[arg-type]
+            if cached_body is not None:
+                self.log.info("Using cached Bedrock %s response for key %s.", self.model_id, cache_key)
+                response_body = loads_body(cached_body)
+                if self.response_extract_path:
+                    return extract_path(response_body, self.response_extract_path)
+                return response_body
+            if self.cache_mode == "replay":
+                raise AirflowException(
+                    f"No cached Bedrock response found for key {cache_key} in replay mode."
+                )
+
+        if self.deferrable:
+            from airflow.providers.amazon.aws.triggers.bedrock import BedrockInvokeModelTrigger
+
+            body = dumps_body(self.input_data)
+            self.defer(
+                trigger=BedrockInvokeModelTrigger(
+                    model_id=self.model_id,
+                    body=body.decode() if isinstance(body, bytes) else body,
+                    content_type=self.content_type,
+                    accept_type=self.accept_type,
+                    # The full body is needed to write the cache, otherwise only the extracted part is sent.
+                    response_extract_path=(
+                        None if self._should_write_cache(cache_key) else self.response_extract_path
+                    ),
+                    aws_conn_id=self.aws_conn_id,
+                    region_name=self.region_name,
+                    verify=self.verify,
+                    botocore_config=self.botocore_config,
+                ),
+                method_name="execute_complete",
+            )
+
         # These are optional values which the API defaults to "application/json" if not provided here.
-        invoke_kwargs = prune_dict({"contentType": self.content_type, "accept": self.accept_type})
+        invoke_kwargs = {
+            key: value
+            for key, value in (("contentType", self.content_type), ("accept", self.accept_type))
+            if value is not None
+        }
 
         response = self.hook.conn.invoke_model(
-            body=json.dumps(self.input_data),
+            body=dumps_body(self.input_data),
             modelId=self.model_id,
             **invoke_kwargs,
         )
 
-        response_body = json.loads(response["body"].read())
-        self.log.info("Bedrock %s prompt: %s", self.model_id, self.input_data)
-        self.log.info("Bedrock model response: %s", response_body)
+        if self.response_extract_path and ijson is not None and not self._should_write_cache(cache_key):
+            response_body = next(
+                ijson.items(response["body"], self.response_extract_path, use_float=True), None
+            )
+            self._log_invocation(response_body)
+            return response_body
+        return self._process_response(response["body"].read(), cache_key)
+
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> Any:
+        event = validate_execute_complete_event(event)
+
+        if event["status"] != "success":
+            raise AirflowException(f"Error while invoking Bedrock model {self.model_id}: {event}")
+
+        if "response" in event:
+            self._log_invocation(event["response"])
+            return event["response"]
+        return self._process_response(event["body"].encode(), self._get_cache_key())
+
+    def _should_write_cache(self, cache_key: str | None) -> bool:
+        return bool(cache_key) and self.cache_mode in ("enabled", "write_only")
+
+    def _process_response(self, raw_body: bytes, cache_key: str | None) -> Any:
+        response_body = loads_body(raw_body)
+        if self._should_write_cache(cache_key):
+            _write_cached_response(self.cache_uri, cache_key, raw_body)  # type: ignore[arg-type]
+        if self.response_extract_path:
+            response_body = extract_path(response_body, self.response_extract_path)
+        self._log_invocation(response_body)
         return response_body
 
+    def _log_invocation(self, response_body: Any) -> None:
+        if not self.log.isEnabledFor(logging.INFO):
+            return
+        if self.log_response_body:
+            self.log.info("Bedrock %s prompt: %s", self.model_id, self.input_data)
+            self.log.info("Bedrock model response: %s", response_body)
+        else:
+            self.log.info("Bedrock %s prompt: %s", self.model_id, _truncate(self.input_data))
+            self.log.info("Bedrock model response: %s", _truncate(response_body))
+
+
+class BedrockBatchInvokeModelOperator(_BedrockBaseOperator[BedrockHook]):
+    """
+    Run inference for many inputs at once with a Bedrock batch inference (model invocation) job.
+
+    The input records are written to S3 as JSONL, a model invocation job is created for them and,
+    once it is complete, the model outputs are read back from S3.
+
+    :param job_name: A name for the batch inference job. (templated)
+    :param role_arn: The ARN of an IAM role that Amazon Bedrock can assume to read the input
+        and write the output data in S3. (templated)
+    :param model_id: The ID of the Bedrock model. (templated)
+    :param input_records: The model inputs, in the format expected by the model. (templated)
+    :param s3_input_uri: The S3 URI of the JSONL file the input records are written to. (templated)
+    :param s3_output_uri: The S3 URI of the location where Bedrock writes the output. (templated)
+    :param invocation_job_kwargs: Any optional parameters to pass to the API. (templated)
 
-class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
+    :param wait_for_completion: Whether to wait for the job to complete and return its output records.
+        If False, the ARN of the job is returned instead. (default: True)
+    :param waiter_delay: Time in seconds to wait between status checks. (default: 60)
+    :param waiter_max_attempts: Maximum number of attempts to check for job completion. (default: 1440)
+    :param deferrable: If True, the operator will wait asynchronously for the job to complete.
+        This implies waiting for completion. This mode requires aiobotocore module to be installed.
+        (default: False)
+    :param aws_conn_id: The Airflow connection used for AWS credentials.
+        If this is ``None`` or empty then the default boto3 behaviour is used. If
+        running Airflow in a distributed manner and aws_conn_id is None or
+        empty, then default boto3 configuration would be used (and must be
+        maintained on each worker node).
+    :param region_name: AWS region_name. If not specified then the default boto3 behaviour is used.
+    :param verify: Whether or not to verify SSL certificates. See:
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html
+    :param botocore_config: Configuration dictionary (key-values) for botocore client. See:
+        https://botocore.amazonaws.com/v1/documentation/api/latest/reference/config.html
+    """
+
+    aws_hook_class = BedrockHook
+    template_fields: Sequence[str] = aws_template_fields(
+        "job_name",
+        "role_arn",
+        "model_id",
+        "input_records",
+        "s3_input_uri",
+        "s3_output_uri",
+        "invocation_job_kwargs",
+    )
+
+    def __init__(
+        self,
+        job_name: str,
+        role_arn: str,
+        model_id: str,
+        input_records: list[dict[str, Any]],
+        s3_input_uri: str,
+        s3_output_uri: str,
+        invocation_job_kwargs: dict[str, Any] | None = None,
+        wait_for_completion: bool = True,
+        waiter_delay: int = 60,
+        waiter_max_attempts: int = 1440,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.job_name = job_name
+        self.role_arn = role_arn
+        self.model_id = model_id
+        self.input_records = input_records
+        self.s3_input_uri = s3_input_uri
+        self.s3_output_uri = s3_output_uri
+        self.invocation_job_kwargs = invocation_job_kwargs or {}
+        self.wait_for_completion = wait_for_completion
+        self.waiter_delay = waiter_delay
+        self.waiter_max_attempts = waiter_max_attempts
+        self.deferrable = deferrable
+
+    @property
+    def s3_hook(self) -> S3Hook:
+        return S3Hook(
+            aws_conn_id=self.aws_conn_id,
+            region_name=self.region_name,
+            verify=self.verify,
+            config=self.botocore_config,
+        )
+
+    def _upload_input_records(self) -> None:
+        bucket, key = S3Hook.parse_s3_url(self.s3_input_uri)
+        jsonl = "\n".join(
+            json.dumps({"recordId": f"{i:011d}", "modelInput": record})
+            for i, record in enumerate(self.input_records)
+        )
+        self.s3_hook.load_bytes(jsonl.encode(), key=key, bucket_name=bucket, replace=True)
+
+    def _read_output_records(self, job_arn: str) -> list[dict[str, Any]]:
+        # Bedrock writes the output to <s3_output_uri>/<job id>/<input file name>.out
+        bucket, prefix = S3Hook.parse_s3_url(self.s3_output_uri.rstrip("/"))
+        input_file_name = self.s3_input_uri.rsplit("/", 1)[-1]
+        key = f"{prefix}/{job_arn.rsplit('/', 1)[-1]}/{input_file_name}.out".lstrip("/")
+        output = self.s3_hook.read_key(key=key, bucket_name=bucket)
+        records = [json.loads(line) for line in output.splitlines() if line]
+        return sorted(records, key=lambda record: record.get("recordId", ""))
+
+    def execute(self, context: Context) -> str | list[dict[str, Any]]:
+        self._upload_input_records()
+        self.log.info(
+            "Creating Bedrock batch inference job '%s' for %s records.",
+            self.job_name,
+            len(self.input_records),
+        )
+        job_arn = self.hook.conn.create_model_invocation_job(
+            jobName=self.job_name,
+            roleArn=self.role_arn,
+            modelId=self.model_id,
+            inputDataConfig={"s3InputDataConfig": {"s3Uri": self.s3_input_uri}},
+            outputDataConfig={"s3OutputDataConfig": {"s3Uri": self.s3_output_uri}},
+            **self.invocation_job_kwargs,
+        )["jobArn"]
+
+        if self.deferrable:
+            from airflow.providers.amazon.aws.triggers.bedrock import BedrockBatchInferenceCompletedTrigger
+
+            self.log.info("Deferring for Bedrock batch inference job %s.", job_arn)
+            self.defer(
+                trigger=BedrockBatchInferenceCompletedTrigger(
+                    job_arn=job_arn,
+                    waiter_delay=self.waiter_delay,
+                    waiter_max_attempts=self.waiter_max_attempts,
+                    aws_conn_id=self.aws_conn_id,
+                ),
+                method_name="execute_complete",
+            )
+        elif self.wait_for_completion:
+            self.log.info("Waiting for Bedrock batch inference job %s.", job_arn)
+            _wait_with_backoff(
+                hook=self.hook,
+                waiter_name="batch_inference_complete",
+                get_status=lambda: self.hook.conn.get_model_invocation_job(jobIdentifier=job_arn)["status"],
+                waiter_delay=self.waiter_delay,
+                waiter_max_attempts=self.waiter_max_attempts,
+                description=f"Bedrock batch inference job {job_arn}",
+                log=self.log,
+            )
+            return self._read_output_records(job_arn)
+
+        return job_arn
+
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        event = validate_execute_complete_event(event)
+
+        if event["status"] != "success":
+            raise AirflowException(f"Error while running job: {event}")
+
+        self.log.info("Bedrock batch inference job `%s` complete.", event["job_arn"])
+        return self._read_output_records(event["job_arn"])
+
+
+class BedrockCustomizeModelOperator(_BedrockBaseOperator[BedrockHook]):
     """
     Create a fine-tuning job to customize a base model.
 
@@ -128,9 +534,12 @@ class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
     :param output_data_uri: The S3 URI where the output data is stored.
     :param hyperparameters: Parameters related to tuning the model.
     :param ensure_unique_job_name: If set to true, operator will check whether a model customization
-        job already exists for the name in the config and append the current timestamp if there is a
-        name conflict. (Default: True)
+        job already exists for the name in the config and append the current timestamp and an attempt
+        counter if there is a name conflict. (Default: True)
     :param customization_job_kwargs: Any optional parameters to pass to the API.
+    :param idempotent: If set to true and ensure_unique_job_name is false, an in progress or completed
+        model customization job with the same name is reused instead of creating a new one, e.g. when the
+        task is cleared and re-run. (Default: False)
 
     :param wait_for_completion: Whether to wait for cluster to stop. (default: True)
     :param waiter_delay: Time in seconds to wait between status checks. (default: 120)
@@ -172,6 +581,7 @@ class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
         hyperparameters: dict[str, str],
         ensure_unique_job_name: bool = True,
         customization_job_kwargs: dict[str, Any] | None = None,
+        idempotent: bool = False,
         wait_for_completion: bool = True,
         waiter_delay: int = 120,
         waiter_max_attempts: int = 75,
@@ -193,6 +603,7 @@ class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
         self.hyperparameters = hyperparameters
         self.ensure_unique_job_name = ensure_unique_job_name
         self.customization_job_kwargs = customization_job_kwargs or {}
+        self.idempotent = idempotent
 
         self.valid_action_if_job_exists: set[str] = {"timestamp", "fail"}
 
@@ -203,14 +614,44 @@ class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
             raise AirflowException(f"Error while running job: {event}")
 
         self.log.info("Bedrock model customization job `%s` complete.", self.job_name)
+        if "job_arn" in event:
+            return event["job_arn"]
+        # Events of triggers created without the job ARN only carry the job name.
         return self.hook.conn.get_model_customization_job(jobIdentifier=event["job_name"])["jobArn"]
 
+    def _get_existing_job_arn(self, statuses: Container[str] | None = None) -> str | None:
+        """Return the ARN of a model customization job named job_name, optionally in one of statuses."""
+        paginator = self.hook.conn.get_paginator("list_model_customization_jobs")
+        for page in paginator.paginate(nameContains=self.job_name):
+            for job in page["modelCustomizationJobSummaries"]:
+                if job["jobName"] == self.job_name and (statuses is None or job["status"] in statuses):
+                    return job["jobArn"]
+        return None
+
+    def _rename_job(self, base_job_name: str, attempt: int) -> None:
+        # The attempt counter keeps names unique even for several collisions within the same second.
+        self.job_name = f"{base_job_name}-{int(time())}-{attempt}"
+        self.log.info("Changed job name to '%s' to avoid collision.", self.job_name)
+
     def execute(self, context: Context) -> dict:
+        if self.idempotent and not self.ensure_unique_job_name:
+            job_arn = self._get_existing_job_arn(statuses=("InProgress", "Completed"))
+            if job_arn:
+                self.log.info("Reusing existing Bedrock model customization job '%s'.", self.job_name)
+                return self._wait_for_job(job_arn)
+
+        base_job_name = self.job_name
+        rename_attempt = 0
+        if self.ensure_unique_job_name and self._get_existing_job_arn():
+            # Rename up-front rather than issuing a create call which is known to fail.
+            rename_attempt += 1
+            self._rename_job(base_job_name, rename_attempt)
+
         response = {}
         retry = True
         while retry:
             # If there is a name conflict and ensure_unique_job_name is True, append the current timestamp
-            # to the name and retry until there is no name conflict.
+            # and an attempt counter to the name and retry until there is no name conflict.
             # - Break the loop when the API call returns success.
             # - If the API returns an exception other than a name conflict, raise that exception.
             # - If the API returns a name conflict and ensure_unique_job_name is false, raise that exception.
@@ -235,18 +676,24 @@ class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
                 if not self.ensure_unique_job_name:
                     raise error
                 retry = True
-                self.job_name = f"{self.job_name}-{int(utcnow().timestamp())}"
-                self.log.info("Changed job name to '%s' to avoid collision.", self.job_name)
+                rename_attempt += 1
+                self._rename_job(base_job_name, rename_attempt)
 
         if response["ResponseMetadata"]["HTTPStatusCode"] != 201:
             raise AirflowException(f"Bedrock model customization job creation failed: {response}")
 
+        return self._wait_for_job(response["jobArn"])
+
+    def _wait_for_job(self, job_arn: str) -> str:
         task_description = f"Bedrock model customization job {self.job_name} to complete."
         if self.deferrable:
+            from airflow.providers.amazon.aws.triggers.bedrock import BedrockCustomizeModelCompletedTrigger
+
             self.log.info("Deferring for %s", task_description)
             self.defer(
                 trigger=BedrockCustomizeModelCompletedTrigger(
                     job_name=self.job_name,
+                    job_arn=job_arn,
                     waiter_delay=self.waiter_delay,
                     waiter_max_attempts=self.waiter_max_attempts,
                     aws_conn_id=self.aws_conn_id,
@@ -255,15 +702,22 @@ class BedrockCustomizeModelOperator(AwsBaseOperator[BedrockHook]):
             )
         elif self.wait_for_completion:
             self.log.info("Waiting for %s", task_description)
-            self.hook.get_waiter("model_customization_job_complete").wait(
-                jobIdentifier=self.job_name,
-                WaiterConfig={"Delay": self.waiter_delay, "MaxAttempts": self.waiter_max_attempts},
+            _wait_with_backoff(
+                get_status=lambda: self.hook.conn.get_model_customization_job(jobIdentifier=self.job_name)[
+                    "status"
+                ],
+                hook=self.hook,
+                waiter_name="model_customization_job_complete",
+                waiter_delay=self.waiter_delay,
+                waiter_max_attempts=self.waiter_max_attempts,
+                description=f"Bedrock model customization job {self.job_name}",
+                log=self.log,
             )
 
-        return response["jobArn"]
+        return job_arn
 
 
-class BedrockCreateProvisionedModelThroughputOperator(AwsBaseOperator[BedrockHook]):
+class BedrockCreateProvisionedModelThroughputOperator(_BedrockBaseOperator[BedrockHook]):
     """
     Create a fine-tuning job to customize a base model.
 
@@ -332,6 +786,10 @@ class BedrockCreateProvisionedModelThroughputOperator(AwsBaseOperator[BedrockHoo
         )["provisionedModelArn"]
 
         if self.deferrable:
+            from airflow.providers.amazon.aws.triggers.bedrock import (
+                BedrockProvisionModelThroughputCompletedTrigger,
+            )
+
             self.log.info("Deferring for provisioned throughput.")
             self.defer(
                 trigger=BedrockProvisionModelThroughputCompletedTrigger(
@@ -344,9 +802,16 @@ class BedrockCreateProvisionedModelThroughputOperator(AwsBaseOperator[BedrockHoo
             )
         if self.wait_for_completion:
             self.log.info("Waiting for provisioned throughput.")
-            self.hook.get_waiter("provisioned_model_throughput_complete").wait(
-                provisionedModelId=provisioned_model_id,
-                WaiterConfig={"Delay": self.waiter_delay, "MaxAttempts": self.waiter_max_attempts},
+            _wait_with_backoff(
+                get_status=lambda: self.hook.conn.get_provisioned_model_throughput(
+                    provisionedModelId=provisioned_model_id
+                )["status"],
+                hook=self.hook,
+                waiter_name="provisioned_model_throughput_complete",
+                waiter_delay=self.waiter_delay,
+                waiter_max_attempts=self.waiter_max_attempts,
+                description=f"Bedrock provisioned throughput {provisioned_model_id}",
+                log=self.log,
             )
 
         return provisioned_model_id
@@ -361,7 +826,7 @@ class BedrockCreateProvisionedModelThroughputOperator(AwsBaseOperator[BedrockHoo
         return event["provisioned_model_id"]
 
 
-class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
+class BedrockCreateKnowledgeBaseOperator(_BedrockBaseOperator[BedrockAgentHook]):
     """
     Create a knowledge base that contains data sources used by Amazon Bedrock LLMs and Agents.
 
@@ -378,9 +843,12 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
     :param wait_for_indexing: Vector indexing can take some time and there is no apparent way to check the state
         before trying to create the Knowledge Base.  If this is True, and creation fails due to the index not
         being available, the operator will wait and retry.  (default: True) (templated)
-    :param indexing_error_retry_delay: Seconds between retries if an index error is encountered. (default 5) (templated)
+    :param indexing_error_retry_delay: Seconds before the first retry if an index error is encountered. The delay
+        doubles with each further retry, up to 60 seconds, with random jitter applied. (default 5) (templated)
     :param indexing_error_max_attempts: Maximum number of times to retry when encountering an index error. (default 20) (templated)
     :param create_knowledge_base_kwargs: Any additional optional parameters to pass to the API call. (templated)
+    :param idempotent: If set to true, an existing knowledge base with the same name is reused instead
+        of creating a new one, e.g. when the task is cleared and re-run. (default: False)
 
     :param wait_for_completion: Whether to wait for cluster to stop. (default: True)
     :param waiter_delay: Time in seconds to wait between status checks. (default: 60)
@@ -412,6 +880,8 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
         "create_knowledge_base_kwargs",
     )
 
+    INDEXING_ERROR_MAX_RETRY_DELAY = 60  # seconds
+
     def __init__(
         self,
         name: str,
@@ -419,6 +889,7 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
         role_arn: str,
         storage_config: dict[str, Any],
         create_knowledge_base_kwargs: dict[str, Any] | None = None,
+        idempotent: bool = False,
         wait_for_indexing: bool = True,
         indexing_error_retry_delay: int = 5,  # seconds
         indexing_error_max_attempts: int = 20,
@@ -433,11 +904,8 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
         self.role_arn = role_arn
         self.storage_config = storage_config
         self.create_knowledge_base_kwargs = create_knowledge_base_kwargs or {}
+        self.idempotent = idempotent
         self.embedding_model_arn = embedding_model_arn
-        self.knowledge_base_config = {
-            "type": "VECTOR",
-            "vectorKnowledgeBaseConfiguration": {"embeddingModelArn": self.embedding_model_arn},
-        }
         self.wait_for_indexing = wait_for_indexing
         self.indexing_error_retry_delay = indexing_error_retry_delay
         self.indexing_error_max_attempts = indexing_error_max_attempts
@@ -456,13 +924,22 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
         self.log.info("Bedrock knowledge base creation job `%s` complete.", self.name)
         return event["knowledge_base_id"]
 
-    def execute(self, context: Context) -> str:
-        def _create_kb():
-            # This API call will return the following if the index has not completed, but there is no apparent
-            # way to check the state of the index beforehand, so retry on index failure if set to do so.
-            #       botocore.errorfactory.ValidationException: An error occurred (ValidationException)
-            #       when calling the CreateKnowledgeBase operation: The knowledge base storage configuration
-            #       provided is invalid... no such index [bedrock-sample-rag-index-abc108]
+    @property
+    def knowledge_base_config(self) -> dict[str, Any]:
+        # Built on access rather than in __init__, so DAG parsing does not pay for it and the
+        # rendered value of the templated embedding_model_arn is used.
+        return {
+            "type": "VECTOR",
+            "vectorKnowledgeBaseConfiguration": {"embeddingModelArn": self.embedding_model_arn},
+        }
+
+    def _create_kb(self, attempt: int = 0) -> str:
+        # This API call will return the following if the index has not completed, but there is no apparent
+        # way to check the state of the index beforehand, so retry on index failure if set to do so.
+        #       botocore.errorfactory.ValidationException: An error occurred (ValidationException)
+        #       when calling the CreateKnowledgeBase operation: The knowledge base storage configuration
+        #       provided is invalid... no such index [bedrock-sample-rag-index-abc108]
+        while True:
             try:
                 return self.hook.conn.create_knowledge_base(
                     name=self.name,
@@ -472,27 +949,40 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
                     **self.create_knowledge_base_kwargs,
                 )["knowledgeBase"]["knowledgeBaseId"]
             except ClientError as error:
-                if all(
-                    [
-                        error.response["Error"]["Code"] == "ValidationException",
-                        "no such index" in error.response["Error"]["Message"],
-                        self.wait_for_indexing,
-                        self.indexing_error_max_attempts > 0,
-                    ]
+                err = error.response["Error"]
+                if not (
+                    self.wait_for_indexing
+                    and attempt < self.indexing_error_max_attempts
+                    and err["Code"] == "ValidationException"
+                    and "no such index" in err["Message"]
                 ):
-                    self.indexing_error_max_attempts -= 1
-                    self.log.warning(
-                        "Vector index not ready, retrying in %s seconds.", self.indexing_error_retry_delay
+                    raise
+                # Exponential backoff with jitter, capped at INDEXING_ERROR_MAX_RETRY_DELAY seconds.
+                delay = min(
+                    self.INDEXING_ERROR_MAX_RETRY_DELAY, self.indexing_error_retry_delay * 2**attempt
+                ) * random.uniform(0.5, 1)
+                attempt += 1
+                self.log.warning("Vector index not ready, retrying in %.1f seconds.", delay)
+                self.log.debug("%s retries remaining.", self.indexing_error_max_attempts - attempt)
+                if self.deferrable:
+                    from airflow.triggers.temporal import TimeDeltaTrigger
+
+                    # Free up the worker slot while waiting for the index to become available.
+                    self.defer(
+                        trigger=TimeDeltaTrigger(timedelta(seconds=delay)),
+                        method_name="retry_create_kb",
+                        kwargs={"attempt": attempt},
                     )
-                    self.log.debug("%s retries remaining.", self.indexing_error_max_attempts)
-                    sleep(self.indexing_error_retry_delay)
-                    return _create_kb()
-                raise
+                sleep(delay)
 
-        self.log.info("Creating Amazon Bedrock Knowledge Base %s", self.name)
-        knowledge_base_id = _create_kb()
+    def retry_create_kb(self, context: Context, event: Any = None, attempt: int = 0) -> str:
+        """Retry the knowledge base creation after a deferred wait for the vector index."""
+        return self._wait_for_kb(self._create_kb(attempt))
 
+    def _wait_for_kb(self, knowledge_base_id: str) -> str:
         if self.deferrable:
+            from airflow.providers.amazon.aws.triggers.bedrock import BedrockKnowledgeBaseActiveTrigger
+
             self.log.info("Deferring for Knowledge base creation.")
             self.defer(
                 trigger=BedrockKnowledgeBaseActiveTrigger(
@@ -505,15 +995,38 @@ class BedrockCreateKnowledgeBaseOperator(AwsBaseOperator[BedrockAgentHook]):
             )
         if self.wait_for_completion:
             self.log.info("Waiting for Knowledge Base creation.")
-            self.hook.get_waiter("knowledge_base_active").wait(
-                knowledgeBaseId=knowledge_base_id,
-                WaiterConfig={"Delay": self.waiter_delay, "MaxAttempts": self.waiter_max_attempts},
+            _wait_with_backoff(
+                get_status=lambda: self.hook.conn.get_knowledge_base(knowledgeBaseId=knowledge_base_id)[
+                    "knowledgeBase"
+                ]["status"],
+                hook=self.hook,
+                waiter_name="knowledge_base_active",
+                waiter_delay=self.waiter_delay,
+                waiter_max_attempts=self.waiter_max_attempts,
+                description=f"Bedrock Knowledge Base {knowledge_base_id}",
+                log=self.log,
             )
 
         return knowledge_base_id
 
+    def _get_existing_kb_id(self) -> str | None:
+        paginator = self.hook.conn.get_paginator("list_knowledge_bases")
+        for page in paginator.paginate():
+            for knowledge_base in page["knowledgeBaseSummaries"]:
+                if knowledge_base["name"] == self.name and knowledge_base["status"] in ("CREATING", "ACTIVE"):
+                    return knowledge_base["knowledgeBaseId"]
+        return None
+
+    def execute(self, context: Context) -> str:
+        if self.idempotent and (knowledge_base_id := self._get_existing_kb_id()):
+            self.log.info("Reusing existing Amazon Bedrock Knowledge Base %s", self.name)
+            return self._wait_for_kb(knowledge_base_id)
+
+        self.log.info("Creating Amazon Bedrock Knowledge Base %s", self.name)
+        return self._wait_for_kb(self._create_kb())
+
 
-class BedrockCreateDataSourceOperator(AwsBaseOperator[BedrockAgentHook]):
+class BedrockCreateDataSourceOperator(_BedrockBaseOperator[BedrockAgentHook]):
     """
     Set up an Amazon Bedrock Data Source to be added to an Amazon Bedrock Knowledge Base.
 
@@ -574,7 +1087,68 @@ class BedrockCreateDataSourceOperator(AwsBaseOperator[BedrockAgentHook]):
         return create_ds_response["dataSource"]["dataSourceId"]
 
 
-class BedrockIngestDataOperator(AwsBaseOperator[BedrockAgentHook]):
+class BedrockCreateDataSourcesOperator(_BedrockBaseOperator[BedrockAgentHook]):
+    """
+    Set up several Amazon Bedrock Data Sources for an Amazon Bedrock Knowledge Base at once.
+
+    The data sources are created concurrently, so adding N data sources costs about one API
+    round-trip and a single task instead of N.
+
+    :param knowledge_base_id: The unique identifier of the knowledge base to which to add the data sources.
+        (templated)
+    :param data_sources: The parameters of each data source to create, as passed to the CreateDataSource
+        API call, e.g. ``{"name": "docs", "dataSourceConfiguration": {"type": "S3", ...}}``. (templated)
+    :param max_workers: Maximum number of data sources created in parallel. (default: 16)
+
+    :param aws_conn_id: The Airflow connection used for AWS credentials.
+        If this is ``None`` or empty then the default boto3 behaviour is used. If
+        running Airflow in a distributed manner and aws_conn_id is None or
+        empty, then default boto3 configuration would be used (and must be
+        maintained on each worker node).
+    :param region_name: AWS region_name. If not specified then the default boto3 behaviour is used.
+    :param verify: Whether or not to verify SSL certificates. See:
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html
+    :param botocore_config: Configuration dictionary (key-values) for botocore client. See:
+        https://botocore.amazonaws.com/v1/documentation/api/latest/reference/config.html
+    """
+
+    aws_hook_class = BedrockAgentHook
+    template_fields: Sequence[str] = aws_template_fields(
+        "knowledge_base_id",
+        "data_sources",
+    )
+
+    def __init__(
+        self,
+        knowledge_base_id: str,
+        data_sources: list[dict[str, Any]],
+        max_workers: int = 16,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.knowledge_base_id = knowledge_base_id
+        self.data_sources = data_sources
+        self.max_workers = max_workers
+
+    def execute(self, context: Context) -> list[str]:
+        if not self.data_sources:
+            return []
+
+        client = self.hook.conn
+        with ThreadPoolExecutor(max_workers=min(len(self.data_sources), self.max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    client.create_data_source, knowledgeBaseId=self.knowledge_base_id, **data_source
+                )
+                for data_source in self.data_sources
+            ]
+            data_source_ids = [future.result()["dataSource"]["dataSourceId"] for future in futures]
+
+        self.log.info("Created %s data sources: %s", len(data_source_ids), data_source_ids)
+        return data_source_ids
+
+
+class BedrockIngestDataOperator(_BedrockBaseOperator[BedrockAgentHook]):
     """
     Begin an ingestion job, in which an Amazon Bedrock data source is added to an Amazon Bedrock knowledge base.
 
@@ -648,6 +1222,8 @@ class BedrockIngestDataOperator(AwsBaseOperator[BedrockAgentHook]):
         )["ingestionJob"]["ingestionJobId"]
 
         if self.deferrable:
+            from airflow.providers.amazon.aws.triggers.bedrock import BedrockIngestionJobTrigger
+
             self.log.info("Deferring for ingestion job.")
             self.defer(
                 trigger=BedrockIngestionJobTrigger(
@@ -671,7 +1247,7 @@ class BedrockIngestDataOperator(AwsBaseOperator[BedrockAgentHook]):
         return ingestion_job_id
 
 
-class BedrockRaGOperator(AwsBaseOperator[BedrockAgentRuntimeHook]):
+class BedrockRaGOperator(_BedrockBaseOperator[BedrockAgentRuntimeHook]):
     """
     Query a knowledge base and generate responses based on the retrieved results with sources citations.
 
@@ -813,7 +1389,7 @@ class BedrockRaGOperator(AwsBaseOperator[BedrockAgentRuntimeHook]):
         return result
 
 
-class BedrockRetrieveOperator(AwsBaseOperator[BedrockAgentRuntimeHook]):
+class BedrockRetrieveOperator(_BedrockBaseOperator[BedrockAgentRuntimeHook]):
     """
     Query a knowledge base and retrieve results with source citations.
 
@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, Any, Sequence
 from airflow.exceptions import AirflowException, AirflowSkipException
 from airflow.providers.amazon.aws.hooks.lambda_function import LambdaHook
 from airflow.providers.amazon.aws.sensors.base_aws import AwsBaseSensor
-from airflow.providers.amazon.aws.utils import trim_none_values
+from airflow.providers.amazon.aws.utils import trim_none_values_inplace
 from airflow.providers.amazon.aws.utils.mixins import aws_template_fields
 
 if TYPE_CHECKING:
@@ -75,7 +75,8 @@ class LambdaFunctionStateSensor(AwsBaseSensor[LambdaHook]):
             "FunctionName": self.function_name,
             "Qualifier": self.qualifier,
         }
-        state = self.hook.conn.get_function(**trim_none_values(get_function_args))["Configuration"]["State"]
+        response = self.hook.conn.get_function(**trim_none_values_inplace(get_function_args))
+        state = response["Configuration"]["State"]
 
         if state in self.FAILURE_STATES:
             message = "Lambda function state sensor failed because the Lambda is in a failed state"
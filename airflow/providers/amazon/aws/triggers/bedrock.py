@@ -16,20 +16,113 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
-from airflow.providers.amazon.aws.hooks.bedrock import BedrockAgentHook, BedrockHook
+from airflow.providers.amazon.aws.hooks.bedrock import BedrockAgentHook, BedrockHook, BedrockRuntimeHook
 from airflow.providers.amazon.aws.triggers.base import AwsBaseWaiterTrigger
+from airflow.providers.amazon.aws.utils.bedrock import extract_path, loads_body
+from airflow.triggers.base import BaseTrigger, TriggerEvent
 
 if TYPE_CHECKING:
     from airflow.providers.amazon.aws.hooks.base_aws import AwsGenericHook
 
 
+class BedrockInvokeModelTrigger(BaseTrigger):
+    """
+    Invoke a Bedrock model asynchronously and fire once its response has been received.
+
+    :param model_id: The ID of the Bedrock model.
+    :param body: The serialized input data of the request.
+    :param content_type: The MIME type of the input data in the request.
+    :param accept_type: The desired MIME type of the inference body in the response.
+    :param response_extract_path: Dot-separated path of keys of the only part of the response to send
+        in the event, so that the full response body is not stored with the event. If not set, the
+        whole body is sent.
+    :param aws_conn_id: The Airflow connection used for AWS credentials.
+    :param region_name: AWS region_name. If not specified then the default boto3 behaviour is used.
+    :param verify: Whether or not to verify SSL certificates.
+    :param botocore_config: Configuration dictionary (key-values) for botocore client.
+    """
+
+    def __init__(
+        self,
+        *,
+        model_id: str,
+        body: str,
+        content_type: str | None = None,
+        accept_type: str | None = None,
+        response_extract_path: str | None = None,
+        aws_conn_id: str | None = "aws_default",
+        region_name: str | None = None,
+        verify: bool | str | None = None,
+        botocore_config: dict | None = None,
+    ) -> None:
+        super().__init__()
+        self.model_id = model_id
+        self.body = body
+        self.content_type = content_type
+        self.accept_type = accept_type
+        self.response_extract_path = response_extract_path
+        self.aws_conn_id = aws_conn_id
+        self.region_name = region_name
+        self.verify = verify
+        self.botocore_config = botocore_config
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            self.__class__.__module__ + "." + self.__class__.__qualname__,
+            {
+                "model_id": self.model_id,
+                "body": self.body,
+                "content_type": self.content_type,
+                "accept_type": self.accept_type,
+                "response_extract_path": self.response_extract_path,
+                "aws_conn_id": self.aws_conn_id,
+                "region_name": self.region_name,
+                "verify": self.verify,
+                "botocore_config": self.botocore_config,
+            },
+        )
+
+    @cached_property
+    def hook(self) -> BedrockRuntimeHook:
+        return BedrockRuntimeHook(
+            aws_conn_id=self.aws_conn_id,
+            region_name=self.region_name,
+            verify=self.verify,
+            config=self.botocore_config,
+        )
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        # These are optional values which the API defaults to "application/json" if not provided here.
+        invoke_kwargs = {
+            key: value
+            for key, value in (("contentType", self.content_type), ("accept", self.accept_type))
+            if value is not None
+        }
+        try:
+            async with self.hook.async_conn as client:
+                response = await client.invoke_model(body=self.body, modelId=self.model_id, **invoke_kwargs)
+                body = await response["body"].read()
+            if self.response_extract_path:
+                extracted = extract_path(loads_body(body), self.response_extract_path)
+        except Exception as e:
+            yield TriggerEvent({"status": "error", "message": str(e)})
+            return
+        if self.response_extract_path:
+            yield TriggerEvent({"status": "success", "response": extracted})
+        else:
+            yield TriggerEvent({"status": "success", "body": body.decode()})
+
+
 class BedrockCustomizeModelCompletedTrigger(AwsBaseWaiterTrigger):
     """
     Trigger when a Bedrock model customization job is complete.
 
     :param job_name: The name of the Bedrock model customization job.
+    :param job_arn: The ARN of the Bedrock model customization job. If provided, it is included in the
+        event so that the operator does not need to look it up again.
     :param waiter_delay: The amount of time in seconds to wait between attempts. (default: 120)
     :param waiter_max_attempts: The maximum number of attempts to be made. (default: 75)
     :param aws_conn_id: The Airflow connection used for AWS credentials.
@@ -39,12 +132,16 @@ class BedrockCustomizeModelCompletedTrigger(AwsBaseWaiterTrigger):
         self,
         *,
         job_name: str,
+        job_arn: str | None = None,
         waiter_delay: int = 120,
         waiter_max_attempts: int = 75,
         aws_conn_id: str | None = None,
     ) -> None:
+        serialized_fields = {"job_name": job_name}
+        if job_arn:
+            serialized_fields["job_arn"] = job_arn
         super().__init__(
-            serialized_fields={"job_name": job_name},
+            serialized_fields=serialized_fields,
             waiter_name="model_customization_job_complete",
             waiter_args={"jobIdentifier": job_name},
             failure_message="Bedrock model customization failed.",
@@ -56,6 +153,49 @@ class BedrockCustomizeModelCompletedTrigger(AwsBaseWaiterTrigger):
             waiter_max_attempts=waiter_max_attempts,
             aws_conn_id=aws_conn_id,
         )
+        self.job_arn = job_arn
+
+    def hook(self) -> AwsGenericHook:
+        return BedrockHook(aws_conn_id=self.aws_conn_id)
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        async for event in super().run():
+            if self.job_arn:
+                event.payload["job_arn"] = self.job_arn
+            yield event
+
+
+class BedrockBatchInferenceCompletedTrigger(AwsBaseWaiterTrigger):
+    """
+    Trigger when a Bedrock batch inference (model invocation) job is complete.
+
+    :param job_arn: The ARN of the Bedrock model invocation job.
+    :param waiter_delay: The amount of time in seconds to wait between attempts. (default: 60)
+    :param waiter_max_attempts: The maximum number of attempts to be made. (default: 1440)
+    :param aws_conn_id: The Airflow connection used for AWS credentials.
+    """
+
+    def __init__(
+        self,
+        *,
+        job_arn: str,
+        waiter_delay: int = 60,
+        waiter_max_attempts: int = 1440,
+        aws_conn_id: str | None = None,
+    ) -> None:
+        super().__init__(
+            serialized_fields={"job_arn": job_arn},
+            waiter_name="batch_inference_complete",
+            waiter_args={"jobIdentifier": job_arn},
+            failure_message="Bedrock batch inference job failed.",
+            status_message="Status of Bedrock batch inference job is",
+            status_queries=["status"],
+            return_key="job_arn",
+            return_value=job_arn,
+            waiter_delay=waiter_delay,
+            waiter_max_attempts=waiter_max_attempts,
+            aws_conn_id=aws_conn_id,
+        )
 
     def hook(self) -> AwsGenericHook:
         return BedrockHook(aws_conn_id=self.aws_conn_id)
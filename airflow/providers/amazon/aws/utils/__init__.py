@@ -20,7 +20,6 @@ import logging
 import re
 from datetime import datetime, timezone
 from enum import Enum
-from importlib import metadata
 from typing import Any
 
 from airflow.exceptions import AirflowException
@@ -29,13 +28,11 @@ from airflow.version import version
 
 log = logging.getLogger(__name__)
 
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
 
-def trim_none_values(obj: dict):
-    from packaging.version import Version
-
-    from airflow.version import version
 
-    if Version(version) < Version("2.7"):
+def trim_none_values(obj: dict):
+    if AIRFLOW_VERSION < (2, 7):
         # before version 2.7, the behavior is not the same.
         # Empty dict and lists are removed from the given dict.
         return {key: val for key, val in obj.items() if val is not None}
@@ -48,6 +45,19 @@ def trim_none_values(obj: dict):
         return prune_dict(obj)
 
 
+def trim_none_values_inplace(obj: dict) -> dict:
+    """
+    Remove the top-level ``None`` values from the given dict in place and return it.
+
+    Unlike :func:`trim_none_values` this does not copy the dict nor recurse into nested values,
+    so it should only be used on flat dicts owned by the caller.
+    """
+    none_keys = [key for key, val in obj.items() if val is None]
+    for key in none_keys:
+        del obj[key]
+    return obj
+
+
 def datetime_to_epoch(date_time: datetime) -> int:
     """Convert a datetime object to an epoch integer (seconds)."""
     return int(date_time.timestamp())
@@ -68,15 +78,24 @@ def datetime_to_epoch_us(date_time: datetime) -> int:
     return int(date_time.timestamp() * 1_000_000)
 
 
-def get_airflow_version() -> tuple[int, ...]:
-    match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
+def _parse_airflow_version() -> tuple[int, ...]:
+    match = _VERSION_RE.match(version)
     if match is None:  # Not theoratically possible.
         raise RuntimeError(f"Broken Airflow version: {version}")
     return tuple(int(x) for x in match.groups())
 
 
+AIRFLOW_VERSION: tuple[int, ...] = _parse_airflow_version()
+
+
+def get_airflow_version() -> tuple[int, ...]:
+    return AIRFLOW_VERSION
+
+
 def get_botocore_version() -> tuple[int, ...]:
     """Return the version number of the installed botocore package in the form of a tuple[int,...]."""
+    from importlib import metadata
+
     return tuple(map(int, metadata.version("botocore").split(".")[:3]))
 
 
@@ -102,4 +121,6 @@ class _StringCompareEnum(Enum):
         return super().__eq__(other)
 
     def __hash__(self):
-        return super().__hash__()  # Need to set because we redefine __eq__
+        # Need to set because we redefine __eq__. Hash the value rather than the member name, so that
+        # members and the strings they compare equal to also hash equal in dicts and sets.
+        return hash(self.value)
@@ -16,15 +16,62 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import threading
+from time import monotonic
+from typing import Any, Callable, Iterable
+
 from confluent_kafka import Producer
 
+from airflow.exceptions import AirflowException
 from airflow.providers.apache.kafka.hooks.base import KafkaBaseHook
 
+# Producers idle for longer than this many seconds are not reused.
+PRODUCER_CACHE_TTL = 30
+
+_PRODUCER_CACHE: dict[tuple[int, str], tuple[Producer, float]] = {}
+_PRODUCER_CACHE_LOCK = threading.Lock()
+
+
+def _get_producer_cache_key(config: dict[str, Any]) -> tuple[int, str] | None:
+    """
+    Return the key a producer with the given config is cached under, or None if it is not cached.
+
+    Callbacks such as ``error_cb`` are specific to the code which passes them, and they cannot be
+    compared through the serialized config, so producers configured with them are not shared.
+    """
+    if any(callable(value) for value in config.values()):
+        return None
+    try:
+        return os.getpid(), json.dumps(config, sort_keys=True)
+    except TypeError:
+        return None
+
+
+@atexit.register
+def _flush_cached_producers() -> None:
+    with _PRODUCER_CACHE_LOCK:
+        producers = [producer for producer, _ in _PRODUCER_CACHE.values()]
+        _PRODUCER_CACHE.clear()
+    for producer in producers:
+        producer.flush(5)
+
 
 class KafkaProducerHook(KafkaBaseHook):
     """
     A hook for creating a Kafka Producer.
 
+    The producer is created with the connection's config as is. For high-volume producers, consider
+    setting ``linger.ms`` (e.g. ``100``) and ``compression.type`` (e.g. ``snappy``, if the librdkafka
+    build supports it) in the connection extra: fuller, compressed batches are sent at the cost of up to
+    ``linger.ms`` of added latency per message.
+
+    Producers are shared by hooks with identical config in the same process, and reused as long as
+    they were used within the last ``PRODUCER_CACHE_TTL`` seconds. Producers configured with callbacks
+    are not shared. ``close()`` flushes the producer and stops sharing it.
+
     :param kafka_config_id: The connection object to use, defaults to "kafka_default"
     """
 
@@ -32,7 +79,24 @@ class KafkaProducerHook(KafkaBaseHook):
         super().__init__(kafka_config_id=kafka_config_id)
 
     def _get_client(self, config) -> Producer:
-        return Producer(config)
+        key = _get_producer_cache_key(config)
+        if key is None:
+            return Producer(config)
+        now = monotonic()
+        expired = None
+        with _PRODUCER_CACHE_LOCK:
+            cached = _PRODUCER_CACHE.get(key)
+            if cached is not None and now - cached[1] < PRODUCER_CACHE_TTL:
+                producer = cached[0]
+            else:
+                if cached is not None:
+                    expired = cached[0]
+                producer = Producer(config)
+            _PRODUCER_CACHE[key] = (producer, now)
+        if expired is not None:
+            # Deliver whatever the expired producer still has queued before it is dropped.
+            expired.flush()
+        return producer
 
     def get_producer(self) -> Producer:
         """Return a producer object for sending messages to Kafka."""
@@ -40,3 +104,72 @@ class KafkaProducerHook(KafkaBaseHook):
 
         self.log.info("Producer %s", producer)
         return producer
+
+    def send_messages(
+        self,
+        topic: str,
+        records: Iterable[Any],
+        key_fn: Callable[[Any], Any] | None = None,
+        partition: int | None = None,
+        on_delivery: Callable | None = None,
+        flush_timeout: float = -1,
+        queue_full_timeout: float = 60,
+    ) -> int:
+        """
+        Enqueue a batch of messages and flush them to Kafka once.
+
+        Messages are handed to the producer's local queue in a single loop and delivered with a
+        single ``flush()`` at the end, rather than flushing after every message.
+
+        :param topic: The topic to produce to.
+        :param records: The message values to produce.
+        :param key_fn: Optional callable deriving the message key from each value.
+        :param partition: The partition to produce to, defaults to the partitioner's choice.
+        :param on_delivery: Optional delivery report callback applied to every message.
+        :param flush_timeout: Maximum time in seconds to wait for delivery, defaults to -1 (infinite).
+        :param queue_full_timeout: Maximum time in seconds to wait for room in the producer's local queue
+            when it is full, defaults to 60. If the queue is still full after that, the messages enqueued
+            so far are flushed and an AirflowException is raised.
+        :return: The number of messages still in the producer queue after flushing.
+        """
+        producer = self.get_producer()
+        produce_kwargs: dict[str, Any] = {}
+        if partition is not None:
+            produce_kwargs["partition"] = partition
+        if on_delivery is not None:
+            produce_kwargs["on_delivery"] = on_delivery
+
+        enqueued = 0
+        for value in records:
+            key = key_fn(value) if key_fn else None
+            deadline = None
+            while True:
+                try:
+                    producer.produce(topic, value=value, key=key, **produce_kwargs)
+                    break
+                except BufferError:
+                    # The local queue is full: serve delivery reports to drain it, then retry.
+                    if deadline is None:
+                        deadline = monotonic() + queue_full_timeout
+                    elif monotonic() >= deadline:
+                        producer.flush(flush_timeout)
+                        raise AirflowException(
+                            f"The producer queue stayed full for {queue_full_timeout} seconds, "
+                            f"only {enqueued} messages were sent to topic {topic}."
+                        )
+                    producer.poll(1)
+            enqueued += 1
+            producer.poll(0)
+
+        return producer.flush(flush_timeout)
+
+    def close(self, timeout: float = -1) -> None:
+        """Flush outstanding messages and drop the producer, so that no other hook is handed it again."""
+        if "get_conn" not in self.__dict__:
+            return
+        producer = self.__dict__.pop("get_conn")
+        with _PRODUCER_CACHE_LOCK:
+            for key, (cached_producer, _) in list(_PRODUCER_CACHE.items()):
+                if cached_producer is producer:
+                    del _PRODUCER_CACHE[key]
+        producer.flush(timeout)
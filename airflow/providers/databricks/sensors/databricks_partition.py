@@ -20,12 +20,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from databricks.sql.utils import ParamEscaper
 
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException, AirflowSkipException
 from airflow.providers.common.sql.hooks.sql import fetch_all_handler
 from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
@@ -61,6 +62,8 @@ class DatabricksPartitionSensor(BaseSensorOperator):
     :param partition_operator: Optional comparison operator for partitions, such as >=.
     :param handler: Handler for DbApiHook.run() to return results, defaults to fetch_all_handler
     :param client_parameters: Additional parameters internal to Databricks SQL connector parameters.
+    :param deferrable: If True, the sensor checks the partitions once and then defers to the triggerer,
+        freeing the worker slot until the partitions exist, defaults to the ``default_deferrable`` setting.
     """
 
     template_fields: Sequence[str] = (
@@ -90,6 +93,7 @@ class DatabricksPartitionSensor(BaseSensorOperator):
         partition_operator: str = "=",
         handler: Callable[[Any], Any] = fetch_all_handler,
         client_parameters: dict[str, Any] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         **kwargs,
     ) -> None:
         self.databricks_conn_id = databricks_conn_id
@@ -106,15 +110,31 @@ class DatabricksPartitionSensor(BaseSensorOperator):
         self.client_parameters = client_parameters or {}
         self.hook_params = kwargs.pop("hook_params", {})
         self.handler = handler
+        self.deferrable = deferrable
         self.escaper = ParamEscaper()
+        self._partition_sql: str | None = None
+        self._partition_parameters: dict[str, Any] = {}
+        self._partition_columns: dict[str, frozenset[str]] = {}
         super().__init__(**kwargs)
 
-    def _sql_sensor(self, sql):
-        """Execute the supplied SQL statement using the hook object."""
+    def _sql_sensor(
+        self,
+        sql,
+        parameters: dict[str, Any] | None = None,
+        handler: Callable[[Any], Any] | None = None,
+    ):
+        """
+        Execute the supplied SQL statement using the hook object.
+
+        :param handler: The handler to fetch the results with. The sensor needs the rows of the partition
+            and table detail queries, so they always pass one. Other queries use ``self.handler`` when
+            ``do_xcom_push`` is set.
+        """
         hook = self._get_hook
         sql_result = hook.run(
             sql,
-            handler=self.handler if self.do_xcom_push else None,
+            parameters=parameters or None,
+            handler=handler or (self.handler if self.do_xcom_push else None),
         )
         self.log.debug("SQL result: %s", sql_result)
         return sql_result
@@ -135,26 +155,39 @@ class DatabricksPartitionSensor(BaseSensorOperator):
             **self.hook_params,
         )
 
+    @cached_property
+    def _fully_qualified_table_name(self) -> str:
+        if self.table_name.partition(".")[0] == "delta":
+            table_name = self.table_name
+        else:
+            table_name = f"{self.catalog}.{self.schema}.{self.table_name}"
+        self.log.debug("Table name generated from arguments: %s", table_name)
+        return table_name
+
     def _check_table_partitions(self) -> list:
         """Generate the fully qualified table name, generate partition, and call the _sql_sensor method."""
-        if self.table_name.split(".")[0] == "delta":
-            _fully_qualified_table_name = self.table_name
-        else:
-            _fully_qualified_table_name = f"{self.catalog}.{self.schema}.{self.table_name}"
-        self.log.debug("Table name generated from arguments: %s", _fully_qualified_table_name)
-        _joiner_val = " AND "
-        _prefix = f"SELECT 1 FROM {_fully_qualified_table_name} WHERE"
-        _suffix = " LIMIT 1"
-
-        partition_sql = self._generate_partition_query(
-            prefix=_prefix,
-            suffix=_suffix,
-            joiner_val=_joiner_val,
-            opts=self.partitions,
-            table_name=_fully_qualified_table_name,
-            escape_key=False,
-        )
-        return self._sql_sensor(partition_sql)
+        # The partition query only depends on rendered template fields, so it is built once and
+        # reused by every subsequent poke of this task instance.
+        if self._partition_sql is None:
+            parameters: dict[str, Any] = {}
+            self._partition_sql = self._generate_partition_query(
+                prefix=f"SELECT 1 FROM {self._fully_qualified_table_name} WHERE",
+                suffix=" LIMIT 1",
+                joiner_val=" AND ",
+                opts=self.partitions,
+                table_name=self._fully_qualified_table_name,
+                escape_key=False,
+                parameters=parameters,
+            )
+            self._partition_parameters = parameters
+        return self._sql_sensor(self._partition_sql, self._partition_parameters, handler=fetch_all_handler)
+
+    def _get_partition_columns(self, table_name: str) -> frozenset[str]:
+        """Return the partition columns of the given table, which are fetched once per table."""
+        if table_name not in self._partition_columns:
+            table_detail = self._sql_sensor(f"DESCRIBE DETAIL {table_name}", handler=fetch_all_handler)
+            self._partition_columns[table_name] = frozenset(table_detail[0][7])
+        return self._partition_columns[table_name]
 
     def _generate_partition_query(
         self,
@@ -164,6 +197,7 @@ class DatabricksPartitionSensor(BaseSensorOperator):
         table_name: str,
         opts: dict[str, str] | None = None,
         escape_key: bool = False,
+        parameters: dict[str, Any] | None = None,
     ) -> str:
         """
         Query the table for available partitions.
@@ -178,9 +212,14 @@ class DatabricksPartitionSensor(BaseSensorOperator):
         Once the filter predicates have been generated like above, the query
         is prepared to be executed using the prefix and suffix supplied, which are:
         "SELECT 1 FROM {_fully_qualified_table_name} WHERE" and "LIMIT 1".
+
+        If a ``parameters`` dict is given, partition values are not formatted into the query by the sensor:
+        they are referenced as ``%(name)s`` markers and added to the dict, to be passed along with the query
+        so that the Databricks SQL connector escapes them. Depending on the connector version, it may still
+        inline the escaped values into the query text before sending it.
         """
-        partition_columns = self._sql_sensor(f"DESCRIBE DETAIL {table_name}")[0][7]
-        self.log.debug("Partition columns: %s", partition_columns)
+        partition_columns = self._get_partition_columns(table_name)
+        self.log.debug("Partition columns: %s", sorted(partition_columns))
         if len(partition_columns) < 1:
             # TODO: remove this if block when min_airflow_version is set to higher than 2.7.1
             message = f"Table {table_name} does not have partitions"
@@ -195,20 +234,38 @@ class DatabricksPartitionSensor(BaseSensorOperator):
                 if escape_key:
                     partition_col = self.escaper.escape_item(partition_col)
                 if partition_col in partition_columns:
+                    if isinstance(partition_value, bool):
+                        # bool is a subclass of int, so it must be matched before the numeric types.
+                        value = str(partition_value).lower()
+                    elif isinstance(partition_value, (list, int, float, complex, str, datetime)):
+                        if parameters is not None:
+                            parameter_name = f"partition_{len(parameters)}"
+                            parameters[parameter_name] = partition_value
+                            value = f"%({parameter_name})s"
+                        elif isinstance(partition_value, list):
+                            value = str(tuple(partition_value))
+                        else:
+                            value = self.escaper.escape_item(partition_value)
+                    else:
+                        # TODO: remove this if block when min_airflow_version is set to higher than 2.7.1
+                        message = (
+                            f"Unsupported type {type(partition_value).__name__} "
+                            f"for the value of partition {partition_col}"
+                        )
+                        if self.soft_fail:
+                            raise AirflowSkipException(message)
+                        raise AirflowException(message)
+
                     if isinstance(partition_value, list):
-                        output_list.append(f"""{partition_col} in {tuple(partition_value)}""")
+                        output_list.append(f"""{partition_col} in {value}""")
                         self.log.debug("List formatting for partitions: %s", output_list)
-                    if isinstance(partition_value, (int, float, complex)):
-                        output_list.append(
-                            f"""{partition_col}{self.partition_operator}{self.escaper.escape_item(partition_value)}"""
-                        )
-                    if isinstance(partition_value, (str, datetime)):
-                        output_list.append(
-                            f"""{partition_col}{self.partition_operator}{self.escaper.escape_item(partition_value)}"""
-                        )
+                    else:
+                        output_list.append(f"""{partition_col}{self.partition_operator}{value}""")
                 else:
                     # TODO: remove this if block when min_airflow_version is set to higher than 2.7.1
-                    message = f"Column {partition_col} not part of table partitions: {partition_columns}"
+                    message = (
+                        f"Column {partition_col} not part of table partitions: {sorted(partition_columns)}"
+                    )
                     if self.soft_fail:
                         raise AirflowSkipException(message)
                     raise AirflowException(message)
@@ -236,3 +293,41 @@ class DatabricksPartitionSensor(BaseSensorOperator):
             if self.soft_fail:
                 raise AirflowSkipException(message)
             raise AirflowException(message)
+
+    def execute(self, context: Context) -> Any:
+        if not self.deferrable:
+            return super().execute(context)
+
+        if self._check_table_partitions():
+            return None
+
+        from airflow.providers.databricks.triggers.databricks import DatabricksPartitionTrigger
+
+        self.defer(
+            timeout=timedelta(seconds=self.timeout),
+            trigger=DatabricksPartitionTrigger(
+                sql=self._partition_sql,
+                parameters=self._partition_parameters,
+                databricks_conn_id=self.databricks_conn_id,
+                http_path=self._http_path,
+                sql_warehouse_name=self._sql_warehouse_name,
+                session_configuration=self.session_config,
+                http_headers=self.http_headers,
+                catalog=self.catalog,
+                schema=self.schema,
+                client_parameters={**self.client_parameters, **self.hook_params},
+                polling_period_seconds=self.poke_interval,
+                caller=self.caller,
+            ),
+            method_name="execute_complete",
+        )
+
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> None:
+        """Execute when the trigger fires - returns immediately if the partitions were found."""
+        if event and event.get("status") == "success":
+            self.log.info("Specified partition(s): %s were found.", self.partitions)
+            return
+        message = f"Error while checking partition(s) {self.partitions}: {event}"
+        if self.soft_fail:
+            raise AirflowSkipException(message)
+        raise AirflowException(message)
@@ -119,3 +119,104 @@ class DatabricksExecutionTrigger(BaseTrigger):
                     }
                 )
                 return
+
+
+class DatabricksPartitionTrigger(BaseTrigger):
+    """
+    The trigger polls a Databricks SQL partition query until it returns at least one row.
+
+    The Databricks SQL connector is synchronous, so each query runs in the triggerer's default
+    executor to keep the event loop free.
+
+    :param sql: The partition query to run.
+    :param parameters: The parameters to render the partition query with.
+    :param databricks_conn_id: Reference to the :ref:`Databricks connection <howto/connection:databricks>`.
+    :param http_path: Optional HTTP path of the Databricks SQL warehouse or All Purpose cluster.
+    :param sql_warehouse_name: Optional name of the Databricks SQL warehouse.
+    :param session_configuration: An optional dictionary of Spark session parameters.
+    :param http_headers: An optional list of (k, v) pairs set as HTTP headers on every request.
+    :param catalog: An optional initial catalog to use.
+    :param schema: An optional initial schema to use.
+    :param client_parameters: Additional parameters internal to Databricks SQL connector parameters.
+    :param polling_period_seconds: Controls the rate of the poll for the partitions.
+        By default, the trigger will poll every 60 seconds.
+    """
+
+    def __init__(
+        self,
+        sql: str,
+        databricks_conn_id: str,
+        parameters: dict[str, Any] | None = None,
+        http_path: str | None = None,
+        sql_warehouse_name: str | None = None,
+        session_configuration: dict[str, str] | None = None,
+        http_headers: list[tuple[str, str]] | None = None,
+        catalog: str | None = None,
+        schema: str | None = None,
+        client_parameters: dict[str, Any] | None = None,
+        polling_period_seconds: float = 60,
+        caller: str = "DatabricksPartitionTrigger",
+    ) -> None:
+        super().__init__()
+        self.sql = sql
+        self.databricks_conn_id = databricks_conn_id
+        self.parameters = parameters
+        self.http_path = http_path
+        self.sql_warehouse_name = sql_warehouse_name
+        self.session_configuration = session_configuration
+        self.http_headers = http_headers
+        self.catalog = catalog
+        self.schema = schema
+        self.client_parameters = client_parameters or {}
+        self.polling_period_seconds = polling_period_seconds
+        self.caller = caller
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            "airflow.providers.databricks.triggers.databricks.DatabricksPartitionTrigger",
+            {
+                "sql": self.sql,
+                "databricks_conn_id": self.databricks_conn_id,
+                "parameters": self.parameters,
+                "http_path": self.http_path,
+                "sql_warehouse_name": self.sql_warehouse_name,
+                "session_configuration": self.session_configuration,
+                "http_headers": self.http_headers,
+                "catalog": self.catalog,
+                "schema": self.schema,
+                "client_parameters": self.client_parameters,
+                "polling_period_seconds": self.polling_period_seconds,
+                "caller": self.caller,
+            },
+        )
+
+    def _check_partitions(self) -> bool:
+        from airflow.providers.common.sql.hooks.sql import fetch_all_handler
+        from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
+
+        hook = DatabricksSqlHook(
+            self.databricks_conn_id,
+            self.http_path,
+            self.sql_warehouse_name,
+            self.session_configuration,
+            self.http_headers,
+            self.catalog,
+            self.schema,
+            self.caller,
+            **self.client_parameters,
+        )
+        return bool(hook.run(self.sql, parameters=self.parameters or None, handler=fetch_all_handler))
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                found = await loop.run_in_executor(None, self._check_partitions)
+            except Exception as e:
+                yield TriggerEvent({"status": "error", "message": str(e)})
+                return
+            if found:
+                yield TriggerEvent({"status": "success"})
+                return
+            self.log.info("Partitions not found yet, sleeping for %s seconds", self.polling_period_seconds)
+            await asyncio.sleep(self.polling_period_seconds)
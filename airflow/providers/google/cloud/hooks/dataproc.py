@@ -1213,51 +1213,41 @@ class DataprocAsyncHook(GoogleBaseHook):
                 " of Google Provider. You MUST convert it to `impersonate_chain`"
             )
         super().__init__(gcp_conn_id=gcp_conn_id, impersonation_chain=impersonation_chain)
-        self._cached_client: JobControllerAsyncClient | None = None
+        self._cached_clients: dict[tuple[type, str | None], Any] = {}
+
+    def _get_client(self, client_class: type, region: str | None) -> Any:
+        """
+        Return a client of the given class for the region, which is created once per hook instance.
+
+        Reusing the client keeps its channel open, so triggers polling through the same hook do not
+        set up a new connection and fetch credentials again on every call.
+        """
+        key = (client_class, region)
+        if key not in self._cached_clients:
+            client_options = None
+            if region and region != "global":
+                client_options = ClientOptions(api_endpoint=f"{region}-dataproc.googleapis.com:443")
+
+            self._cached_clients[key] = client_class(
+                credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
+            )
+        return self._cached_clients[key]
 
     def get_cluster_client(self, region: str | None = None) -> ClusterControllerAsyncClient:
         """Create a ClusterControllerAsyncClient."""
-        client_options = None
-        if region and region != "global":
-            client_options = ClientOptions(api_endpoint=f"{region}-dataproc.googleapis.com:443")
-
-        return ClusterControllerAsyncClient(
-            credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
-        )
+        return self._get_client(ClusterControllerAsyncClient, region)
 
     def get_template_client(self, region: str | None = None) -> WorkflowTemplateServiceAsyncClient:
         """Create a WorkflowTemplateServiceAsyncClient."""
-        client_options = None
-        if region and region != "global":
-            client_options = ClientOptions(api_endpoint=f"{region}-dataproc.googleapis.com:443")
-
-        return WorkflowTemplateServiceAsyncClient(
-            credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
-        )
+        return self._get_client(WorkflowTemplateServiceAsyncClient, region)
 
     def get_job_client(self, region: str | None = None) -> JobControllerAsyncClient:
         """Create a JobControllerAsyncClient."""
-        if self._cached_client is None:
-            client_options = None
-            if region and region != "global":
-                client_options = ClientOptions(api_endpoint=f"{region}-dataproc.googleapis.com:443")
-
-            self._cached_client = JobControllerAsyncClient(
-                credentials=self.get_credentials(),
-                client_info=CLIENT_INFO,
-                client_options=client_options,
-            )
-        return self._cached_client
+        return self._get_client(JobControllerAsyncClient, region)
 
     def get_batch_client(self, region: str | None = None) -> BatchControllerAsyncClient:
         """Create a BatchControllerAsyncClient."""
-        client_options = None
-        if region and region != "global":
-            client_options = ClientOptions(api_endpoint=f"{region}-dataproc.googleapis.com:443")
-
-        return BatchControllerAsyncClient(
-            credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
-        )
+        return self._get_client(BatchControllerAsyncClient, region)
 
     def get_operations_client(self, region: str) -> OperationsClient:
         """Create a OperationsClient."""
@@ -19,11 +19,13 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any, Sequence
 
 from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import MethodNotImplemented
 from google.api_core.gapic_v1.method import DEFAULT, _MethodDefault
-from google.cloud.metastore_v1 import DataprocMetastoreClient
+from google.api_core.retry import exponential_sleep_generator
 
 from airflow.exceptions import AirflowException
 from airflow.providers.google.common.consts import CLIENT_INFO
@@ -32,11 +34,18 @@ from airflow.providers.google.common.hooks.base_google import GoogleBaseHook
 if TYPE_CHECKING:
     from google.api_core.operation import Operation
     from google.api_core.retry import Retry
+    from google.cloud.metastore_v1 import DataprocMetastoreAsyncClient, DataprocMetastoreClient
     from google.cloud.metastore_v1.types import Backup, MetadataImport, Service
     from google.cloud.metastore_v1.types.metastore import DatabaseDumpSpec, Restore
+    from google.longrunning import operations_pb2
     from google.protobuf.field_mask_pb2 import FieldMask
 
 
+# How long, in seconds, the server may hold a WaitOperation request, so that the wait timeout is still
+# checked regularly.
+WAIT_OPERATION_TIMEOUT = 15
+
+
 class DataprocMetastoreHook(GoogleBaseHook):
     """Hook for Google Cloud Dataproc Metastore APIs."""
 
@@ -47,14 +56,18 @@ class DataprocMetastoreHook(GoogleBaseHook):
                 " of Google Provider. You MUST convert it to `impersonate_chain`"
             )
         super().__init__(**kwargs)
+        self._cached_client: DataprocMetastoreClient | None = None
 
     def get_dataproc_metastore_client(self) -> DataprocMetastoreClient:
-        """Return DataprocMetastoreClient."""
-        client_options = ClientOptions(api_endpoint="metastore.googleapis.com:443")
+        """Return DataprocMetastoreClient, which is created once per hook instance."""
+        if self._cached_client is None:
+            from google.cloud.metastore_v1 import DataprocMetastoreClient
 
-        return DataprocMetastoreClient(
-            credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
-        )
+            client_options = ClientOptions(api_endpoint="metastore.googleapis.com:443")
+            self._cached_client = DataprocMetastoreClient(
+                credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
+            )
+        return self._cached_client
 
     def get_dataproc_metastore_client_v1beta(self):
         """Return DataprocMetastoreClient (from v1 beta)."""
@@ -73,6 +86,66 @@ class DataprocMetastoreHook(GoogleBaseHook):
             error = operation.exception(timeout=timeout)
             raise AirflowException(error)
 
+    def wait_for_operation_response(self, timeout: float | None, operation: Operation) -> bytes:
+        """
+        Wait for long-lasting operation to complete and return its serialized response.
+
+        Unlike :meth:`wait_for_operation`, the response is not parsed by the SDK, which fails for some
+        of the metastore operations, e.g. exporting metadata.
+
+        :param timeout: The maximum time to wait for the operation, in seconds.
+        :param operation: The long-running operation to wait for.
+        """
+        latest = self._poll_until_done(timeout, operation)
+        if latest.error.code:
+            raise AirflowException(latest.error.message)
+        return latest.response.value
+
+    def _poll_until_done(self, timeout: float | None, operation: Operation) -> operations_pb2.Operation:
+        """
+        Block until the operation is done and return its latest state.
+
+        The server is asked to hold each request with ``WaitOperation`` until the operation changes. Its
+        response carries the ``done``, ``error`` and ``response`` fields of the operation, so completion is
+        noticed immediately without another request. If the server answers early with the operation still
+        running, wait with exponential backoff before asking again. If the API does not implement it, poll
+        ``operation.done()`` with exponential backoff instead.
+        """
+        from google.protobuf.duration_pb2 import Duration
+
+        client = self.get_dataproc_metastore_client()
+        use_wait_operation = hasattr(client, "wait_operation")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        latest = operation.operation
+        for time_to_wait in exponential_sleep_generator(initial=1, maximum=60):
+            if latest.done:
+                return latest
+            if deadline is not None:
+                time_to_wait = min(time_to_wait, deadline - time.monotonic())
+                if time_to_wait <= 0:
+                    raise AirflowException(f"Timed out waiting for operation {latest.name}")
+            if use_wait_operation:
+                wait_seconds = WAIT_OPERATION_TIMEOUT
+                if deadline is not None:
+                    wait_seconds = max(1, min(wait_seconds, int(deadline - time.monotonic())))
+                started = time.monotonic()
+                try:
+                    latest = client.wait_operation(
+                        request={"name": latest.name, "timeout": Duration(seconds=wait_seconds)}
+                    )
+                except MethodNotImplemented:
+                    use_wait_operation = False
+                else:
+                    # WaitOperation is best-effort: the server may answer before the operation changed,
+                    # so back off instead of sending the next request right away.
+                    if not latest.done and time.monotonic() - started < wait_seconds:
+                        time.sleep(time_to_wait)
+                    continue
+            time.sleep(time_to_wait)
+            operation.done()
+            latest = operation.operation
+        return latest
+
     @GoogleBaseHook.fallback_to_default_project_id
     def create_backup(
         self,
@@ -696,3 +769,46 @@ class DataprocMetastoreHook(GoogleBaseHook):
             }
         )
         return result
+
+
+class DataprocMetastoreAsyncHook(GoogleBaseHook):
+    """Asynchronous hook for Google Cloud Dataproc Metastore APIs."""
+
+    def __init__(
+        self,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: str | Sequence[str] | None = None,
+        **kwargs,
+    ) -> None:
+        if kwargs.get("delegate_to") is not None:
+            raise RuntimeError(
+                "The `delegate_to` parameter has been deprecated before and finally removed in this version"
+                " of Google Provider. You MUST convert it to `impersonate_chain`"
+            )
+        super().__init__(gcp_conn_id=gcp_conn_id, impersonation_chain=impersonation_chain)
+        self._client: DataprocMetastoreAsyncClient | None = None
+
+    def get_dataproc_metastore_client(self) -> DataprocMetastoreAsyncClient:
+        """
+        Return DataprocMetastoreAsyncClient, which is created once per hook instance.
+
+        Reusing the client keeps its channel open, so triggers polling through the same hook do not
+        set up a new connection and fetch credentials again on every call.
+        """
+        if self._client is None:
+            from google.cloud.metastore_v1 import DataprocMetastoreAsyncClient
+
+            client_options = ClientOptions(api_endpoint="metastore.googleapis.com:443")
+            self._client = DataprocMetastoreAsyncClient(
+                credentials=self.get_credentials(), client_info=CLIENT_INFO, client_options=client_options
+            )
+        return self._client
+
+    async def get_operation(self, operation_name: str) -> operations_pb2.Operation:
+        """
+        Get the latest state of a long-running operation.
+
+        :param operation_name: The full name of the operation resource.
+        """
+        client = self.get_dataproc_metastore_client()
+        return await client.get_operation(request={"name": operation_name})
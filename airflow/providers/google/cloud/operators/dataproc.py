@@ -611,6 +611,12 @@ class DataprocCreateClusterOperator(GoogleCloudBaseOperator):
         account from the list granting this role to the originating account (templated).
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the run status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     """
 
     template_fields: Sequence[str] = (
@@ -645,6 +651,9 @@ class DataprocCreateClusterOperator(GoogleCloudBaseOperator):
         impersonation_chain: str | Sequence[str] | None = None,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         **kwargs,
     ) -> None:
         # TODO: remove one day
@@ -694,6 +703,9 @@ class DataprocCreateClusterOperator(GoogleCloudBaseOperator):
         self.virtual_cluster_config = virtual_cluster_config
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
 
     def _create_cluster(self, hook: DataprocHook):
         return hook.create_cluster(
@@ -819,6 +831,9 @@ class DataprocCreateClusterOperator(GoogleCloudBaseOperator):
                             gcp_conn_id=self.gcp_conn_id,
                             impersonation_chain=self.impersonation_chain,
                             polling_interval_seconds=self.polling_interval_seconds,
+                            backoff_factor=self.polling_backoff_factor,
+                            max_polling_interval_seconds=self.max_polling_interval_seconds,
+                            jitter=self.polling_jitter,
                             delete_on_error=self.delete_on_error,
                         ),
                         method_name="execute_complete",
@@ -1045,6 +1060,12 @@ class DataprocDeleteClusterOperator(GoogleCloudBaseOperator):
         account from the list granting this role to the originating account (templated).
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the cluster status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     """
 
     template_fields: Sequence[str] = ("project_id", "region", "cluster_name", "impersonation_chain")
@@ -1064,6 +1085,9 @@ class DataprocDeleteClusterOperator(GoogleCloudBaseOperator):
         impersonation_chain: str | Sequence[str] | None = None,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -1081,6 +1105,9 @@ class DataprocDeleteClusterOperator(GoogleCloudBaseOperator):
         self.impersonation_chain = impersonation_chain
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
 
     def execute(self, context: Context) -> None:
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -1110,6 +1137,10 @@ class DataprocDeleteClusterOperator(GoogleCloudBaseOperator):
                     metadata=self.metadata,
                     impersonation_chain=self.impersonation_chain,
                     polling_interval_seconds=self.polling_interval_seconds,
+                    backoff_factor=self.polling_backoff_factor,
+                    max_polling_interval_seconds=self.max_polling_interval_seconds,
+                    jitter=self.polling_jitter,
+                    operation_name=operation.operation.name,
                 ),
                 method_name="execute_complete",
             )
@@ -1366,6 +1397,12 @@ class DataprocJobBaseOperator(GoogleCloudBaseOperator):
     :param deferrable: Run operator in the deferrable mode
     :param polling_interval_seconds: time in seconds between polling for job completion.
         The value is considered only when running in deferrable mode. Must be greater than 0.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
 
     :var dataproc_job_id: The actual "jobId" as submitted to the Dataproc API.
         This is useful for identifying or linking to the job in the Google Cloud Console
@@ -1394,6 +1431,9 @@ class DataprocJobBaseOperator(GoogleCloudBaseOperator):
         asynchronous: bool = False,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -1417,6 +1457,9 @@ class DataprocJobBaseOperator(GoogleCloudBaseOperator):
         self.asynchronous = asynchronous
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
 
     def create_job_template(self) -> DataProcJobBuilder:
         """Initialize `self.job_template` with default values."""
@@ -1470,6 +1513,9 @@ class DataprocJobBaseOperator(GoogleCloudBaseOperator):
                         gcp_conn_id=self.gcp_conn_id,
                         impersonation_chain=self.impersonation_chain,
                         polling_interval_seconds=self.polling_interval_seconds,
+                        backoff_factor=self.polling_backoff_factor,
+                        max_polling_interval_seconds=self.max_polling_interval_seconds,
+                        jitter=self.polling_jitter,
                     ),
                     method_name="execute_complete",
                 )
@@ -2239,6 +2285,12 @@ class DataprocInstantiateWorkflowTemplateOperator(GoogleCloudBaseOperator):
         account from the list granting this role to the originating account (templated).
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the run status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     :param cancel_on_kill: Flag which indicates whether cancel the workflow, when on_kill is called
     """
 
@@ -2262,6 +2314,9 @@ class DataprocInstantiateWorkflowTemplateOperator(GoogleCloudBaseOperator):
         impersonation_chain: str | Sequence[str] | None = None,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
@@ -2281,6 +2336,9 @@ class DataprocInstantiateWorkflowTemplateOperator(GoogleCloudBaseOperator):
         self.impersonation_chain = impersonation_chain
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
         self.cancel_on_kill = cancel_on_kill
         self.operation_name: str | None = None
 
@@ -2323,6 +2381,9 @@ class DataprocInstantiateWorkflowTemplateOperator(GoogleCloudBaseOperator):
                     gcp_conn_id=self.gcp_conn_id,
                     impersonation_chain=self.impersonation_chain,
                     polling_interval_seconds=self.polling_interval_seconds,
+                    backoff_factor=self.polling_backoff_factor,
+                    max_polling_interval_seconds=self.max_polling_interval_seconds,
+                    jitter=self.polling_jitter,
                 ),
                 method_name="execute_complete",
             )
@@ -2388,6 +2449,12 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(GoogleCloudBaseOperator)
         account from the list granting this role to the originating account (templated).
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the run status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     :param cancel_on_kill: Flag which indicates whether cancel the workflow, when on_kill is called
     """
 
@@ -2409,6 +2476,9 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(GoogleCloudBaseOperator)
         impersonation_chain: str | Sequence[str] | None = None,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
@@ -2427,6 +2497,9 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(GoogleCloudBaseOperator)
         self.impersonation_chain = impersonation_chain
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
         self.cancel_on_kill = cancel_on_kill
         self.operation_name: str | None = None
 
@@ -2467,6 +2540,9 @@ class DataprocInstantiateInlineWorkflowTemplateOperator(GoogleCloudBaseOperator)
                     gcp_conn_id=self.gcp_conn_id,
                     impersonation_chain=self.impersonation_chain,
                     polling_interval_seconds=self.polling_interval_seconds,
+                    backoff_factor=self.polling_backoff_factor,
+                    max_polling_interval_seconds=self.max_polling_interval_seconds,
+                    jitter=self.polling_jitter,
                 ),
                 method_name="execute_complete",
             )
@@ -2525,6 +2601,12 @@ class DataprocSubmitJobOperator(GoogleCloudBaseOperator):
     :param deferrable: Run operator in the deferrable mode
     :param polling_interval_seconds: time in seconds between polling for job completion.
         The value is considered only when running in deferrable mode. Must be greater than 0.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     :param cancel_on_kill: Flag which indicates whether cancel the hook's job or not, when on_kill is called
     :param wait_timeout: How many seconds wait for job to be ready. Used only if ``asynchronous`` is False
     """
@@ -2549,6 +2631,9 @@ class DataprocSubmitJobOperator(GoogleCloudBaseOperator):
         asynchronous: bool = False,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         cancel_on_kill: bool = True,
         wait_timeout: int | None = None,
         **kwargs,
@@ -2568,6 +2653,9 @@ class DataprocSubmitJobOperator(GoogleCloudBaseOperator):
         self.asynchronous = asynchronous
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
         self.cancel_on_kill = cancel_on_kill
         self.hook: DataprocHook | None = None
         self.job_id: str | None = None
@@ -2616,6 +2704,9 @@ class DataprocSubmitJobOperator(GoogleCloudBaseOperator):
                     gcp_conn_id=self.gcp_conn_id,
                     impersonation_chain=self.impersonation_chain,
                     polling_interval_seconds=self.polling_interval_seconds,
+                    backoff_factor=self.polling_backoff_factor,
+                    max_polling_interval_seconds=self.max_polling_interval_seconds,
+                    jitter=self.polling_jitter,
                     cancel_on_kill=self.cancel_on_kill,
                 ),
                 method_name="execute_complete",
@@ -2690,6 +2781,12 @@ class DataprocUpdateClusterOperator(GoogleCloudBaseOperator):
         account from the list granting this role to the originating account (templated).
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the run status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     """
 
     template_fields: Sequence[str] = (
@@ -2719,6 +2816,9 @@ class DataprocUpdateClusterOperator(GoogleCloudBaseOperator):
         impersonation_chain: str | Sequence[str] | None = None,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -2738,6 +2838,9 @@ class DataprocUpdateClusterOperator(GoogleCloudBaseOperator):
         self.impersonation_chain = impersonation_chain
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
 
     def execute(self, context: Context):
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -2780,6 +2883,9 @@ class DataprocUpdateClusterOperator(GoogleCloudBaseOperator):
                         gcp_conn_id=self.gcp_conn_id,
                         impersonation_chain=self.impersonation_chain,
                         polling_interval_seconds=self.polling_interval_seconds,
+                        backoff_factor=self.polling_backoff_factor,
+                        max_polling_interval_seconds=self.max_polling_interval_seconds,
+                        jitter=self.polling_jitter,
                     ),
                     method_name="execute_complete",
                 )
@@ -2828,6 +2934,12 @@ class DataprocDiagnoseClusterOperator(GoogleCloudBaseOperator):
         account from the list granting this role to the originating account (templated).
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the cluster status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     """
 
     template_fields: Sequence[str] = (
@@ -2858,6 +2970,9 @@ class DataprocDiagnoseClusterOperator(GoogleCloudBaseOperator):
         impersonation_chain: str | Sequence[str] | None = None,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 10,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -2877,6 +2992,9 @@ class DataprocDiagnoseClusterOperator(GoogleCloudBaseOperator):
         self.impersonation_chain = impersonation_chain
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
 
     def execute(self, context: Context):
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -2913,6 +3031,9 @@ class DataprocDiagnoseClusterOperator(GoogleCloudBaseOperator):
                     gcp_conn_id=self.gcp_conn_id,
                     impersonation_chain=self.impersonation_chain,
                     polling_interval_seconds=self.polling_interval_seconds,
+                    backoff_factor=self.polling_backoff_factor,
+                    max_polling_interval_seconds=self.max_polling_interval_seconds,
+                    jitter=self.polling_jitter,
                 ),
                 method_name="execute_complete",
             )
@@ -2971,6 +3092,12 @@ class DataprocCreateBatchOperator(GoogleCloudBaseOperator):
         waiting on them asynchronously using the DataprocBatchSensor
     :param deferrable: Run operator in the deferrable mode.
     :param polling_interval_seconds: Time (seconds) to wait between calls to check the run status.
+    :param polling_backoff_factor: Factor by which the time between two status checks grows while the
+        status stays the same in the deferrable mode. Defaults to 1.0, which keeps the time constant.
+    :param max_polling_interval_seconds: Upper bound (seconds) of the time between two status checks
+        in the deferrable mode, when ``polling_backoff_factor`` is greater than 1.
+    :param polling_jitter: Fraction by which each wait between two status checks is randomized in the
+        deferrable mode, e.g. 0.2 for +/- 20%. Defaults to 0, no randomization.
     """
 
     template_fields: Sequence[str] = (
@@ -2999,6 +3126,9 @@ class DataprocCreateBatchOperator(GoogleCloudBaseOperator):
         asynchronous: bool = False,
         deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
         polling_interval_seconds: int = 5,
+        polling_backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        polling_jitter: float = 0.0,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -3019,6 +3149,9 @@ class DataprocCreateBatchOperator(GoogleCloudBaseOperator):
         self.asynchronous = asynchronous
         self.deferrable = deferrable
         self.polling_interval_seconds = polling_interval_seconds
+        self.polling_backoff_factor = polling_backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.polling_jitter = polling_jitter
 
     def execute(self, context: Context):
         hook = DataprocHook(gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain)
@@ -3074,6 +3207,9 @@ class DataprocCreateBatchOperator(GoogleCloudBaseOperator):
                         gcp_conn_id=self.gcp_conn_id,
                         impersonation_chain=self.impersonation_chain,
                         polling_interval_seconds=self.polling_interval_seconds,
+                        backoff_factor=self.polling_backoff_factor,
+                        max_polling_interval_seconds=self.max_polling_interval_seconds,
+                        jitter=self.polling_jitter,
                     ),
                     method_name="execute_complete",
                 )
@@ -3096,6 +3232,9 @@ class DataprocCreateBatchOperator(GoogleCloudBaseOperator):
                         gcp_conn_id=self.gcp_conn_id,
                         impersonation_chain=self.impersonation_chain,
                         polling_interval_seconds=self.polling_interval_seconds,
+                        backoff_factor=self.polling_backoff_factor,
+                        max_polling_interval_seconds=self.max_polling_interval_seconds,
+                        jitter=self.polling_jitter,
                     ),
                     method_name="execute_complete",
                 )
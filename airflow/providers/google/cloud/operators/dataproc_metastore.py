@@ -19,24 +19,29 @@
 
 from __future__ import annotations
 
-import time
-from typing import TYPE_CHECKING, Sequence
+import base64
+import uuid
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Sequence
 
-from google.api_core.exceptions import AlreadyExists
+from google.api_core.exceptions import AlreadyExists, GoogleAPICallError
 from google.api_core.gapic_v1.method import DEFAULT, _MethodDefault
-from google.api_core.retry import Retry, exponential_sleep_generator
-from google.cloud.metastore_v1 import MetadataExport, MetadataManagementActivity
-from google.cloud.metastore_v1.types import Backup, MetadataImport, Service
-from google.cloud.metastore_v1.types.metastore import DatabaseDumpSpec, Restore
+from google.api_core.retry import Retry
 
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator, BaseOperatorLink
 from airflow.models.xcom import XCom
 from airflow.providers.google.cloud.hooks.dataproc_metastore import DataprocMetastoreHook
 from airflow.providers.google.cloud.operators.cloud_base import GoogleCloudBaseOperator
+from airflow.providers.google.cloud.triggers.dataproc_metastore import DataprocMetastoreOperationTrigger
 from airflow.providers.google.common.links.storage import StorageLink
 
 if TYPE_CHECKING:
+    from google.api_core.operation import Operation
+    from google.cloud.metastore_v1 import MetadataExport
+    from google.cloud.metastore_v1.types import Backup, MetadataImport, Service
+    from google.cloud.metastore_v1.types.metastore import DatabaseDumpSpec, Restore
     from google.protobuf.field_mask_pb2 import FieldMask
 
     from airflow.models.taskinstancekey import TaskInstanceKey
@@ -52,6 +57,62 @@ METASTORE_IMPORT_LINK = METASTORE_BASE_LINK + "/imports/{resource}?project={proj
 METASTORE_SERVICE_LINK = METASTORE_BASE_LINK + "/config?project={project_id}"
 
 
+def _persist_extra_links() -> bool:
+    """Return whether the operators push the URLs of their extra links to XCom."""
+    return conf.getboolean("google_dataproc_metastore", "persist_extra_links", fallback=True)
+
+
+def _get_operation_response(event: dict[str, Any] | None) -> bytes:
+    """Check the event sent by DataprocMetastoreOperationTrigger and return the serialized response."""
+    if event is None:
+        raise AirflowException("No event received in trigger callback")
+    if event["status"] == "error":
+        raise AirflowException(event["message"])
+    return base64.b64decode(event["response"])
+
+
+def _get_idempotent_request_id(context: Context, resource_id: str) -> str:
+    """
+    Return a request id which is stable across retries of the same task instance.
+
+    Dataproc Metastore ignores a request whose id matches a request it already completed, returning the
+    original operation instead, so a retried create does not fail with AlreadyExists.
+    """
+    ti = context["ti"]
+    return str(
+        uuid.uuid5(uuid.NAMESPACE_URL, f"{ti.dag_id}/{ti.task_id}/{ti.run_id}/{ti.map_index}/{resource_id}")
+    )
+
+
+class _DataprocMetastoreHookMixin:
+    """
+    Provide a DataprocMetastoreHook which is created once per operator instance.
+
+    Also cancel the long-running operation the operator is waiting for when the task is killed, unless
+    ``cancel_on_kill`` is disabled.
+    """
+
+    gcp_conn_id: str
+    impersonation_chain: str | Sequence[str] | None
+    cancel_on_kill: bool = False
+    _operation: Operation | None = None
+
+    @cached_property
+    def hook(self) -> DataprocMetastoreHook:
+        return DataprocMetastoreHook(
+            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
+        )
+
+    def on_kill(self) -> None:
+        if self._operation is not None and self.cancel_on_kill:
+            try:
+                self._operation.cancel()
+            except GoogleAPICallError:
+                self.log.exception(  # type: ignore[attr-defined]
+                    "Failed to cancel operation %s", self._operation.operation.name
+                )
+
+
 class DataprocMetastoreLink(BaseOperatorLink):
     """Helper class for constructing Dataproc Metastore resource link."""
 
@@ -68,18 +129,20 @@ class DataprocMetastoreLink(BaseOperatorLink):
             | DataprocMetastoreUpdateServiceOperator
             | DataprocMetastoreListBackupsOperator
             | DataprocMetastoreExportMetadataOperator
+            | DataprocMetastoreCreateMetadataImportsOperator
         ),
         url: str,
     ):
+        if not _persist_extra_links():
+            return
         task_instance.xcom_push(
             context=context,
             key=DataprocMetastoreLink.key,
-            value={
-                "region": task_instance.region,
-                "service_id": task_instance.service_id,
-                "project_id": task_instance.project_id,
-                "url": url,
-            },
+            value=url.format(
+                region=task_instance.region,
+                service_id=task_instance.service_id,
+                project_id=task_instance.project_id,
+            ),
         )
 
     def get_link(
@@ -89,25 +152,25 @@ class DataprocMetastoreLink(BaseOperatorLink):
         ti_key: TaskInstanceKey,
     ) -> str:
         conf = XCom.get_value(key=self.key, ti_key=ti_key)
-        return (
-            conf["url"].format(
-                region=conf["region"],
-                service_id=conf["service_id"],
-                project_id=conf["project_id"],
-            )
-            if conf
-            else ""
-        )
+        if isinstance(conf, dict):
+            # Task instances which ran before the link was pushed as a finished URL.
+            return conf["url"].format_map(conf)
+        return conf or ""
 
 
-class DataprocMetastoreDetailedLink(BaseOperatorLink):
-    """Helper class for constructing Dataproc Metastore detailed resource link."""
+class DataprocMetastoreDetailedLink(DataprocMetastoreLink):
+    """
+    Helper class for constructing Dataproc Metastore detailed resource link.
+
+    The link is returned by :meth:`DataprocMetastoreLink.get_link`; it is formatted with the additional
+    ``resource`` field when persisted.
+    """
 
     name = "Dataproc Metastore resource"
     key = "config"
 
     @staticmethod
-    def persist(
+    def persist(  # type: ignore[override]
         context: Context,
         task_instance: (
             DataprocMetastoreCreateBackupOperator | DataprocMetastoreCreateMetadataImportOperator
@@ -115,38 +178,27 @@ class DataprocMetastoreDetailedLink(BaseOperatorLink):
         url: str,
         resource: str,
     ):
+        if not _persist_extra_links():
+            return
         task_instance.xcom_push(
             context=context,
             key=DataprocMetastoreDetailedLink.key,
-            value={
-                "region": task_instance.region,
-                "service_id": task_instance.service_id,
-                "project_id": task_instance.project_id,
-                "url": url,
-                "resource": resource,
-            },
+            value=url.format(
+                region=task_instance.region,
+                service_id=task_instance.service_id,
+                project_id=task_instance.project_id,
+                resource=resource,
+            ),
         )
 
-    def get_link(
-        self,
-        operator: BaseOperator,
-        *,
-        ti_key: TaskInstanceKey,
-    ) -> str:
-        conf = XCom.get_value(key=self.key, ti_key=ti_key)
-        return (
-            conf["url"].format(
-                region=conf["region"],
-                service_id=conf["service_id"],
-                project_id=conf["project_id"],
-                resource=conf["resource"],
-            )
-            if conf
-            else ""
-        )
+
+# The links hold no state, so every operator shares the same instances.
+_METASTORE_LINK = DataprocMetastoreLink()
+_METASTORE_DETAILED_LINK = DataprocMetastoreDetailedLink()
+_STORAGE_LINK = StorageLink()
 
 
-class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreCreateBackupOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Create a new backup in a given project and location.
 
@@ -170,7 +222,8 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
 
         This corresponds to the ``backup_id`` field on the ``request`` instance; if ``request`` is provided,
         this should not be set.
-    :param request_id: Optional. A unique id used to identify the request.
+    :param request_id: Optional. A unique id used to identify the request. If not set, an id derived from
+        the task instance is used, so a retried task picks up the backup operation it already started.
     :param retry: Optional. Designation of what errors, if any, should be retried.
     :param timeout: Optional. The timeout for this request.
     :param metadata: Optional. Strings which should be sent along with the request as metadata.
@@ -183,6 +236,11 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the backup creation operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
@@ -191,7 +249,7 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
         "impersonation_chain",
     )
     template_fields_renderers = {"backup": "json"}
-    operator_extra_links = (DataprocMetastoreDetailedLink(),)
+    operator_extra_links = (_METASTORE_DETAILED_LINK,)
 
     def __init__(
         self,
@@ -207,6 +265,9 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -221,11 +282,14 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context) -> dict:
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        from google.cloud.metastore_v1.types import Backup
+
+        hook = self.hook
         self.log.info("Creating Dataproc Metastore backup: %s", self.backup_id)
 
         try:
@@ -235,11 +299,26 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
                 service_id=self.service_id,
                 backup=self.backup,
                 backup_id=self.backup_id,
-                request_id=self.request_id,
+                request_id=self.request_id or _get_idempotent_request_id(context, self.backup_id),
                 retry=self.retry,
                 timeout=self.timeout,
                 metadata=self.metadata,
             )
+            if self.deferrable:
+                DataprocMetastoreDetailedLink.persist(
+                    context=context, task_instance=self, url=METASTORE_BACKUP_LINK, resource=self.backup_id
+                )
+                self.defer(
+                    trigger=DataprocMetastoreOperationTrigger(
+                        operation_name=operation.operation.name,
+                        gcp_conn_id=self.gcp_conn_id,
+                        impersonation_chain=self.impersonation_chain,
+                        polling_interval_seconds=self.polling_interval_seconds,
+                        timeout=self.timeout,
+                    ),
+                    method_name="execute_complete",
+                )
+            self._operation = operation
             backup = hook.wait_for_operation(self.timeout, operation)
             self.log.info("Backup %s created successfully", self.backup_id)
         except AlreadyExists:
@@ -258,8 +337,16 @@ class DataprocMetastoreCreateBackupOperator(GoogleCloudBaseOperator):
         )
         return Backup.to_dict(backup)
 
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> dict:
+        """Act as a callback for when the trigger fires - returns the created backup."""
+        from google.cloud.metastore_v1.types import Backup
+
+        backup = Backup.deserialize(_get_operation_response(event))
+        self.log.info("Backup %s created successfully", self.backup_id)
+        return Backup.to_dict(backup)
+
 
-class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreCreateMetadataImportOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Create a new MetadataImport in a given project and location.
 
@@ -296,6 +383,11 @@ class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the metadata import operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
@@ -304,7 +396,7 @@ class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
         "impersonation_chain",
     )
     template_fields_renderers = {"metadata_import": "json"}
-    operator_extra_links = (DataprocMetastoreDetailedLink(),)
+    operator_extra_links = (_METASTORE_DETAILED_LINK,)
 
     def __init__(
         self,
@@ -320,6 +412,9 @@ class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -334,11 +429,14 @@ class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context):
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        from google.cloud.metastore_v1.types import MetadataImport
+
+        hook = self.hook
         self.log.info("Creating Dataproc Metastore metadata import: %s", self.metadata_import_id)
         operation = hook.create_metadata_import(
             project_id=self.project_id,
@@ -351,6 +449,24 @@ class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        if self.deferrable:
+            DataprocMetastoreDetailedLink.persist(
+                context=context,
+                task_instance=self,
+                url=METASTORE_IMPORT_LINK,
+                resource=self.metadata_import_id,
+            )
+            self.defer(
+                trigger=DataprocMetastoreOperationTrigger(
+                    operation_name=operation.operation.name,
+                    gcp_conn_id=self.gcp_conn_id,
+                    impersonation_chain=self.impersonation_chain,
+                    polling_interval_seconds=self.polling_interval_seconds,
+                    timeout=self.timeout,
+                ),
+                method_name="execute_complete",
+            )
+        self._operation = operation
         metadata_import = hook.wait_for_operation(self.timeout, operation)
         self.log.info("Metadata import %s created successfully", self.metadata_import_id)
 
@@ -359,8 +475,110 @@ class DataprocMetastoreCreateMetadataImportOperator(GoogleCloudBaseOperator):
         )
         return MetadataImport.to_dict(metadata_import)
 
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> dict:
+        """Act as a callback for when the trigger fires - returns the created metadata import."""
+        from google.cloud.metastore_v1.types import MetadataImport
 
-class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
+        metadata_import = MetadataImport.deserialize(_get_operation_response(event))
+        self.log.info("Metadata import %s created successfully", self.metadata_import_id)
+        return MetadataImport.to_dict(metadata_import)
+
+
+class DataprocMetastoreCreateMetadataImportsOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
+    """
+    Create several MetadataImports of one service in a given project and location.
+
+    All imports share a single hook and client. The service runs one metadata import at a time, so each
+    import is created once the previous one has finished. Every import is sent with a request id derived
+    from the task instance, so a retried task does not create again the imports which already completed.
+
+    :param project_id: Required. The ID of the Google Cloud project that the service belongs to.
+    :param region: Required. The ID of the Google Cloud region that the service belongs to.
+    :param service_id:  Required. The ID of the metastore service, which is used as the final component of
+        the metastore service's name. This value must be between 2 and 63 characters long inclusive, begin
+        with a letter, end with a letter or number, and consist of alphanumeric ASCII characters or
+        hyphens.
+    :param metadata_imports: Required. The metadata imports to create, keyed by the ID of each metadata
+        import. The ``name`` field of the metadata imports is ignored.
+    :param retry: Optional. Designation of what errors, if any, should be retried.
+    :param timeout: Optional. The timeout for each request.
+    :param metadata: Optional. Strings which should be sent along with the request as metadata.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+        If set as a string, the account must grant the originating account
+        the Service Account Token Creator IAM role.
+        If set as a sequence, the identities from the list must grant
+        Service Account Token Creator IAM role to the directly preceding identity, with first
+        account from the list granting this role to the originating account (templated).
+    :param cancel_on_kill: Flag which indicates whether to cancel the metadata imports operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
+    """
+
+    template_fields: Sequence[str] = (
+        "project_id",
+        "metadata_imports",
+        "impersonation_chain",
+    )
+    template_fields_renderers = {"metadata_imports": "json"}
+    operator_extra_links = (_METASTORE_LINK,)
+
+    def __init__(
+        self,
+        *,
+        project_id: str,
+        region: str,
+        service_id: str,
+        metadata_imports: dict[str, dict | MetadataImport],
+        retry: Retry | _MethodDefault = DEFAULT,
+        timeout: float | None = None,
+        metadata: Sequence[tuple[str, str]] = (),
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: str | Sequence[str] | None = None,
+        cancel_on_kill: bool = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.project_id = project_id
+        self.region = region
+        self.service_id = service_id
+        self.metadata_imports = metadata_imports
+        self.retry = retry
+        self.timeout = timeout
+        self.metadata = metadata
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+
+    def execute(self, context: Context) -> list[dict]:
+        from google.cloud.metastore_v1.types import MetadataImport
+
+        hook = self.hook
+        results = []
+        for metadata_import_id, metadata_import in self.metadata_imports.items():
+            self.log.info("Creating Dataproc Metastore metadata import: %s", metadata_import_id)
+            operation = hook.create_metadata_import(
+                project_id=self.project_id,
+                region=self.region,
+                service_id=self.service_id,
+                metadata_import=metadata_import,
+                metadata_import_id=metadata_import_id,
+                request_id=_get_idempotent_request_id(context, metadata_import_id),
+                retry=self.retry,
+                timeout=self.timeout,
+                metadata=self.metadata,
+            )
+            self._operation = operation
+            result = hook.wait_for_operation(self.timeout, operation)
+            self.log.info("Metadata import %s created successfully", metadata_import_id)
+            results.append(MetadataImport.to_dict(result))
+
+        DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_EXPORT_LINK)
+        return results
+
+
+class DataprocMetastoreCreateServiceOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Create a metastore service in a project and location.
 
@@ -378,7 +596,8 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
 
         This corresponds to the ``service_id`` field on the ``request`` instance; if ``request`` is
         provided, this should not be set.
-    :param request_id: Optional. A unique id used to identify the request.
+    :param request_id: Optional. A unique id used to identify the request. If not set, an id derived from
+        the task instance is used, so a retried task picks up the service operation it already started.
     :param retry: Designation of what errors, if any, should be retried.
     :param timeout: The timeout for this request.
     :param metadata: Strings which should be sent along with the request as metadata.
@@ -391,6 +610,11 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the service creation operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
@@ -399,7 +623,7 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
         "impersonation_chain",
     )
     template_fields_renderers = {"service": "json"}
-    operator_extra_links = (DataprocMetastoreLink(),)
+    operator_extra_links = (_METASTORE_LINK,)
 
     def __init__(
         self,
@@ -414,6 +638,9 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -427,11 +654,14 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context) -> dict:
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        from google.cloud.metastore_v1.types import Service
+
+        hook = self.hook
         self.log.info("Creating Dataproc Metastore service: %s", self.service_id)
         try:
             operation = hook.create_service(
@@ -439,11 +669,24 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
                 project_id=self.project_id,
                 service=self.service,
                 service_id=self.service_id,
-                request_id=self.request_id,
+                request_id=self.request_id or _get_idempotent_request_id(context, self.service_id),
                 retry=self.retry,
                 timeout=self.timeout,
                 metadata=self.metadata,
             )
+            if self.deferrable:
+                DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_SERVICE_LINK)
+                self.defer(
+                    trigger=DataprocMetastoreOperationTrigger(
+                        operation_name=operation.operation.name,
+                        gcp_conn_id=self.gcp_conn_id,
+                        impersonation_chain=self.impersonation_chain,
+                        polling_interval_seconds=self.polling_interval_seconds,
+                        timeout=self.timeout,
+                    ),
+                    method_name="execute_complete",
+                )
+            self._operation = operation
             service = hook.wait_for_operation(self.timeout, operation)
             self.log.info("Service %s created successfully", self.service_id)
         except AlreadyExists:
@@ -459,8 +702,16 @@ class DataprocMetastoreCreateServiceOperator(GoogleCloudBaseOperator):
         DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_SERVICE_LINK)
         return Service.to_dict(service)
 
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> dict:
+        """Act as a callback for when the trigger fires - returns the created service."""
+        from google.cloud.metastore_v1.types import Service
+
+        service = Service.deserialize(_get_operation_response(event))
+        self.log.info("Service %s created successfully", self.service_id)
+        return Service.to_dict(service)
+
 
-class DataprocMetastoreDeleteBackupOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreDeleteBackupOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Delete a single backup.
 
@@ -492,6 +743,11 @@ class DataprocMetastoreDeleteBackupOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the backup deletion operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
@@ -512,6 +768,9 @@ class DataprocMetastoreDeleteBackupOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -525,11 +784,12 @@ class DataprocMetastoreDeleteBackupOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context) -> None:
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        hook = self.hook
         self.log.info("Deleting Dataproc Metastore backup: %s", self.backup_id)
         operation = hook.delete_backup(
             project_id=self.project_id,
@@ -541,11 +801,28 @@ class DataprocMetastoreDeleteBackupOperator(GoogleCloudBaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        if self.deferrable:
+            self.defer(
+                trigger=DataprocMetastoreOperationTrigger(
+                    operation_name=operation.operation.name,
+                    gcp_conn_id=self.gcp_conn_id,
+                    impersonation_chain=self.impersonation_chain,
+                    polling_interval_seconds=self.polling_interval_seconds,
+                    timeout=self.timeout,
+                ),
+                method_name="execute_complete",
+            )
+        self._operation = operation
         hook.wait_for_operation(self.timeout, operation)
         self.log.info("Backup %s deleted successfully", self.project_id)
 
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> None:
+        """Act as a callback for when the trigger fires - returns immediately."""
+        _get_operation_response(event)
+        self.log.info("Backup %s deleted successfully", self.backup_id)
+
 
-class DataprocMetastoreDeleteServiceOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreDeleteServiceOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Delete a single service.
 
@@ -567,6 +844,11 @@ class DataprocMetastoreDeleteServiceOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the service deletion operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
@@ -585,6 +867,9 @@ class DataprocMetastoreDeleteServiceOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -596,11 +881,12 @@ class DataprocMetastoreDeleteServiceOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context):
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        hook = self.hook
         self.log.info("Deleting Dataproc Metastore service: %s", self.service_id)
         operation = hook.delete_service(
             region=self.region,
@@ -610,11 +896,28 @@ class DataprocMetastoreDeleteServiceOperator(GoogleCloudBaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        if self.deferrable:
+            self.defer(
+                trigger=DataprocMetastoreOperationTrigger(
+                    operation_name=operation.operation.name,
+                    gcp_conn_id=self.gcp_conn_id,
+                    impersonation_chain=self.impersonation_chain,
+                    polling_interval_seconds=self.polling_interval_seconds,
+                    timeout=self.timeout,
+                ),
+                method_name="execute_complete",
+            )
+        self._operation = operation
         hook.wait_for_operation(self.timeout, operation)
         self.log.info("Service %s deleted successfully", self.service_id)
 
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> None:
+        """Act as a callback for when the trigger fires - returns immediately."""
+        _get_operation_response(event)
+        self.log.info("Service %s deleted successfully", self.service_id)
+
 
-class DataprocMetastoreExportMetadataOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreExportMetadataOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Export metadata from a service.
 
@@ -643,13 +946,18 @@ class DataprocMetastoreExportMetadataOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the metadata export operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
         "project_id",
         "impersonation_chain",
     )
-    operator_extra_links = (DataprocMetastoreLink(), StorageLink())
+    operator_extra_links = (_METASTORE_LINK, _STORAGE_LINK)
 
     def __init__(
         self,
@@ -665,6 +973,9 @@ class DataprocMetastoreExportMetadataOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -679,13 +990,14 @@ class DataprocMetastoreExportMetadataOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context):
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        hook = self.hook
         self.log.info("Exporting metadata from Dataproc Metastore service: %s", self.service_id)
-        hook.export_metadata(
+        operation = hook.export_metadata(
             destination_gcs_folder=self.destination_gcs_folder,
             project_id=self.project_id,
             region=self.region,
@@ -696,45 +1008,47 @@ class DataprocMetastoreExportMetadataOperator(GoogleCloudBaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
-        metadata_export = self._wait_for_export_metadata(hook)
-        self.log.info("Metadata from service %s exported successfully", self.service_id)
+        if self.deferrable:
+            self.defer(
+                trigger=DataprocMetastoreOperationTrigger(
+                    operation_name=operation.operation.name,
+                    gcp_conn_id=self.gcp_conn_id,
+                    impersonation_chain=self.impersonation_chain,
+                    polling_interval_seconds=self.polling_interval_seconds,
+                    timeout=self.timeout,
+                ),
+                method_name="execute_complete",
+            )
+        from google.cloud.metastore_v1 import MetadataExport
+
+        self._operation = operation
+        response = hook.wait_for_operation_response(self.timeout, operation)
+        return self._on_metadata_exported(context, MetadataExport.deserialize(response))
+
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> dict:
+        """Act as a callback for when the trigger fires - returns the metadata export."""
+        from google.cloud.metastore_v1 import MetadataExport
 
+        metadata_export = MetadataExport.deserialize(_get_operation_response(event))
+        return self._on_metadata_exported(context, metadata_export)
+
+    def _on_metadata_exported(self, context: Context, metadata_export: MetadataExport) -> dict:
+        from google.cloud.metastore_v1 import MetadataExport
+
+        self.log.info("Metadata from service %s exported successfully", self.service_id)
         DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_EXPORT_LINK)
-        uri = self._get_uri_from_destination(MetadataExport.to_dict(metadata_export)["destination_gcs_uri"])
-        StorageLink.persist(context=context, task_instance=self, uri=uri, project_id=self.project_id)
+        if _persist_extra_links():
+            uri = self._get_uri_from_destination(metadata_export.destination_gcs_uri)
+            StorageLink.persist(context=context, task_instance=self, uri=uri, project_id=self.project_id)
         return MetadataExport.to_dict(metadata_export)
 
-    def _get_uri_from_destination(self, destination_uri: str):
+    @staticmethod
+    def _get_uri_from_destination(destination_uri: str) -> str:
+        # str.removeprefix is not available on Python 3.8.
         return destination_uri[5:] if destination_uri.startswith("gs://") else destination_uri
 
-    def _wait_for_export_metadata(self, hook: DataprocMetastoreHook):
-        """
-        Check that export was created successfully.
-
-        This is a workaround to an issue parsing result to MetadataExport inside
-        the SDK.
-        """
-        for time_to_wait in exponential_sleep_generator(initial=10, maximum=120):
-            time.sleep(time_to_wait)
-            service = hook.get_service(
-                region=self.region,
-                project_id=self.project_id,
-                service_id=self.service_id,
-                retry=self.retry,
-                timeout=self.timeout,
-                metadata=self.metadata,
-            )
-            activities: MetadataManagementActivity = service.metadata_management_activity
-            metadata_export: MetadataExport = activities.metadata_exports[0]
-            if metadata_export.state == MetadataExport.State.SUCCEEDED:
-                return metadata_export
-            if metadata_export.state == MetadataExport.State.FAILED:
-                raise AirflowException(
-                    f"Exporting metadata from Dataproc Metastore {metadata_export.name} FAILED"
-                )
 
-
-class DataprocMetastoreGetServiceOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreGetServiceOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Get the details of a single service.
 
@@ -750,6 +1064,9 @@ class DataprocMetastoreGetServiceOperator(GoogleCloudBaseOperator):
     :param retry: Designation of what errors, if any, should be retried.
     :param timeout: The timeout for this request.
     :param metadata: Strings which should be sent along with the request as metadata.
+    :param response_fields: Optional. The top-level fields of the service to fetch and return, e.g.
+        ``["name", "state", "endpoint_uri"]``. The server then only sends these fields, which keeps the
+        returned XCom small. By default the whole service is returned.
     :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
     :param impersonation_chain: Optional service account to impersonate using short-term
         credentials, or chained list of accounts required to get the access_token
@@ -765,7 +1082,7 @@ class DataprocMetastoreGetServiceOperator(GoogleCloudBaseOperator):
         "project_id",
         "impersonation_chain",
     )
-    operator_extra_links = (DataprocMetastoreLink(),)
+    operator_extra_links = (_METASTORE_LINK,)
 
     def __init__(
         self,
@@ -776,6 +1093,7 @@ class DataprocMetastoreGetServiceOperator(GoogleCloudBaseOperator):
         retry: Retry | _MethodDefault = DEFAULT,
         timeout: float | None = None,
         metadata: Sequence[tuple[str, str]] = (),
+        response_fields: Sequence[str] | None = None,
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
         **kwargs,
@@ -787,27 +1105,34 @@ class DataprocMetastoreGetServiceOperator(GoogleCloudBaseOperator):
         self.retry = retry
         self.timeout = timeout
         self.metadata = metadata
+        self.response_fields = response_fields
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
 
     def execute(self, context: Context) -> dict:
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        from google.cloud.metastore_v1.types import Service
+
+        hook = self.hook
         self.log.info("Gets the details of a single Dataproc Metastore service: %s", self.project_id)
+        metadata = self.metadata
+        if self.response_fields:
+            metadata = (*metadata, ("x-goog-fieldmask", ",".join(self.response_fields)))
         result = hook.get_service(
             region=self.region,
             project_id=self.project_id,
             service_id=self.service_id,
             retry=self.retry,
             timeout=self.timeout,
-            metadata=self.metadata,
+            metadata=metadata,
         )
         DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_SERVICE_LINK)
-        return Service.to_dict(result)
+        service = Service.to_dict(result)
+        if self.response_fields:
+            return {field: service[field] for field in self.response_fields if field in service}
+        return service
 
 
-class DataprocMetastoreListBackupsOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreListBackupsOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     List backups in a service.
 
@@ -838,7 +1163,7 @@ class DataprocMetastoreListBackupsOperator(GoogleCloudBaseOperator):
         "project_id",
         "impersonation_chain",
     )
-    operator_extra_links = (DataprocMetastoreLink(),)
+    operator_extra_links = (_METASTORE_LINK,)
 
     def __init__(
         self,
@@ -872,9 +1197,9 @@ class DataprocMetastoreListBackupsOperator(GoogleCloudBaseOperator):
         self.impersonation_chain = impersonation_chain
 
     def execute(self, context: Context) -> list[dict]:
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        from google.cloud.metastore_v1.types import Backup
+
+        hook = self.hook
         self.log.info("Listing Dataproc Metastore backups: %s", self.service_id)
         backups = hook.list_backups(
             project_id=self.project_id,
@@ -892,7 +1217,7 @@ class DataprocMetastoreListBackupsOperator(GoogleCloudBaseOperator):
         return [Backup.to_dict(backup) for backup in backups]
 
 
-class DataprocMetastoreRestoreServiceOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreRestoreServiceOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Restore a service from a backup.
 
@@ -929,13 +1254,18 @@ class DataprocMetastoreRestoreServiceOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param deferrable: Run operator in the deferrable mode.
+    :param polling_interval_seconds: Time (seconds) to wait between calls to check the operation status
+        in the deferrable mode.
+    :param cancel_on_kill: Flag which indicates whether to cancel the service restore operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
         "project_id",
         "impersonation_chain",
     )
-    operator_extra_links = (DataprocMetastoreLink(),)
+    operator_extra_links = (_METASTORE_LINK,)
 
     def __init__(
         self,
@@ -954,6 +1284,9 @@ class DataprocMetastoreRestoreServiceOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        polling_interval_seconds: int = 30,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -971,15 +1304,16 @@ class DataprocMetastoreRestoreServiceOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
+        self.deferrable = deferrable
+        self.polling_interval_seconds = polling_interval_seconds
 
     def execute(self, context: Context):
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        hook = self.hook
         self.log.info(
             "Restoring Dataproc Metastore service: %s from backup: %s", self.service_id, self.backup_id
         )
-        hook.restore_service(
+        operation = hook.restore_service(
             project_id=self.project_id,
             region=self.region,
             service_id=self.service_id,
@@ -993,36 +1327,30 @@ class DataprocMetastoreRestoreServiceOperator(GoogleCloudBaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
-        self._wait_for_restore_service(hook)
+        if self.deferrable:
+            self.defer(
+                trigger=DataprocMetastoreOperationTrigger(
+                    operation_name=operation.operation.name,
+                    gcp_conn_id=self.gcp_conn_id,
+                    impersonation_chain=self.impersonation_chain,
+                    polling_interval_seconds=self.polling_interval_seconds,
+                    timeout=self.timeout,
+                ),
+                method_name="execute_complete",
+            )
+        self._operation = operation
+        hook.wait_for_operation_response(self.timeout, operation)
         self.log.info("Service %s restored from backup %s", self.service_id, self.backup_id)
         DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_SERVICE_LINK)
 
-    def _wait_for_restore_service(self, hook: DataprocMetastoreHook):
-        """
-        Check that export was created successfully.
-
-        This is a workaround to an issue parsing result to MetadataExport inside
-        the SDK.
-        """
-        for time_to_wait in exponential_sleep_generator(initial=10, maximum=120):
-            time.sleep(time_to_wait)
-            service = hook.get_service(
-                region=self.region,
-                project_id=self.project_id,
-                service_id=self.service_id,
-                retry=self.retry,
-                timeout=self.timeout,
-                metadata=self.metadata,
-            )
-            activities: MetadataManagementActivity = service.metadata_management_activity
-            restore_service: Restore = activities.restores[0]
-            if restore_service.state == Restore.State.SUCCEEDED:
-                return restore_service
-            if restore_service.state == Restore.State.FAILED:
-                raise AirflowException("Restoring service FAILED")
+    def execute_complete(self, context: Context, event: dict[str, Any] | None = None) -> None:
+        """Act as a callback for when the trigger fires."""
+        _get_operation_response(event)
+        self.log.info("Service %s restored from backup %s", self.service_id, self.backup_id)
+        DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_SERVICE_LINK)
 
 
-class DataprocMetastoreUpdateServiceOperator(GoogleCloudBaseOperator):
+class DataprocMetastoreUpdateServiceOperator(_DataprocMetastoreHookMixin, GoogleCloudBaseOperator):
     """
     Update the parameters of a single service.
 
@@ -1061,13 +1389,15 @@ class DataprocMetastoreUpdateServiceOperator(GoogleCloudBaseOperator):
         If set as a sequence, the identities from the list must grant
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
+    :param cancel_on_kill: Flag which indicates whether to cancel the service update operation when
+        on_kill is called. Errors raised while cancelling are logged and ignored.
     """
 
     template_fields: Sequence[str] = (
         "project_id",
         "impersonation_chain",
     )
-    operator_extra_links = (DataprocMetastoreLink(),)
+    operator_extra_links = (_METASTORE_LINK,)
 
     def __init__(
         self,
@@ -1083,6 +1413,7 @@ class DataprocMetastoreUpdateServiceOperator(GoogleCloudBaseOperator):
         metadata: Sequence[tuple[str, str]] = (),
         gcp_conn_id: str = "google_cloud_default",
         impersonation_chain: str | Sequence[str] | None = None,
+        cancel_on_kill: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -1097,11 +1428,10 @@ class DataprocMetastoreUpdateServiceOperator(GoogleCloudBaseOperator):
         self.metadata = metadata
         self.gcp_conn_id = gcp_conn_id
         self.impersonation_chain = impersonation_chain
+        self.cancel_on_kill = cancel_on_kill
 
     def execute(self, context: Context):
-        hook = DataprocMetastoreHook(
-            gcp_conn_id=self.gcp_conn_id, impersonation_chain=self.impersonation_chain
-        )
+        hook = self.hook
         self.log.info("Updating Dataproc Metastore service: %s", self.service.get("name"))
 
         operation = hook.update_service(
@@ -1115,6 +1445,7 @@ class DataprocMetastoreUpdateServiceOperator(GoogleCloudBaseOperator):
             timeout=self.timeout,
             metadata=self.metadata,
         )
+        self._operation = operation
         hook.wait_for_operation(self.timeout, operation)
         self.log.info("Service %s updated successfully", self.service.get("name"))
         DataprocMetastoreLink.persist(context=context, task_instance=self, url=METASTORE_SERVICE_LINK)
@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import re
 import time
 from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
@@ -39,9 +40,26 @@ from airflow.utils.state import TaskInstanceState
 if TYPE_CHECKING:
     from sqlalchemy.orm.session import Session
 
+# Matches the Cloud Storage URI of the diagnose output in the serialized operation response.
+_DIAGNOSE_OUTPUT_URI_RE = re.compile(rb"gs://[a-z0-9][a-z0-9_-]{1,61}[a-z0-9_\-/]*")
+
+# Largest diagnose response, in bytes, passed on as-is when no output URI can be found in it.
+_MAX_UNPARSED_DIAGNOSE_RESPONSE_SIZE = 4096
+
+_TERMINAL_JOB_STATES = frozenset({JobStatus.State.DONE, JobStatus.State.CANCELLED, JobStatus.State.ERROR})
+_TERMINAL_BATCH_STATES = frozenset({Batch.State.FAILED, Batch.State.SUCCEEDED, Batch.State.CANCELLED})
+
 
 class DataprocBaseTrigger(BaseTrigger):
-    """Base class for Dataproc triggers."""
+    """
+    Base class for Dataproc triggers.
+
+    The time between two status checks starts at ``polling_interval_seconds`` and grows by
+    ``backoff_factor`` on every check which finds the resource in the same state, up to
+    ``max_polling_interval_seconds``. It goes back to ``polling_interval_seconds`` whenever the state
+    changes. Each sleep is randomized by +/- ``jitter`` so that many triggers do not poll in lockstep.
+    By default, the status is checked every ``polling_interval_seconds`` without randomization.
+    """
 
     def __init__(
         self,
@@ -52,6 +70,9 @@ class DataprocBaseTrigger(BaseTrigger):
         polling_interval_seconds: int = 30,
         cancel_on_kill: bool = True,
         delete_on_error: bool = True,
+        backoff_factor: float = 1.0,
+        max_polling_interval_seconds: int = 300,
+        jitter: float = 0.0,
     ):
         super().__init__()
         self.region = region
@@ -61,12 +82,26 @@ class DataprocBaseTrigger(BaseTrigger):
         self.polling_interval_seconds = polling_interval_seconds
         self.cancel_on_kill = cancel_on_kill
         self.delete_on_error = delete_on_error
-
-    def get_async_hook(self):
-        return DataprocAsyncHook(
-            gcp_conn_id=self.gcp_conn_id,
-            impersonation_chain=self.impersonation_chain,
-        )
+        self.backoff_factor = backoff_factor
+        self.max_polling_interval_seconds = max_polling_interval_seconds
+        self.jitter = jitter
+        self._async_hook: DataprocAsyncHook | None = None
+
+    def _get_polling_interval(self, attempt: int) -> float:
+        """Return how long to sleep before the next status check, after ``attempt`` unchanged checks."""
+        cap = max(self.polling_interval_seconds, self.max_polling_interval_seconds)
+        # Past this many attempts the interval is capped anyway, and a bounded exponent cannot overflow.
+        interval = min(cap, self.polling_interval_seconds * self.backoff_factor ** min(attempt, 32))
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def get_async_hook(self) -> DataprocAsyncHook:
+        # Reused across polls, so that the hook's credentials and clients are only built once per run.
+        if self._async_hook is None:
+            self._async_hook = DataprocAsyncHook(
+                gcp_conn_id=self.gcp_conn_id,
+                impersonation_chain=self.impersonation_chain,
+            )
+        return self._async_hook
 
     def get_sync_hook(self):
         # The synchronous hook is utilized to delete the cluster when a task is cancelled.
@@ -112,6 +147,9 @@ class DataprocSubmitTrigger(DataprocBaseTrigger):
                 "gcp_conn_id": self.gcp_conn_id,
                 "impersonation_chain": self.impersonation_chain,
                 "polling_interval_seconds": self.polling_interval_seconds,
+                "backoff_factor": self.backoff_factor,
+                "max_polling_interval_seconds": self.max_polling_interval_seconds,
+                "jitter": self.jitter,
                 "cancel_on_kill": self.cancel_on_kill,
             },
         )
@@ -152,17 +190,28 @@ class DataprocSubmitTrigger(DataprocBaseTrigger):
         return task_instance.state != TaskInstanceState.DEFERRED
 
     async def run(self):
+        hook = self.get_async_hook()
         try:
+            attempt, last_state = 0, None
             while True:
-                job = await self.get_async_hook().get_job(
+                job = await hook.get_job(
                     project_id=self.project_id, region=self.region, job_id=self.job_id
                 )
                 state = job.status.state
-                self.log.info("Dataproc job: %s is in state: %s", self.job_id, state)
-                if state in (JobStatus.State.DONE, JobStatus.State.CANCELLED, JobStatus.State.ERROR):
+                # Only state changes are worth an INFO line; a long job would otherwise log every poll.
+                if state != last_state:
+                    self.log.info("Dataproc job: %s is in state: %s", self.job_id, state)
+                else:
+                    self.log.debug("Dataproc job: %s is still in state: %s", self.job_id, state)
+                if state in _TERMINAL_JOB_STATES:
                     break
-                await asyncio.sleep(self.polling_interval_seconds)
-            yield TriggerEvent({"job_id": self.job_id, "job_state": state, "job": job})
+                attempt = attempt + 1 if state == last_state else 0
+                last_state = state
+                await asyncio.sleep(self._get_polling_interval(attempt))
+            # The operator only reports the job's status, so the rest of the Job is not sent along.
+            yield TriggerEvent(
+                {"job_id": self.job_id, "job_state": state, "job": {"status": JobStatus.to_dict(job.status)}}
+            )
         except asyncio.CancelledError:
             self.log.info("Task got cancelled.")
             try:
@@ -219,6 +268,9 @@ class DataprocClusterTrigger(DataprocBaseTrigger):
                 "gcp_conn_id": self.gcp_conn_id,
                 "impersonation_chain": self.impersonation_chain,
                 "polling_interval_seconds": self.polling_interval_seconds,
+                "backoff_factor": self.backoff_factor,
+                "max_polling_interval_seconds": self.max_polling_interval_seconds,
+                "jitter": self.jitter,
                 "delete_on_error": self.delete_on_error,
             },
         )
@@ -255,6 +307,7 @@ class DataprocClusterTrigger(DataprocBaseTrigger):
 
     async def run(self) -> AsyncIterator[TriggerEvent]:
         try:
+            attempt, last_state = 0, None
             while True:
                 cluster = await self.fetch_cluster()
                 state = cluster.status.state
@@ -264,7 +317,7 @@ class DataprocClusterTrigger(DataprocBaseTrigger):
                         {
                             "cluster_name": self.cluster_name,
                             "cluster_state": ClusterStatus.State.DELETING,
-                            "cluster": cluster,
+                            "cluster": Cluster.to_dict(cluster),
                         }
                     )
                     return
@@ -273,13 +326,17 @@ class DataprocClusterTrigger(DataprocBaseTrigger):
                         {
                             "cluster_name": self.cluster_name,
                             "cluster_state": state,
-                            "cluster": cluster,
+                            "cluster": Cluster.to_dict(cluster),
                         }
                     )
                     return
-                self.log.info("Current state is %s", state)
-                self.log.info("Sleeping for %s seconds.", self.polling_interval_seconds)
-                await asyncio.sleep(self.polling_interval_seconds)
+                attempt = attempt + 1 if state == last_state else 0
+                last_state = state
+                polling_interval = self._get_polling_interval(attempt)
+                if attempt == 0:
+                    self.log.info("Current state is %s", state)
+                self.log.debug("Sleeping for %.1f seconds.", polling_interval)
+                await asyncio.sleep(polling_interval)
         except asyncio.CancelledError:
             try:
                 if self.delete_on_error and self.safe_to_cancel():
@@ -356,21 +413,30 @@ class DataprocBatchTrigger(DataprocBaseTrigger):
                 "gcp_conn_id": self.gcp_conn_id,
                 "impersonation_chain": self.impersonation_chain,
                 "polling_interval_seconds": self.polling_interval_seconds,
+                "backoff_factor": self.backoff_factor,
+                "max_polling_interval_seconds": self.max_polling_interval_seconds,
+                "jitter": self.jitter,
             },
         )
 
     async def run(self):
+        hook = self.get_async_hook()
+        attempt, last_state = 0, None
         while True:
-            batch = await self.get_async_hook().get_batch(
+            batch = await hook.get_batch(
                 project_id=self.project_id, region=self.region, batch_id=self.batch_id
             )
             state = batch.state
 
-            if state in (Batch.State.FAILED, Batch.State.SUCCEEDED, Batch.State.CANCELLED):
+            if state in _TERMINAL_BATCH_STATES:
                 break
-            self.log.info("Current state is %s", state)
-            self.log.info("Sleeping for %s seconds.", self.polling_interval_seconds)
-            await asyncio.sleep(self.polling_interval_seconds)
+            attempt = attempt + 1 if state == last_state else 0
+            last_state = state
+            polling_interval = self._get_polling_interval(attempt)
+            if attempt == 0:
+                self.log.info("Current state is %s", state)
+            self.log.debug("Sleeping for %.1f seconds.", polling_interval)
+            await asyncio.sleep(polling_interval)
         yield TriggerEvent({"batch_id": self.batch_id, "batch_state": state})
 
 
@@ -393,6 +459,9 @@ class DataprocDeleteClusterTrigger(DataprocBaseTrigger):
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account.
     :param polling_interval_seconds: Time in seconds to sleep between checks of cluster status
+    :param operation_name: Optional. The name of the delete cluster long-running operation. When given,
+        the trigger checks that operation, which reports completion or failure of the deletion, instead
+        of fetching the whole cluster until it is gone.
     """
 
     def __init__(
@@ -400,12 +469,14 @@ class DataprocDeleteClusterTrigger(DataprocBaseTrigger):
         cluster_name: str,
         end_time: float,
         metadata: Sequence[tuple[str, str]] = (),
+        operation_name: str | None = None,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
         self.cluster_name = cluster_name
         self.end_time = end_time
         self.metadata = metadata
+        self.operation_name = operation_name
 
     def serialize(self) -> tuple[str, dict[str, Any]]:
         """Serialize DataprocDeleteClusterTrigger arguments and classpath."""
@@ -417,28 +488,43 @@ class DataprocDeleteClusterTrigger(DataprocBaseTrigger):
                 "project_id": self.project_id,
                 "region": self.region,
                 "metadata": self.metadata,
+                "operation_name": self.operation_name,
                 "gcp_conn_id": self.gcp_conn_id,
                 "impersonation_chain": self.impersonation_chain,
                 "polling_interval_seconds": self.polling_interval_seconds,
+                "backoff_factor": self.backoff_factor,
+                "max_polling_interval_seconds": self.max_polling_interval_seconds,
+                "jitter": self.jitter,
             },
         )
 
     async def run(self) -> AsyncIterator[TriggerEvent]:
         """Wait until cluster is deleted completely."""
+        loop = asyncio.get_running_loop()
+        # end_time is wall-clock time set by the operator; compare against the loop's monotonic clock so
+        # that a clock adjustment on the triggerer does not shorten or extend the wait.
+        deadline = loop.time() + (self.end_time - time.time())
         try:
-            while self.end_time > time.time():
-                cluster = await self.get_async_hook().get_cluster(
+            if self.operation_name:
+                yield await self._wait_for_delete_operation(deadline)
+                return
+            hook = self.get_async_hook()
+            attempt, last_state = 0, None
+            while (remaining := deadline - loop.time()) > 0:
+                cluster = await hook.get_cluster(
                     region=self.region,  # type: ignore[arg-type]
                     cluster_name=self.cluster_name,
                     project_id=self.project_id,  # type: ignore[arg-type]
                     metadata=self.metadata,
                 )
-                self.log.info(
-                    "Cluster status is %s. Sleeping for %s seconds.",
-                    cluster.status.state,
-                    self.polling_interval_seconds,
-                )
-                await asyncio.sleep(self.polling_interval_seconds)
+                state = cluster.status.state
+                attempt = attempt + 1 if state == last_state else 0
+                last_state = state
+                polling_interval = min(self._get_polling_interval(attempt), remaining)
+                if attempt == 0:
+                    self.log.info("Cluster status is %s.", state)
+                self.log.debug("Sleeping for %.1f seconds.", polling_interval)
+                await asyncio.sleep(polling_interval)
         except NotFound:
             yield TriggerEvent({"status": "success", "message": ""})
         except Exception as e:
@@ -446,12 +532,34 @@ class DataprocDeleteClusterTrigger(DataprocBaseTrigger):
         else:
             yield TriggerEvent({"status": "error", "message": "Timeout"})
 
+    async def _wait_for_delete_operation(self, deadline: float) -> TriggerEvent:
+        loop = asyncio.get_running_loop()
+        hook = self.get_async_hook()
+        attempt = 0
+        while (remaining := deadline - loop.time()) > 0:
+            operation = await hook.get_operation(region=self.region, operation_name=self.operation_name)
+            if operation.done:
+                if operation.error.message:
+                    return TriggerEvent({"status": "error", "message": operation.error.message})
+                return TriggerEvent({"status": "success", "message": ""})
+            polling_interval = min(self._get_polling_interval(attempt), remaining)
+            attempt += 1
+            if attempt == 1:
+                self.log.info("Cluster %s is being deleted.", self.cluster_name)
+            self.log.debug("Sleeping for %.1f seconds.", polling_interval)
+            await asyncio.sleep(polling_interval)
+        return TriggerEvent({"status": "error", "message": "Timeout"})
+
 
 class DataprocOperationTrigger(DataprocBaseTrigger):
     """
     Trigger that periodically polls information on a long running operation from Dataproc API to verify status.
 
     Implementation leverages asynchronous transport.
+
+    For a ``diagnose`` operation, the event carries the Cloud Storage URI of the diagnostic output as the
+    ``output_uri`` string. If no URI can be found in the operation response, ``output_uri`` is the decoded
+    response when it is at most 4096 bytes long, and an empty string otherwise.
     """
 
     def __init__(self, name: str, operation_type: str | None = None, **kwargs: Any):
@@ -470,12 +578,16 @@ class DataprocOperationTrigger(DataprocBaseTrigger):
                 "gcp_conn_id": self.gcp_conn_id,
                 "impersonation_chain": self.impersonation_chain,
                 "polling_interval_seconds": self.polling_interval_seconds,
+                "backoff_factor": self.backoff_factor,
+                "max_polling_interval_seconds": self.max_polling_interval_seconds,
+                "jitter": self.jitter,
             },
         )
 
     async def run(self) -> AsyncIterator[TriggerEvent]:
         hook = self.get_async_hook()
         try:
+            attempt = 0
             while True:
                 operation = await hook.get_operation(region=self.region, operation_name=self.name)
                 if operation.done:
@@ -486,13 +598,15 @@ class DataprocOperationTrigger(DataprocBaseTrigger):
                         status = "success"
                         message = "Operation is successfully ended."
                     if self.operation_type == DataprocOperationType.DIAGNOSE.value:
-                        gcs_regex = rb"gs:\/\/[a-z0-9][a-z0-9_-]{1,61}[a-z0-9_\-\/]*"
                         gcs_uri_value = operation.response.value
-                        match = re.search(gcs_regex, gcs_uri_value)
+                        match = _DIAGNOSE_OUTPUT_URI_RE.search(gcs_uri_value)
                         if match:
                             output_uri = match.group(0).decode("utf-8", "ignore")
+                        elif len(gcs_uri_value) <= _MAX_UNPARSED_DIAGNOSE_RESPONSE_SIZE:
+                            output_uri = gcs_uri_value.decode("utf-8", "ignore")
                         else:
-                            output_uri = gcs_uri_value
+                            # Without a URI to point at, a large response is not worth carrying in the event.
+                            output_uri = ""
                         yield TriggerEvent(
                             {
                                 "status": status,
@@ -511,8 +625,10 @@ class DataprocOperationTrigger(DataprocBaseTrigger):
                         )
                     return
                 else:
-                    self.log.info("Sleeping for %s seconds.", self.polling_interval_seconds)
-                    await asyncio.sleep(self.polling_interval_seconds)
+                    polling_interval = self._get_polling_interval(attempt)
+                    attempt += 1
+                    self.log.debug("Sleeping for %.1f seconds.", polling_interval)
+                    await asyncio.sleep(polling_interval)
         except Exception as e:
             self.log.exception("Exception occurred while checking operation status.")
             yield TriggerEvent(
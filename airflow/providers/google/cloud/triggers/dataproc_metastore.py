@@ -0,0 +1,138 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""This module contains Google Dataproc Metastore triggers."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from typing import Any, AsyncIterator, Sequence
+
+from google.api_core.retry import exponential_sleep_generator
+
+from airflow.providers.google.cloud.hooks.dataproc_metastore import DataprocMetastoreAsyncHook
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+
+class DataprocMetastoreOperationTrigger(BaseTrigger):
+    """
+    Trigger that polls a Dataproc Metastore long-running operation until it is done.
+
+    On success, the event carries the serialized operation response encoded in base64, so that the
+    operator can rebuild the resulting resource without another API call.
+
+    :param operation_name: The full name of the long-running operation.
+    :param gcp_conn_id: The connection ID to use connecting to Google Cloud.
+    :param impersonation_chain: Optional service account to impersonate using short-term
+        credentials, or chained list of accounts required to get the access_token
+        of the last account in the list, which will be impersonated in the request.
+        If set as a string, the account must grant the originating account
+        the Service Account Token Creator IAM role.
+        If set as a sequence, the identities from the list must grant
+        Service Account Token Creator IAM role to the directly preceding identity, with first
+        account from the list granting this role to the originating account.
+    :param polling_interval_seconds: The maximum time in seconds to wait between two checks.
+    :param timeout: Optional. The maximum time in seconds to wait for the operation. If the operation is not
+        done by then, an error event is sent. By default, the trigger waits until the operation is done.
+    """
+
+    def __init__(
+        self,
+        operation_name: str,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: str | Sequence[str] | None = None,
+        polling_interval_seconds: int = 30,
+        timeout: float | None = None,
+    ):
+        super().__init__()
+        self.operation_name = operation_name
+        self.gcp_conn_id = gcp_conn_id
+        self.impersonation_chain = impersonation_chain
+        self.polling_interval_seconds = polling_interval_seconds
+        self.timeout = timeout
+        self._async_hook: DataprocMetastoreAsyncHook | None = None
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            "airflow.providers.google.cloud.triggers.dataproc_metastore.DataprocMetastoreOperationTrigger",
+            {
+                "operation_name": self.operation_name,
+                "gcp_conn_id": self.gcp_conn_id,
+                "impersonation_chain": self.impersonation_chain,
+                "polling_interval_seconds": self.polling_interval_seconds,
+                "timeout": self.timeout,
+            },
+        )
+
+    def get_async_hook(self) -> DataprocMetastoreAsyncHook:
+        # Reused across polls, so that the hook's credentials and client are only built once per run.
+        if self._async_hook is None:
+            self._async_hook = DataprocMetastoreAsyncHook(
+                gcp_conn_id=self.gcp_conn_id,
+                impersonation_chain=self.impersonation_chain,
+            )
+        return self._async_hook
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        hook = self.get_async_hook()
+        delays = exponential_sleep_generator(initial=1, maximum=self.polling_interval_seconds)
+        in_progress = False
+        try:
+            while True:
+                operation = await hook.get_operation(operation_name=self.operation_name)
+                if operation.done:
+                    break
+                delay = next(delays)
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        yield TriggerEvent(
+                            {
+                                "status": "error",
+                                "operation_name": operation.name,
+                                "message": f"Operation {operation.name} is not done after {self.timeout}s.",
+                            }
+                        )
+                        return
+                    delay = min(delay, remaining)
+                if not in_progress:
+                    # The operation is only either in progress or done, so this is its only state change
+                    # before the event is sent.
+                    self.log.info("Operation %s is in progress.", operation.name)
+                    in_progress = True
+                self.log.debug("Sleeping for %.1f seconds.", delay)
+                await asyncio.sleep(delay)
+        except Exception as e:
+            self.log.exception("Exception occurred while checking operation status.")
+            yield TriggerEvent({"status": "error", "message": str(e)})
+            return
+
+        if operation.error.message:
+            yield TriggerEvent(
+                {"status": "error", "operation_name": operation.name, "message": operation.error.message}
+            )
+        else:
+            yield TriggerEvent(
+                {
+                    "status": "success",
+                    "operation_name": operation.name,
+                    "response": base64.b64encode(operation.response.value).decode("ascii"),
+                }
+            )
@@ -81,23 +81,28 @@ class Templater(LoggingMixin):
         template is rendered, it should override this method to do so.
         """
 
+    def _read_template_source(self, env: jinja2.Environment, path: str) -> str:
+        """Load the raw content of a template file referenced by a templated field."""
+        return env.loader.get_source(env, path)[0]  # type: ignore
+
     def resolve_template_files(self) -> None:
         """Get the content of files for template_field / template_ext."""
         if self.template_ext:
+            template_ext = tuple(self.template_ext)
             for field in self.template_fields:
                 content = getattr(self, field, None)
-                if isinstance(content, str) and content.endswith(tuple(self.template_ext)):
+                if isinstance(content, str) and content.endswith(template_ext):
                     env = self.get_template_env()
                     try:
-                        setattr(self, field, env.loader.get_source(env, content)[0])  # type: ignore
+                        setattr(self, field, self._read_template_source(env, content))
                     except Exception:
                         self.log.exception("Failed to resolve template field %r", field)
                 elif isinstance(content, list):
                     env = self.get_template_env()
                     for i, item in enumerate(content):
-                        if isinstance(item, str) and item.endswith(tuple(self.template_ext)):
+                        if isinstance(item, str) and item.endswith(template_ext):
                             try:
-                                content[i] = env.loader.get_source(env, item)[0]  # type: ignore
+                                content[i] = self._read_template_source(env, item)
                             except Exception:
                                 self.log.exception("Failed to get source %s", item)
         self.prepare_template()
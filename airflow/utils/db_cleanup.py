@@ -24,6 +24,7 @@ See:
 from __future__ import annotations
 
 import csv
+import itertools
 import logging
 import os
 from contextlib import contextmanager
@@ -153,21 +154,47 @@ def _dump_table_to_file(*, target_table, file_path, export_format, session):
         raise AirflowException(f"Export format {export_format} is not supported.")
 
 
-def _do_delete(*, query, orm_model, skip_archive, session):
+def _get_archive_table_name(orm_model) -> str:
     import re2
 
+    timestamp_str = re2.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
+    return f"{ARCHIVE_TABLE_PREFIX}{orm_model.name}__{timestamp_str}"
+
+
+def _primary_key_in(table, keys):
+    pk_cols = list(table.primary_key.columns)
+    if len(pk_cols) == 1:
+        return pk_cols[0].in_([key[0] for key in keys])
+    return tuple_(*pk_cols).in_(keys)
+
+
+def _get_batch_keys(*, query, pk_col_names, batch_size, session) -> list[tuple]:
+    # The query selects "base.*", whose columns are only known by name.
+    batch = query.limit(batch_size).subquery()
+    key_query = select(*[column(name) for name in pk_col_names]).select_from(batch)
+    return [tuple(row) for row in session.execute(key_query)]
+
+
+def _do_delete(*, query, orm_model, skip_archive, session, target_table_name=None, batch_keys=None):
     print("Performing Delete...")
     # using bulk delete
     # create a new table and copy the rows there
-    timestamp_str = re2.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
-    target_table_name = f"{ARCHIVE_TABLE_PREFIX}{orm_model.name}__{timestamp_str}"
+    target_table_name = target_table_name or _get_archive_table_name(orm_model)
     print(f"Moving data to table {target_table_name}")
     bind = session.get_bind()
     dialect_name = bind.dialect.name
-    if dialect_name == "mysql":
-        # MySQL with replication needs this split into two queries, so just do it for all MySQL
-        # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
-        session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
+    if batch_keys is not None:
+        # Only move the rows of this batch, selected by primary key, so that a batch never needs to be
+        # matched against the rows already archived by the previous batches.
+        source_table = reflect_tables([orm_model.name], session).tables[orm_model.name]
+        query = session.query(source_table).filter(_primary_key_in(source_table, batch_keys))
+    # Later batches of a batched purge are added to the archive table created by the first batch.
+    table_exists = inspect(bind).has_table(target_table_name)
+    if table_exists or dialect_name == "mysql":
+        if not table_exists:
+            # MySQL with replication needs this split into two queries, so just do it for all MySQL
+            # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
+            session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
         metadata = reflect_tables([target_table_name], session)
         target_table = metadata.tables[target_table_name]
         insert_stm = target_table.insert().from_select(target_table.c, query)
@@ -184,7 +211,9 @@ def _do_delete(*, query, orm_model, skip_archive, session):
     source_table = metadata.tables[orm_model.name]
     target_table = metadata.tables[target_table_name]
     logger.debug("rows moved; purging from %s", source_table.name)
-    if dialect_name == "sqlite":
+    if batch_keys is not None:
+        delete = source_table.delete().where(_primary_key_in(source_table, batch_keys))
+    elif dialect_name == "sqlite":
         pk_cols = source_table.primary_key.columns
         delete = source_table.delete().where(
             tuple_(*pk_cols).in_(select(*[target_table.c[x.name] for x in source_table.primary_key.columns]))
@@ -280,6 +309,7 @@ def _cleanup_table(
     dry_run=True,
     verbose=False,
     skip_archive=False,
+    batch_size=None,
     session,
     **kwargs,
 ):
@@ -300,7 +330,34 @@ def _cleanup_table(
     num_rows = _check_for_rows(query=query, print_rows=False)
 
     if num_rows and not dry_run:
-        _do_delete(query=query, orm_model=orm_model, skip_archive=skip_archive, session=session)
+        if batch_size:
+            # Purge in bounded chunks so that each transaction (and the WAL / undo it generates)
+            # stays small instead of deleting every matching row in one statement. All batches are
+            # archived into the same table, as a purge without batches would be.
+            # Each batch is selected by primary key, so its cost does not grow with the rows already
+            # archived, and a batch smaller than batch_size means that no rows are left.
+            target_table_name = _get_archive_table_name(orm_model)
+            source_table = reflect_tables([orm_model.name], session).tables[orm_model.name]
+            pk_col_names = [col.name for col in source_table.primary_key.columns]
+            for batch_counter in itertools.count(1):
+                batch_keys = _get_batch_keys(
+                    query=query, pk_col_names=pk_col_names, batch_size=batch_size, session=session
+                )
+                if not batch_keys:
+                    break
+                print(f"Processing batch {batch_counter}")
+                _do_delete(
+                    query=query,
+                    orm_model=orm_model,
+                    skip_archive=skip_archive,
+                    session=session,
+                    target_table_name=target_table_name,
+                    batch_keys=batch_keys,
+                )
+                if len(batch_keys) < batch_size:
+                    break
+        else:
+            _do_delete(query=query, orm_model=orm_model, skip_archive=skip_archive, session=session)
 
     session.commit()
 
@@ -399,6 +456,7 @@ def run_cleanup(
     verbose: bool = False,
     confirm: bool = True,
     skip_archive: bool = False,
+    batch_size: int | None = None,
     session: Session = NEW_SESSION,
 ):
     """
@@ -418,6 +476,8 @@ def run_cleanup(
     :param verbose: If true, may provide more detailed output.
     :param confirm: Require user input to confirm before processing deletions.
     :param skip_archive: Set to True if you don't want the purged rows preservied in an archive table.
+    :param batch_size: Optional. Maximum number of rows to delete per transaction. If not provided,
+        all matching rows of a table are deleted at once.
     :param session: Session representing connection to the metadata database.
     """
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
@@ -441,6 +501,7 @@ def run_cleanup(
                     verbose=verbose,
                     **table_config.__dict__,
                     skip_archive=skip_archive,
+                    batch_size=batch_size,
                     session=session,
                 )
                 session.commit()
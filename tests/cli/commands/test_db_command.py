@@ -0,0 +1,48 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from airflow.cli import cli_parser
+from airflow.cli.commands import db_command
+
+
+class TestCLIDBClean:
+    @classmethod
+    def setup_class(cls):
+        cls.parser = cli_parser.get_parser()
+
+    @pytest.mark.parametrize("batch_size, expected", [([], None), (["--batch-size", "100"], 100)])
+    @patch("airflow.cli.commands.db_command.run_cleanup")
+    def test_batch_size(self, run_cleanup_mock, batch_size, expected):
+        args = self.parser.parse_args(
+            ["db", "clean", "--clean-before-timestamp", "2021-01-01", "-y", *batch_size]
+        )
+
+        db_command.cleanup_tables(args)
+
+        assert run_cleanup_mock.call_args.kwargs["batch_size"] == expected
+
+    @pytest.mark.parametrize("batch_size", ["0", "-1", "abc"])
+    def test_invalid_batch_size(self, batch_size):
+        with pytest.raises(SystemExit):
+            self.parser.parse_args(
+                ["db", "clean", "--clean-before-timestamp", "2021-01-01", "--batch-size", batch_size]
+            )
@@ -0,0 +1,150 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import Session
+
+from airflow.models.base import Base
+from airflow.models.taskinstance import TaskInstance
+from airflow.models.taskinstancehistory import TaskInstanceHistory
+from airflow.utils import timezone
+from airflow.utils.state import TaskInstanceState
+
+START_DATE = timezone.datetime(2024, 1, 1)
+
+
+def _task_instance(**kwargs) -> SimpleNamespace:
+    values = {column.name: None for column in TaskInstanceHistory.__table__.columns}
+    values.update(
+        dag_id="test_dag",
+        task_id="test_task",
+        run_id="test_run",
+        map_index=-1,
+        try_number=1,
+        pool="default_pool",
+        pool_slots=1,
+        start_date=START_DATE,
+    )
+    values.update(kwargs)
+    ti = SimpleNamespace(**values)
+
+    def set_duration():
+        ti.duration = (ti.end_date - ti.start_date).total_seconds()
+
+    ti.set_duration = mock.Mock(side_effect=set_duration)
+    return ti
+
+
+class TestTaskInstanceHistory:
+    def test_mutable_columns_are_saved_and_reloaded(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[TaskInstance.__table__, TaskInstanceHistory.__table__])
+        ti = _task_instance(
+            state=TaskInstanceState.FAILED,
+            next_kwargs={"event": "test"},
+            executor_config={"key": "value"},
+        )
+
+        with Session(engine) as session:
+            history = TaskInstanceHistory(ti)
+            assert isinstance(history.next_kwargs, MutableDict)
+            session.add(history)
+            session.commit()
+
+        with Session(engine) as session:
+            history = session.scalar(select(TaskInstanceHistory))
+            assert history.next_kwargs == {"event": "test"}
+            assert history.executor_config == {"key": "value"}
+            history.next_kwargs["other"] = "value"
+            session.commit()
+
+        with Session(engine) as session:
+            history = session.scalar(select(TaskInstanceHistory))
+            assert history.next_kwargs == {"event": "test", "other": "value"}
+
+    def test_state_overrides_task_instance_state(self):
+        history = TaskInstanceHistory(_task_instance(state=TaskInstanceState.RUNNING), state="failed")
+
+        assert history.state == TaskInstanceState.FAILED
+        assert history.dag_id == "test_dag"
+
+
+class TestRecordTi:
+    @staticmethod
+    def _record(ti) -> TaskInstanceHistory:
+        session = mock.MagicMock()
+        session.scalar.return_value = 0
+        TaskInstanceHistory.record_ti(ti, session=session)
+        session.add.assert_called_once()
+        return session.add.call_args.args[0]
+
+    def test_existing_try_is_not_recorded_again(self):
+        session = mock.MagicMock()
+        session.scalar.return_value = 1
+
+        TaskInstanceHistory.record_ti(_task_instance(state=TaskInstanceState.FAILED), session=session)
+
+        session.add.assert_not_called()
+
+    @pytest.mark.parametrize("state", [TaskInstanceState.SUCCESS, TaskInstanceState.FAILED])
+    def test_finished_task_instance_is_recorded_as_is(self, state):
+        ti = _task_instance(state=state)
+
+        history = self._record(ti)
+
+        assert history.state == state
+        assert history.end_date is None
+        ti.set_duration.assert_not_called()
+
+    @mock.patch("airflow.models.taskinstancehistory.timezone.utcnow")
+    def test_unfinished_task_instance_gets_end_date_and_duration(self, mock_utcnow):
+        mock_utcnow.return_value = START_DATE + datetime.timedelta(seconds=30)
+        ti = _task_instance(state=TaskInstanceState.RUNNING)
+
+        history = self._record(ti)
+
+        assert history.state == TaskInstanceState.FAILED
+        assert history.end_date == mock_utcnow.return_value
+        assert history.duration == 30
+
+    def test_unfinished_task_instance_keeps_end_date_and_duration(self):
+        end_date = START_DATE + datetime.timedelta(seconds=10)
+        ti = _task_instance(state=TaskInstanceState.RUNNING, end_date=end_date, duration=5.0)
+
+        history = self._record(ti)
+
+        assert history.state == TaskInstanceState.FAILED
+        assert history.end_date == end_date
+        assert history.duration == 5.0
+        ti.set_duration.assert_not_called()
+
+    def test_unfinished_task_instance_without_start_date_has_no_duration(self):
+        ti = _task_instance(state=TaskInstanceState.QUEUED, start_date=None)
+
+        history = self._record(ti)
+
+        assert history.end_date is not None
+        assert history.duration is None
+        ti.set_duration.assert_not_called()
@@ -0,0 +1,88 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+from unittest import mock
+
+import jinja2
+import pytest
+
+from airflow.notifications.basenotifier import BaseNotifier
+
+
+class MockNotifier(BaseNotifier):
+    """MockNotifier class for testing."""
+
+    def notify(self, context):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_template_source_cache():
+    BaseNotifier._template_source_cache.clear()
+    yield
+    BaseNotifier._template_source_cache.clear()
+
+
+@pytest.fixture
+def env(tmp_path):
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(str(tmp_path)))
+
+
+class TestTemplateSourceCache:
+    def test_cache_hit(self, tmp_path, env):
+        (tmp_path / "message.txt").write_text("Hello {{ dag.dag_id }}")
+
+        with mock.patch.object(env.loader, "get_source", wraps=env.loader.get_source) as mock_get_source:
+            first = MockNotifier()._read_template_source(env, "message.txt")
+            second = MockNotifier()._read_template_source(env, "message.txt")
+
+        assert first == second == "Hello {{ dag.dag_id }}"
+        mock_get_source.assert_called_once_with(env, "message.txt")
+
+    def test_changed_file_is_read_again(self, tmp_path, env):
+        template_file = tmp_path / "message.txt"
+        template_file.write_text("old message")
+        assert MockNotifier()._read_template_source(env, "message.txt") == "old message"
+
+        template_file.write_text("new message")
+        mtime = os.path.getmtime(template_file) + 10
+        os.utime(template_file, (mtime, mtime))
+
+        assert MockNotifier()._read_template_source(env, "message.txt") == "new message"
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path, env):
+        cache_size = BaseNotifier._template_source_cache_size
+        assert cache_size == 128
+        for i in range(cache_size + 1):
+            (tmp_path / f"message_{i}.txt").write_text(f"message {i}")
+
+        notifier = MockNotifier()
+        notifier._read_template_source(env, "message_0.txt")
+        notifier._read_template_source(env, "message_1.txt")
+        for i in range(2, cache_size):
+            notifier._read_template_source(env, f"message_{i}.txt")
+        # Using message_0 again makes message_1 the least recently used entry.
+        notifier._read_template_source(env, "message_0.txt")
+        notifier._read_template_source(env, f"message_{cache_size}.txt")
+
+        cached_paths = {path for _, path in BaseNotifier._template_source_cache}
+        assert len(cached_paths) == cache_size
+        assert "message_0.txt" in cached_paths
+        assert "message_1.txt" not in cached_paths
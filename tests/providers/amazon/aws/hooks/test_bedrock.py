@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from botocore.config import Config
+
+from airflow.models import Connection
+from airflow.providers.amazon.aws.hooks.bedrock import (
+    _SHARED_CLIENTS,
+    BedrockHook,
+    BedrockRuntimeHook,
+    _BedrockBaseHook,
+)
+
+CONN_ID = "aws_bedrock"
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_clients():
+    _SHARED_CLIENTS.clear()
+    yield
+    _SHARED_CLIENTS.clear()
+
+
+def _connection(login: str = "access-key", password: str = "secret-key", extra: str = "{}") -> Connection:
+    return Connection(conn_id=CONN_ID, conn_type="aws", login=login, password=password, extra=extra)
+
+
+@mock.patch.object(_BedrockBaseHook, "get_client_type", side_effect=lambda **_: mock.MagicMock())
+@mock.patch.object(_BedrockBaseHook, "get_connection")
+class TestBedrockSharedClient:
+    def test_client_is_shared(self, mock_get_connection, mock_get_client_type):
+        mock_get_connection.return_value = _connection()
+
+        first = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1").conn
+        second = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1").conn
+
+        assert first is second
+        mock_get_client_type.assert_called_once_with(region_name="us-east-1")
+
+    def test_client_is_not_shared_across_client_types(self, mock_get_connection, mock_get_client_type):
+        mock_get_connection.return_value = _connection()
+
+        bedrock_client = BedrockHook(aws_conn_id=CONN_ID, region_name="us-east-1").conn
+        runtime_client = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1").conn
+
+        assert bedrock_client is not runtime_client
+
+    @pytest.mark.parametrize(
+        "changed_connection",
+        [
+            pytest.param(_connection(password="rotated-secret-key"), id="password"),
+            pytest.param(_connection(extra='{"aws_session_token": "new-token"}'), id="extra"),
+        ],
+    )
+    def test_credentials_change_creates_new_client(
+        self, mock_get_connection, mock_get_client_type, changed_connection
+    ):
+        mock_get_connection.return_value = _connection()
+        first = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1").conn
+
+        mock_get_connection.return_value = changed_connection
+        second = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1").conn
+
+        assert first is not second
+        assert mock_get_client_type.call_count == 2
+        assert len(_SHARED_CLIENTS) == 1
+
+    def test_share_client_false(self, mock_get_connection, mock_get_client_type):
+        mock_get_connection.return_value = _connection()
+
+        first = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1", share_client=False).conn
+        second = BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1", share_client=False).conn
+
+        assert first is not second
+        assert not _SHARED_CLIENTS
+
+    def test_explicit_config_is_not_shared(self, mock_get_connection, mock_get_client_type):
+        mock_get_connection.return_value = _connection()
+
+        BedrockRuntimeHook(aws_conn_id=CONN_ID, region_name="us-east-1", config=Config()).conn
+
+        assert not _SHARED_CLIENTS
+
+    def test_fingerprint_does_not_contain_credentials(self, mock_get_connection, mock_get_client_type):
+        mock_get_connection.return_value = _connection()
+
+        fingerprint = BedrockRuntimeHook(aws_conn_id=CONN_ID)._get_credentials_fingerprint()
+
+        assert "secret-key" not in fingerprint
+        assert len(fingerprint) == 64
@@ -0,0 +1,598 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import io
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException, TaskDeferred
+from airflow.providers.amazon.aws.hooks.bedrock import BedrockAgentHook, BedrockHook, BedrockRuntimeHook
+from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+from airflow.providers.amazon.aws.operators.bedrock import (
+    BedrockBatchInvokeModelOperator,
+    BedrockCreateDataSourcesOperator,
+    BedrockCreateKnowledgeBaseOperator,
+    BedrockCustomizeModelOperator,
+    BedrockInvokeModelOperator,
+    _get_waiter_statuses,
+)
+from airflow.providers.amazon.aws.triggers.bedrock import (
+    BedrockBatchInferenceCompletedTrigger,
+    BedrockCustomizeModelCompletedTrigger,
+    BedrockInvokeModelTrigger,
+)
+
+MODEL_ID = "meta.llama2-13b-chat-v1"
+PROMPT = "A very important question."
+RESPONSE = {"generation": "A very important answer.", "embedding": [0.1, 0.2]}
+
+
+class TestBedrockInvokeModelOperator:
+    @pytest.mark.parametrize("share_client", [True, False])
+    def test_share_client_is_passed_to_hook(self, share_client):
+        operator = BedrockInvokeModelOperator(
+            task_id="test_task",
+            model_id=MODEL_ID,
+            input_data={"prompt": PROMPT},
+            share_client=share_client,
+        )
+
+        assert operator.hook.share_client is share_client
+
+    def test_execute_deferrable(self):
+        operator = BedrockInvokeModelOperator(
+            task_id="test_task",
+            model_id=MODEL_ID,
+            input_data={"prompt": PROMPT},
+            response_extract_path="embedding",
+            deferrable=True,
+        )
+
+        with pytest.raises(TaskDeferred) as exc:
+            operator.execute({})
+
+        trigger = exc.value.trigger
+        assert isinstance(trigger, BedrockInvokeModelTrigger)
+        assert exc.value.method_name == "execute_complete"
+        assert json.loads(trigger.body) == {"prompt": PROMPT}
+        assert trigger.model_id == MODEL_ID
+        assert trigger.response_extract_path == "embedding"
+
+    def test_execute_deferrable_sends_full_body_when_writing_cache(self, tmp_path):
+        operator = BedrockInvokeModelOperator(
+            task_id="test_task",
+            model_id=MODEL_ID,
+            input_data={"prompt": PROMPT},
+            response_extract_path="embedding",
+            cache_mode="write_only",
+            cache_uri=str(tmp_path / "cache.db"),
+            deferrable=True,
+        )
+
+        with pytest.raises(TaskDeferred) as exc:
+            operator.execute({})
+
+        assert exc.value.trigger.response_extract_path is None
+
+    @pytest.mark.parametrize(
+        "response_extract_path, event, expected",
+        [
+            pytest.param(None, {"status": "success", "body": json.dumps(RESPONSE)}, RESPONSE, id="body"),
+            pytest.param(
+                "embedding",
+                {"status": "success", "body": json.dumps(RESPONSE)},
+                RESPONSE["embedding"],
+                id="body-extracted",
+            ),
+            pytest.param(
+                "embedding",
+                {"status": "success", "response": RESPONSE["embedding"]},
+                RESPONSE["embedding"],
+                id="response",
+            ),
+        ],
+    )
+    def test_execute_complete(self, response_extract_path, event, expected):
+        operator = BedrockInvokeModelOperator(
+            task_id="test_task",
+            model_id=MODEL_ID,
+            input_data={"prompt": PROMPT},
+            response_extract_path=response_extract_path,
+        )
+
+        assert operator.execute_complete({}, event) == expected
+
+    def test_execute_complete_error(self):
+        operator = BedrockInvokeModelOperator(
+            task_id="test_task", model_id=MODEL_ID, input_data={"prompt": PROMPT}
+        )
+
+        with pytest.raises(AirflowException, match="Error while invoking Bedrock model"):
+            operator.execute_complete({}, {"status": "error", "message": "test failure message"})
+
+
+class TestBedrockInvokeModelOperatorResponseExtractPath:
+    NESTED_RESPONSE = {"results": {"embedding": [0.1, 0.2]}, "inputTextTokenCount": 5}
+
+    @pytest.fixture
+    def mock_body(self):
+        body = mock.MagicMock()
+        body.read.return_value = json.dumps(self.NESTED_RESPONSE).encode()
+        with mock.patch.object(BedrockRuntimeHook, "conn") as _conn:
+            _conn.invoke_model.return_value = {"body": body}
+            yield body
+
+    def _operator(self, response_extract_path) -> BedrockInvokeModelOperator:
+        return BedrockInvokeModelOperator(
+            task_id="test_task",
+            model_id=MODEL_ID,
+            input_data={"prompt": PROMPT},
+            response_extract_path=response_extract_path,
+        )
+
+    @pytest.mark.parametrize(
+        "response_extract_path, expected",
+        [
+            pytest.param(None, NESTED_RESPONSE, id="full-response"),
+            pytest.param("results.embedding", [0.1, 0.2], id="nested"),
+            pytest.param("results.missing", None, id="missing"),
+        ],
+    )
+    @mock.patch("airflow.providers.amazon.aws.operators.bedrock.ijson", None)
+    def test_execute_extracts_from_parsed_body(self, mock_body, response_extract_path, expected):
+        assert self._operator(response_extract_path).execute({}) == expected
+
+        mock_body.read.assert_called_once_with()
+
+    @mock.patch("airflow.providers.amazon.aws.operators.bedrock.ijson")
+    def test_execute_streams_with_ijson(self, mock_ijson, mock_body):
+        mock_ijson.items.return_value = iter([[0.1, 0.2]])
+
+        assert self._operator("results.embedding").execute({}) == [0.1, 0.2]
+
+        mock_ijson.items.assert_called_once_with(mock_body, "results.embedding", use_float=True)
+        mock_body.read.assert_not_called()
+
+    @pytest.mark.parametrize("response_extract_path", ["item", "results.item", "results.item.embedding"])
+    def test_item_segment_is_rejected(self, response_extract_path):
+        with pytest.raises(ValueError, match="Invalid response_extract_path"):
+            self._operator(response_extract_path)
+
+    @pytest.mark.parametrize(
+        "response_extract_path",
+        ["results.embedding", "results", "results.missing", "results.embedding.first", "inputTextTokenCount"],
+    )
+    def test_ijson_and_parsed_body_agree(self, mock_body, response_extract_path):
+        ijson = pytest.importorskip("ijson")
+
+        results = []
+        for ijson_module in (ijson, None):
+            mock_body.read.side_effect = io.BytesIO(json.dumps(self.NESTED_RESPONSE).encode()).read
+            with mock.patch("airflow.providers.amazon.aws.operators.bedrock.ijson", ijson_module):
+                results.append(self._operator(response_extract_path).execute({}))
+
+        assert results[0] == results[1]
+
+
+class TestBedrockInvokeModelOperatorCache:
+    @pytest.fixture
+    def mock_conn(self):
+        with mock.patch.object(BedrockRuntimeHook, "conn") as _conn:
+            _conn.invoke_model.side_effect = lambda **_: {"body": io.BytesIO(json.dumps(RESPONSE).encode())}
+            yield _conn
+
+    def _operator(self, cache_mode, cache_uri, **kwargs) -> BedrockInvokeModelOperator:
+        return BedrockInvokeModelOperator(
+            task_id="test_task",
+            model_id=MODEL_ID,
+            input_data=kwargs.pop("input_data", {"prompt": PROMPT}),
+            cache_mode=cache_mode,
+            cache_uri=cache_uri,
+            **kwargs,
+        )
+
+    def test_enabled_reuses_cached_response(self, mock_conn, tmp_path):
+        cache_uri = str(tmp_path / "cache.db")
+
+        assert self._operator("enabled", cache_uri).execute({}) == RESPONSE
+        assert self._operator("enabled", cache_uri).execute({}) == RESPONSE
+
+        mock_conn.invoke_model.assert_called_once()
+
+    def test_cache_key_depends_on_input(self, mock_conn, tmp_path):
+        cache_uri = str(tmp_path / "cache.db")
+
+        self._operator("enabled", cache_uri).execute({})
+        self._operator("enabled", cache_uri, input_data={"prompt": "Another question."}).execute({})
+
+        assert mock_conn.invoke_model.call_count == 2
+
+    def test_read_only_does_not_write(self, mock_conn, tmp_path):
+        cache_uri = str(tmp_path / "cache.db")
+
+        self._operator("read_only", cache_uri).execute({})
+        self._operator("read_only", cache_uri).execute({})
+
+        assert mock_conn.invoke_model.call_count == 2
+
+    def test_write_only_does_not_read(self, mock_conn, tmp_path):
+        cache_uri = str(tmp_path / "cache.db")
+
+        self._operator("write_only", cache_uri).execute({})
+        self._operator("write_only", cache_uri).execute({})
+        assert mock_conn.invoke_model.call_count == 2
+
+        assert self._operator("read_only", cache_uri).execute({}) == RESPONSE
+        assert mock_conn.invoke_model.call_count == 2
+
+    def test_replay(self, mock_conn, tmp_path):
+        cache_uri = str(tmp_path / "cache.db")
+
+        with pytest.raises(AirflowException, match="No cached Bedrock response found"):
+            self._operator("replay", cache_uri).execute({})
+        mock_conn.invoke_model.assert_not_called()
+
+        self._operator("write_only", cache_uri).execute({})
+        assert self._operator("replay", cache_uri).execute({}) == RESPONSE
+        mock_conn.invoke_model.assert_called_once()
+
+    def test_cached_response_is_extracted(self, mock_conn, tmp_path):
+        cache_uri = str(tmp_path / "cache.db")
+        self._operator("write_only", cache_uri).execute({})
+
+        result = self._operator("read_only", cache_uri, response_extract_path="embedding").execute({})
+
+        assert result == RESPONSE["embedding"]
+
+    @pytest.mark.parametrize("cache_nondeterministic, expected_calls", [(False, 2), (True, 1)])
+    def test_nonzero_temperature(self, mock_conn, tmp_path, cache_nondeterministic, expected_calls):
+        cache_uri = str(tmp_path / "cache.db")
+        input_data = {"prompt": PROMPT, "textGenerationConfig": {"temperature": 0.5}}
+
+        for _ in range(2):
+            self._operator(
+                "enabled", cache_uri, input_data=input_data, cache_nondeterministic=cache_nondeterministic
+            ).execute({})
+
+        assert mock_conn.invoke_model.call_count == expected_calls
+
+    def test_invalid_cache_mode(self):
+        with pytest.raises(ValueError, match="Invalid cache_mode"):
+            self._operator("sometimes", "cache.db")
+
+    def test_cache_uri_is_required(self):
+        with pytest.raises(ValueError, match="cache_uri is required"):
+            self._operator("enabled", None)
+
+
+class TestBedrockBatchInvokeModelOperator:
+    JOB_ARN = "arn:aws:bedrock:us-east-1:123456789012:model-invocation-job/abc123"
+    OUTPUT_KEY = "output/abc123/records.jsonl.out"
+    INPUT_RECORDS = [{"prompt": "first"}, {"prompt": "second"}]
+
+    @pytest.fixture(autouse=True)
+    def mock_conn(self):
+        with mock.patch.object(BedrockHook, "conn") as _conn:
+            _conn.create_model_invocation_job.return_value = {"jobArn": self.JOB_ARN}
+            yield _conn
+
+    @pytest.fixture(autouse=True)
+    def mock_s3_hook(self):
+        output = "\n".join(
+            [
+                json.dumps({"recordId": "00000000001", "modelOutput": {"generation": "second"}}),
+                json.dumps({"recordId": "00000000000", "modelOutput": {"generation": "first"}}),
+            ]
+        )
+        with mock.patch.object(S3Hook, "load_bytes") as mock_load_bytes:
+            with mock.patch.object(S3Hook, "read_key", return_value=output) as mock_read_key:
+                yield mock_load_bytes, mock_read_key
+
+    def _operator(self, **kwargs) -> BedrockBatchInvokeModelOperator:
+        return BedrockBatchInvokeModelOperator(
+            task_id="test_task",
+            job_name="test-job",
+            role_arn="arn:aws:iam::123456789012:role/test-role",
+            model_id=MODEL_ID,
+            input_records=self.INPUT_RECORDS,
+            s3_input_uri="s3://test-bucket/input/records.jsonl",
+            s3_output_uri="s3://test-bucket/output/",
+            **kwargs,
+        )
+
+    @mock.patch("airflow.providers.amazon.aws.operators.bedrock.sleep")
+    def test_execute(self, mock_sleep, mock_conn, mock_s3_hook):
+        mock_load_bytes, mock_read_key = mock_s3_hook
+        mock_conn.get_model_invocation_job.side_effect = [{"status": "InProgress"}, {"status": "Completed"}]
+
+        result = self._operator().execute({})
+
+        uploaded = mock_load_bytes.call_args.args[0].decode().splitlines()
+        assert [json.loads(line) for line in uploaded] == [
+            {"recordId": "00000000000", "modelInput": {"prompt": "first"}},
+            {"recordId": "00000000001", "modelInput": {"prompt": "second"}},
+        ]
+        assert mock_load_bytes.call_args.kwargs == {
+            "key": "input/records.jsonl",
+            "bucket_name": "test-bucket",
+            "replace": True,
+        }
+        mock_conn.create_model_invocation_job.assert_called_once_with(
+            jobName="test-job",
+            roleArn="arn:aws:iam::123456789012:role/test-role",
+            modelId=MODEL_ID,
+            inputDataConfig={"s3InputDataConfig": {"s3Uri": "s3://test-bucket/input/records.jsonl"}},
+            outputDataConfig={"s3OutputDataConfig": {"s3Uri": "s3://test-bucket/output/"}},
+        )
+        mock_conn.get_model_invocation_job.assert_called_with(jobIdentifier=self.JOB_ARN)
+        mock_sleep.assert_called_once()
+        mock_read_key.assert_called_once_with(key=self.OUTPUT_KEY, bucket_name="test-bucket")
+        assert [record["modelOutput"]["generation"] for record in result] == ["first", "second"]
+
+    @mock.patch("airflow.providers.amazon.aws.operators.bedrock.sleep")
+    def test_execute_fails_on_waiter_failure_status(self, mock_sleep, mock_conn, mock_s3_hook):
+        mock_conn.get_model_invocation_job.return_value = {"status": "Stopped"}
+
+        with pytest.raises(AirflowException, match="failed with status Stopped"):
+            self._operator().execute({})
+
+        mock_s3_hook[1].assert_not_called()
+
+    def test_execute_without_wait(self, mock_conn, mock_s3_hook):
+        assert self._operator(wait_for_completion=False).execute({}) == self.JOB_ARN
+
+        mock_conn.get_model_invocation_job.assert_not_called()
+        mock_s3_hook[1].assert_not_called()
+
+    def test_execute_deferrable(self):
+        with pytest.raises(TaskDeferred) as exc:
+            self._operator(deferrable=True, waiter_delay=10, waiter_max_attempts=5).execute({})
+
+        trigger = exc.value.trigger
+        assert isinstance(trigger, BedrockBatchInferenceCompletedTrigger)
+        assert exc.value.method_name == "execute_complete"
+        assert trigger.serialize()[1]["job_arn"] == self.JOB_ARN
+        assert trigger.waiter_delay == 10
+        assert trigger.attempts == 5
+
+    def test_execute_complete(self, mock_s3_hook):
+        result = self._operator().execute_complete({}, {"status": "success", "job_arn": self.JOB_ARN})
+
+        mock_s3_hook[1].assert_called_once_with(key=self.OUTPUT_KEY, bucket_name="test-bucket")
+        assert len(result) == 2
+
+    def test_execute_complete_error(self):
+        with pytest.raises(AirflowException, match="Error while running job"):
+            self._operator().execute_complete({}, {"status": "failure", "job_arn": self.JOB_ARN})
+
+
+class TestBedrockCreateDataSourcesOperator:
+    KNOWLEDGE_BASE_ID = "test-knowledge-base-id"
+    DATA_SOURCES = [
+        {"name": f"source-{i}", "dataSourceConfiguration": {"type": "S3", "s3Configuration": {}}}
+        for i in range(3)
+    ]
+
+    @pytest.fixture
+    def mock_conn(self):
+        with mock.patch.object(BedrockAgentHook, "conn") as _conn:
+            _conn.create_data_source.side_effect = lambda **kwargs: {
+                "dataSource": {"dataSourceId": f"id-{kwargs['name']}"}
+            }
+            yield _conn
+
+    def _operator(self, data_sources) -> BedrockCreateDataSourcesOperator:
+        return BedrockCreateDataSourcesOperator(
+            task_id="test_task",
+            knowledge_base_id=self.KNOWLEDGE_BASE_ID,
+            data_sources=data_sources,
+            max_workers=2,
+        )
+
+    def test_execute(self, mock_conn):
+        result = self._operator(self.DATA_SOURCES).execute({})
+
+        assert result == ["id-source-0", "id-source-1", "id-source-2"]
+        assert mock_conn.create_data_source.call_count == 3
+        for data_source in self.DATA_SOURCES:
+            mock_conn.create_data_source.assert_any_call(
+                knowledgeBaseId=self.KNOWLEDGE_BASE_ID, **data_source
+            )
+
+    def test_execute_without_data_sources(self, mock_conn):
+        assert self._operator([]).execute({}) == []
+
+        mock_conn.create_data_source.assert_not_called()
+
+    def test_execute_error(self, mock_conn):
+        mock_conn.create_data_source.side_effect = Exception("test failure message")
+
+        with pytest.raises(Exception, match="test failure message"):
+            self._operator(self.DATA_SOURCES).execute({})
+
+
+class TestBedrockCustomizeModelOperatorIdempotent:
+    JOB_NAME = "test-job"
+    JOB_ARN = "arn:aws:bedrock:us-east-1:123456789012:model-customization-job/test-job"
+
+    @pytest.fixture
+    def mock_conn(self):
+        with mock.patch.object(BedrockHook, "conn") as _conn:
+            _conn.create_model_customization_job.return_value = {
+                "jobArn": "arn:aws:bedrock:us-east-1:123456789012:model-customization-job/new-job",
+                "ResponseMetadata": {"HTTPStatusCode": 201},
+            }
+            yield _conn
+
+    def _operator(self, **kwargs) -> BedrockCustomizeModelOperator:
+        return BedrockCustomizeModelOperator(
+            task_id="test_task",
+            job_name=self.JOB_NAME,
+            custom_model_name="test-model",
+            role_arn="arn:aws:iam::123456789012:role/test-role",
+            base_model_id="amazon.titan-text-express-v1",
+            training_data_uri="s3://test-bucket/training.jsonl",
+            output_data_uri="s3://test-bucket/output/",
+            hyperparameters={"epochCount": "1"},
+            ensure_unique_job_name=False,
+            wait_for_completion=False,
+            **kwargs,
+        )
+
+    def _existing_jobs(self, mock_conn, *statuses):
+        mock_conn.get_paginator.return_value.paginate.return_value = [
+            {
+                "modelCustomizationJobSummaries": [
+                    {"jobName": self.JOB_NAME, "jobArn": self.JOB_ARN, "status": status}
+                    for status in statuses
+                ]
+            }
+        ]
+
+    @pytest.mark.parametrize("status", ["InProgress", "Completed"])
+    def test_reuses_existing_job(self, mock_conn, status):
+        self._existing_jobs(mock_conn, status)
+
+        assert self._operator(idempotent=True).execute({}) == self.JOB_ARN
+
+        mock_conn.get_paginator.assert_called_once_with("list_model_customization_jobs")
+        mock_conn.create_model_customization_job.assert_not_called()
+
+    @pytest.mark.parametrize("status", ["Failed", "Stopped"])
+    def test_creates_job_when_existing_job_is_not_reusable(self, mock_conn, status):
+        self._existing_jobs(mock_conn, status)
+
+        self._operator(idempotent=True).execute({})
+
+        mock_conn.create_model_customization_job.assert_called_once()
+
+    def test_not_idempotent_creates_job(self, mock_conn):
+        self._existing_jobs(mock_conn, "InProgress")
+
+        self._operator().execute({})
+
+        mock_conn.get_paginator.assert_not_called()
+        mock_conn.create_model_customization_job.assert_called_once()
+
+    def test_reuses_existing_job_deferrable(self, mock_conn):
+        self._existing_jobs(mock_conn, "InProgress")
+
+        with pytest.raises(TaskDeferred) as exc:
+            self._operator(idempotent=True, deferrable=True).execute({})
+
+        assert isinstance(exc.value.trigger, BedrockCustomizeModelCompletedTrigger)
+        assert exc.value.trigger.job_arn == self.JOB_ARN
+        mock_conn.create_model_customization_job.assert_not_called()
+
+    def test_execute_complete(self, mock_conn):
+        event = {"status": "success", "job_name": self.JOB_NAME, "job_arn": self.JOB_ARN}
+
+        assert self._operator().execute_complete({}, event) == self.JOB_ARN
+
+
+class TestBedrockCreateKnowledgeBaseOperatorIdempotent:
+    NAME = "test-knowledge-base"
+
+    @pytest.fixture
+    def mock_conn(self):
+        with mock.patch.object(BedrockAgentHook, "conn") as _conn:
+            _conn.create_knowledge_base.return_value = {"knowledgeBase": {"knowledgeBaseId": "new-id"}}
+            yield _conn
+
+    def _operator(self, **kwargs) -> BedrockCreateKnowledgeBaseOperator:
+        return BedrockCreateKnowledgeBaseOperator(
+            task_id="test_task",
+            name=self.NAME,
+            embedding_model_arn="arn:aws:bedrock:us-east-1::foundation-model/amazon.titan-embed-text-v1",
+            role_arn="arn:aws:iam::123456789012:role/test-role",
+            storage_config={"type": "OPENSEARCH_SERVERLESS"},
+            wait_for_completion=False,
+            **kwargs,
+        )
+
+    def _existing_knowledge_bases(self, mock_conn, *summaries):
+        mock_conn.get_paginator.return_value.paginate.return_value = [
+            {"knowledgeBaseSummaries": list(summaries)}
+        ]
+
+    @pytest.mark.parametrize("status", ["CREATING", "ACTIVE"])
+    def test_reuses_existing_knowledge_base(self, mock_conn, status):
+        self._existing_knowledge_bases(
+            mock_conn,
+            {"name": "other", "knowledgeBaseId": "other-id", "status": "ACTIVE"},
+            {"name": self.NAME, "knowledgeBaseId": "existing-id", "status": status},
+        )
+
+        assert self._operator(idempotent=True).execute({}) == "existing-id"
+
+        mock_conn.create_knowledge_base.assert_not_called()
+
+    def test_creates_knowledge_base_when_none_is_reusable(self, mock_conn):
+        self._existing_knowledge_bases(
+            mock_conn, {"name": self.NAME, "knowledgeBaseId": "failed-id", "status": "FAILED"}
+        )
+
+        assert self._operator(idempotent=True).execute({}) == "new-id"
+
+        mock_conn.create_knowledge_base.assert_called_once()
+
+    def test_not_idempotent_creates_knowledge_base(self, mock_conn):
+        assert self._operator().execute({}) == "new-id"
+
+        mock_conn.get_paginator.assert_not_called()
+
+
+class TestGetWaiterStatuses:
+    @pytest.mark.parametrize(
+        "hook_class, waiter_name, success_statuses, failure_statuses",
+        [
+            pytest.param(
+                BedrockHook,
+                "model_customization_job_complete",
+                {"Completed"},
+                {"Failed", "Stopping", "Stopped"},
+                id="customize-model",
+            ),
+            pytest.param(
+                BedrockHook,
+                "provisioned_model_throughput_complete",
+                {"InService"},
+                {"Failed"},
+                id="throughput",
+            ),
+            pytest.param(
+                BedrockAgentHook,
+                "knowledge_base_active",
+                {"ACTIVE"},
+                {"DELETING", "FAILED"},
+                id="knowledge-base",
+            ),
+        ],
+    )
+    def test_statuses_come_from_waiter_model(
+        self, hook_class, waiter_name, success_statuses, failure_statuses
+    ):
+        assert _get_waiter_statuses(hook_class(), waiter_name) == (success_statuses, failure_statuses)
+
+    def test_batch_inference_statuses(self):
+        success_statuses, failure_statuses = _get_waiter_statuses(BedrockHook(), "batch_inference_complete")
+
+        assert success_statuses == {"Completed", "PartiallyCompleted"}
+        assert failure_statuses == {"Failed", "Stopping", "Stopped", "Expired"}
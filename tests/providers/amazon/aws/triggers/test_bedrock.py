@@ -0,0 +1,140 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.providers.amazon.aws.hooks.bedrock import BedrockHook, BedrockRuntimeHook
+from airflow.providers.amazon.aws.triggers.bedrock import (
+    BedrockBatchInferenceCompletedTrigger,
+    BedrockInvokeModelTrigger,
+)
+from airflow.triggers.base import TriggerEvent
+
+TRIGGERS_MODULE = "airflow.providers.amazon.aws.triggers.bedrock"
+MODEL_ID = "amazon.titan-embed-text-v1"
+REQUEST_BODY = json.dumps({"inputText": "A very important question."})
+RESPONSE = {"embedding": [0.1, 0.2, 0.3], "inputTextTokenCount": 5}
+
+
+@pytest.fixture
+def mock_client():
+    with mock.patch.object(
+        BedrockRuntimeHook, "async_conn", new_callable=mock.PropertyMock
+    ) as mock_async_conn:
+        client = mock_async_conn.return_value.__aenter__.return_value
+        client.invoke_model = mock.AsyncMock(
+            return_value={"body": mock.Mock(read=mock.AsyncMock(return_value=json.dumps(RESPONSE).encode()))}
+        )
+        yield client
+
+
+class TestBedrockInvokeModelTrigger:
+    def test_serialize(self):
+        trigger = BedrockInvokeModelTrigger(
+            model_id=MODEL_ID,
+            body=REQUEST_BODY,
+            content_type="application/json",
+            response_extract_path="embedding",
+            aws_conn_id="aws_test",
+            region_name="us-east-1",
+        )
+
+        classpath, kwargs = trigger.serialize()
+
+        assert classpath == f"{TRIGGERS_MODULE}.BedrockInvokeModelTrigger"
+        assert kwargs == {
+            "model_id": MODEL_ID,
+            "body": REQUEST_BODY,
+            "content_type": "application/json",
+            "accept_type": None,
+            "response_extract_path": "embedding",
+            "aws_conn_id": "aws_test",
+            "region_name": "us-east-1",
+            "verify": None,
+            "botocore_config": None,
+        }
+        assert BedrockInvokeModelTrigger(**kwargs).serialize() == (classpath, kwargs)
+
+    @pytest.mark.asyncio
+    async def test_run_returns_full_body(self, mock_client):
+        trigger = BedrockInvokeModelTrigger(
+            model_id=MODEL_ID, body=REQUEST_BODY, accept_type="application/json"
+        )
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "success", "body": json.dumps(RESPONSE)})
+        mock_client.invoke_model.assert_awaited_once_with(
+            body=REQUEST_BODY, modelId=MODEL_ID, accept="application/json"
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_returns_only_extracted_response(self, mock_client):
+        trigger = BedrockInvokeModelTrigger(
+            model_id=MODEL_ID, body=REQUEST_BODY, response_extract_path="embedding"
+        )
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "success", "response": RESPONSE["embedding"]})
+
+    @pytest.mark.asyncio
+    async def test_run_error(self, mock_client):
+        mock_client.invoke_model.side_effect = Exception("test failure message")
+        trigger = BedrockInvokeModelTrigger(model_id=MODEL_ID, body=REQUEST_BODY)
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "error", "message": "test failure message"})
+
+
+class TestBedrockBatchInferenceCompletedTrigger:
+    JOB_ARN = "arn:aws:bedrock:us-east-1:123456789012:model-invocation-job/abc123"
+
+    def test_serialize(self):
+        trigger = BedrockBatchInferenceCompletedTrigger(
+            job_arn=self.JOB_ARN, waiter_delay=10, waiter_max_attempts=5, aws_conn_id="aws_test"
+        )
+
+        classpath, kwargs = trigger.serialize()
+
+        assert classpath == f"{TRIGGERS_MODULE}.BedrockBatchInferenceCompletedTrigger"
+        assert kwargs == {
+            "job_arn": self.JOB_ARN,
+            "waiter_delay": 10,
+            "waiter_max_attempts": 5,
+            "aws_conn_id": "aws_test",
+        }
+        assert isinstance(trigger.hook(), BedrockHook)
+
+    @pytest.mark.asyncio
+    @mock.patch.object(BedrockHook, "get_waiter")
+    @mock.patch.object(BedrockHook, "async_conn")
+    async def test_run_success(self, mock_async_conn, mock_get_waiter):
+        mock_async_conn.__aenter__.return_value = mock.MagicMock()
+        mock_get_waiter().wait = mock.AsyncMock()
+        trigger = BedrockBatchInferenceCompletedTrigger(job_arn=self.JOB_ARN)
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "success", "job_arn": self.JOB_ARN})
+        assert mock_get_waiter().wait.call_count == 1
+        mock_get_waiter.assert_called_with("batch_inference_complete", deferrable=True, client=mock.ANY)
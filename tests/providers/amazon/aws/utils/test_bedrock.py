@@ -0,0 +1,49 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.providers.amazon.aws.utils.bedrock import dumps_body, extract_path, loads_body
+
+BEDROCK_UTILS_PATH = "airflow.providers.amazon.aws.utils.bedrock.{}"
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        pytest.param("embedding", [0.1, 0.2], id="top-level-key"),
+        pytest.param("results.embedding", [0.3], id="nested-key"),
+        pytest.param("missing", None, id="missing-key"),
+        pytest.param("embedding.0", None, id="list-segment"),
+    ],
+)
+def test_extract_path(path, expected):
+    data = {"embedding": [0.1, 0.2], "results": {"embedding": [0.3]}}
+
+    assert extract_path(data, path) == expected
+
+
+@mock.patch(BEDROCK_UTILS_PATH.format("orjson"), None)
+def test_dumps_and_loads_body_without_orjson():
+    body = dumps_body({"prompt": "hello"})
+
+    assert body == json.dumps({"prompt": "hello"})
+    assert loads_body(body.encode()) == {"prompt": "hello"}
@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException
+from airflow.providers.apache.kafka.hooks import produce
+from airflow.providers.apache.kafka.hooks.produce import KafkaProducerHook
+
+CONFIG = {"bootstrap.servers": "localhost:9092"}
+
+
+@pytest.fixture(autouse=True)
+def clear_producer_cache():
+    produce._PRODUCER_CACHE.clear()
+    yield
+    produce._PRODUCER_CACHE.clear()
+
+
+@mock.patch("airflow.providers.apache.kafka.hooks.produce.Producer")
+class TestProducerCache:
+    def test_producer_is_shared_between_hooks(self, mock_producer):
+        mock_producer.side_effect = lambda config: mock.MagicMock()
+
+        first = KafkaProducerHook()._get_client(CONFIG)
+        second = KafkaProducerHook()._get_client(CONFIG)
+
+        assert first is second
+        mock_producer.assert_called_once()
+
+    @mock.patch("airflow.providers.apache.kafka.hooks.produce.monotonic")
+    def test_expired_producer_is_flushed_and_replaced(self, mock_monotonic, mock_producer):
+        mock_producer.side_effect = lambda config: mock.MagicMock()
+        mock_monotonic.side_effect = [0, produce.PRODUCER_CACHE_TTL + 1]
+
+        first = KafkaProducerHook()._get_client(CONFIG)
+        second = KafkaProducerHook()._get_client(CONFIG)
+
+        assert first is not second
+        first.flush.assert_called_once_with()
+        assert [producer for producer, _ in produce._PRODUCER_CACHE.values()] == [second]
+
+    def test_producer_with_callbacks_is_not_cached(self, mock_producer):
+        mock_producer.side_effect = lambda config: mock.MagicMock()
+        config = {**CONFIG, "error_cb": lambda err: None}
+
+        first = KafkaProducerHook()._get_client(config)
+        second = KafkaProducerHook()._get_client(config)
+
+        assert first is not second
+        assert not produce._PRODUCER_CACHE
+
+    def test_close_evicts_and_flushes_producer(self, mock_producer):
+        mock_producer.side_effect = lambda config: mock.MagicMock()
+        hook = KafkaProducerHook()
+        with mock.patch.object(KafkaProducerHook, "get_connection") as mock_get_connection:
+            mock_get_connection.return_value.extra_dejson = CONFIG
+            producer = hook.get_producer()
+
+        hook.close(timeout=5)
+
+        producer.flush.assert_called_once_with(5)
+        assert not produce._PRODUCER_CACHE
+        assert KafkaProducerHook()._get_client(CONFIG) is not producer
+
+
+class TestSendMessages:
+    @pytest.fixture
+    def producer(self):
+        with mock.patch.object(KafkaProducerHook, "get_producer") as mock_get_producer:
+            yield mock_get_producer.return_value
+
+    def test_send_messages(self, producer):
+        producer.flush.return_value = 0
+
+        remaining = KafkaProducerHook().send_messages("topic", ["a", "b"], key_fn=str.upper)
+
+        assert remaining == 0
+        producer.produce.assert_has_calls(
+            [mock.call("topic", value="a", key="A"), mock.call("topic", value="b", key="B")]
+        )
+        producer.flush.assert_called_once_with(-1)
+
+    def test_retries_while_queue_is_full(self, producer):
+        producer.produce.side_effect = [BufferError, BufferError, None, None]
+
+        KafkaProducerHook().send_messages("topic", ["a", "b"])
+
+        assert producer.produce.call_count == 4
+        producer.poll.assert_has_calls([mock.call(1), mock.call(1), mock.call(0)])
+
+    @mock.patch("airflow.providers.apache.kafka.hooks.produce.monotonic")
+    def test_raises_when_queue_stays_full(self, mock_monotonic, producer):
+        producer.produce.side_effect = [None, BufferError, BufferError, BufferError]
+        mock_monotonic.side_effect = [0, 5, 11]
+
+        with pytest.raises(AirflowException, match="only 1 messages were sent"):
+            KafkaProducerHook().send_messages("topic", ["a", "b"], flush_timeout=3, queue_full_timeout=10)
+
+        assert producer.produce.call_count == 4
+        producer.flush.assert_called_once_with(3)
@@ -0,0 +1,150 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException, AirflowSkipException, TaskDeferred
+from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
+from airflow.providers.databricks.sensors.databricks_partition import DatabricksPartitionSensor
+from airflow.providers.databricks.triggers.databricks import DatabricksPartitionTrigger
+
+TASK_ID = "db-partition-sensor"
+DEFAULT_CONN_ID = "databricks_default"
+
+DEFAULT_SCHEMA = "schema1"
+DEFAULT_CATALOG = "catalog1"
+DEFAULT_TABLE = "table1"
+DEFAULT_HTTP_PATH = "/sql/1.0/warehouses/xxxxx"
+DEFAULT_SQL_WAREHOUSE = "sql_warehouse_default"
+DEFAULT_PARTITION = {"date": "2023-01-01"}
+PARTITION_COLUMNS = ["date"]
+TABLE_DETAIL = [("format", "id", "name", "description", "location", "created", "modified", PARTITION_COLUMNS)]
+
+
+def _run_hook(rows):
+    """Return a replacement for DatabricksSqlHook.run which only returns rows when a handler is passed."""
+
+    def run(sql, parameters=None, handler=None):
+        if handler is None:
+            return None
+        if sql.startswith("DESCRIBE DETAIL"):
+            return TABLE_DETAIL
+        return rows
+
+    return run
+
+
+class TestDatabricksPartitionSensor:
+    def setup_method(self):
+        self.partition_sensor = DatabricksPartitionSensor(
+            task_id=TASK_ID,
+            databricks_conn_id=DEFAULT_CONN_ID,
+            sql_warehouse_name=DEFAULT_SQL_WAREHOUSE,
+            catalog=DEFAULT_CATALOG,
+            schema=DEFAULT_SCHEMA,
+            table_name=DEFAULT_TABLE,
+            partitions=DEFAULT_PARTITION,
+            http_path=DEFAULT_HTTP_PATH,
+        )
+
+    def test_partition_values_are_bound_as_parameters(self):
+        parameters: dict = {}
+        with mock.patch.object(DatabricksSqlHook, "run", side_effect=_run_hook([(1,)])):
+            sql = self.partition_sensor._generate_partition_query(
+                prefix="SELECT 1 FROM table1 WHERE",
+                suffix=" LIMIT 1",
+                joiner_val=" AND ",
+                opts={"date": "2023-01-01'; DROP TABLE table1; --"},
+                table_name="table1",
+                parameters=parameters,
+            )
+
+        assert sql == "SELECT 1 FROM table1 WHERE date=%(partition_0)s  LIMIT 1"
+        assert parameters == {"partition_0": "2023-01-01'; DROP TABLE table1; --"}
+
+    def test_partition_values_are_inlined_without_parameters(self):
+        with mock.patch.object(DatabricksSqlHook, "run", side_effect=_run_hook([(1,)])):
+            sql = self.partition_sensor._generate_partition_query(
+                prefix="SELECT 1 FROM table1 WHERE",
+                suffix=" LIMIT 1",
+                joiner_val=" AND ",
+                opts={"date": "2023-01-01"},
+                table_name="table1",
+            )
+
+        assert sql == "SELECT 1 FROM table1 WHERE date='2023-01-01'  LIMIT 1"
+
+    def test_partition_query_is_run_with_parameters(self):
+        with mock.patch.object(DatabricksSqlHook, "run", side_effect=_run_hook([(1,)])) as mock_run:
+            assert self.partition_sensor.poke(context={})
+
+        table_name = f"{DEFAULT_CATALOG}.{DEFAULT_SCHEMA}.{DEFAULT_TABLE}"
+        mock_run.assert_called_with(
+            f"SELECT 1 FROM {table_name} WHERE date=%(partition_0)s  LIMIT 1",
+            parameters={"partition_0": "2023-01-01"},
+            handler=mock.ANY,
+        )
+
+    @pytest.mark.parametrize("do_xcom_push", [True, False])
+    def test_poke_finds_partition_regardless_of_do_xcom_push(self, do_xcom_push):
+        self.partition_sensor.do_xcom_push = do_xcom_push
+        with mock.patch.object(DatabricksSqlHook, "run", side_effect=_run_hook([(1,)])):
+            assert self.partition_sensor.poke(context={})
+
+    @pytest.mark.parametrize("do_xcom_push", [True, False])
+    def test_execute_deferrable_does_not_defer_when_partition_exists(self, do_xcom_push):
+        self.partition_sensor.deferrable = True
+        self.partition_sensor.do_xcom_push = do_xcom_push
+        with mock.patch.object(DatabricksSqlHook, "run", side_effect=_run_hook([(1,)])), mock.patch.object(
+            self.partition_sensor, "defer"
+        ) as mock_defer:
+            assert self.partition_sensor.execute(context={}) is None
+
+        mock_defer.assert_not_called()
+
+    @pytest.mark.parametrize("do_xcom_push", [True, False])
+    def test_execute_deferrable_defers_when_partition_is_missing(self, do_xcom_push):
+        self.partition_sensor.deferrable = True
+        self.partition_sensor.do_xcom_push = do_xcom_push
+        with mock.patch.object(DatabricksSqlHook, "run", side_effect=_run_hook([])):
+            with pytest.raises(TaskDeferred) as exc:
+                self.partition_sensor.execute(context={})
+
+        trigger = exc.value.trigger
+        assert isinstance(trigger, DatabricksPartitionTrigger)
+        assert exc.value.method_name == "execute_complete"
+        assert trigger.sql == self.partition_sensor._partition_sql
+        assert trigger.parameters == {"partition_0": "2023-01-01"}
+        assert trigger.databricks_conn_id == DEFAULT_CONN_ID
+        assert trigger.polling_period_seconds == self.partition_sensor.poke_interval
+
+    def test_execute_complete_success(self):
+        assert self.partition_sensor.execute_complete(context={}, event={"status": "success"}) is None
+
+    @pytest.mark.parametrize(
+        "soft_fail, expected_exception", [(False, AirflowException), (True, AirflowSkipException)]
+    )
+    @pytest.mark.parametrize("event", [None, {"status": "error", "message": "test failure message"}])
+    def test_execute_complete_failure(self, soft_fail, expected_exception, event):
+        self.partition_sensor.soft_fail = soft_fail
+        with pytest.raises(expected_exception, match="Error while checking partition"):
+            self.partition_sensor.execute_complete(context={}, event=event)
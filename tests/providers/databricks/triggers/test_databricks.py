@@ -0,0 +1,93 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.providers.databricks.triggers.databricks import DatabricksPartitionTrigger
+from airflow.triggers.base import TriggerEvent
+
+DEFAULT_CONN_ID = "databricks_default"
+SQL = "SELECT 1 FROM catalog1.schema1.table1 WHERE date=%(partition_0)s LIMIT 1"
+PARAMETERS = {"partition_0": "2023-01-01"}
+POLLING_PERIOD_SECONDS = 1
+
+
+class TestDatabricksPartitionTrigger:
+    def setup_method(self):
+        self.trigger = DatabricksPartitionTrigger(
+            sql=SQL,
+            parameters=PARAMETERS,
+            databricks_conn_id=DEFAULT_CONN_ID,
+            http_path="/sql/1.0/warehouses/xxxxx",
+            catalog="catalog1",
+            schema="schema1",
+            polling_period_seconds=POLLING_PERIOD_SECONDS,
+        )
+
+    def test_serialize(self):
+        assert self.trigger.serialize() == (
+            "airflow.providers.databricks.triggers.databricks.DatabricksPartitionTrigger",
+            {
+                "sql": SQL,
+                "databricks_conn_id": DEFAULT_CONN_ID,
+                "parameters": PARAMETERS,
+                "http_path": "/sql/1.0/warehouses/xxxxx",
+                "sql_warehouse_name": None,
+                "session_configuration": None,
+                "http_headers": None,
+                "catalog": "catalog1",
+                "schema": "schema1",
+                "client_parameters": {},
+                "polling_period_seconds": POLLING_PERIOD_SECONDS,
+                "caller": "DatabricksPartitionTrigger",
+            },
+        )
+
+    @pytest.mark.asyncio
+    @mock.patch("airflow.providers.databricks.hooks.databricks_sql.DatabricksSqlHook.run")
+    async def test_run_success(self, mock_run):
+        mock_run.return_value = [(1,)]
+
+        event = await self.trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "success"})
+        mock_run.assert_called_once_with(SQL, parameters=PARAMETERS, handler=mock.ANY)
+
+    @pytest.mark.asyncio
+    @mock.patch("airflow.providers.databricks.triggers.databricks.asyncio.sleep")
+    @mock.patch("airflow.providers.databricks.hooks.databricks_sql.DatabricksSqlHook.run")
+    async def test_run_polls_until_partition_exists(self, mock_run, mock_sleep):
+        mock_run.side_effect = [[], [], [(1,)]]
+
+        event = await self.trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "success"})
+        assert mock_run.call_count == 3
+        mock_sleep.assert_called_with(POLLING_PERIOD_SECONDS)
+
+    @pytest.mark.asyncio
+    @mock.patch("airflow.providers.databricks.hooks.databricks_sql.DatabricksSqlHook.run")
+    async def test_run_error(self, mock_run):
+        mock_run.side_effect = Exception("test failure message")
+
+        event = await self.trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "error", "message": "test failure message"})
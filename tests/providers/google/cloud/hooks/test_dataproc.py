@@ -0,0 +1,70 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+from airflow.providers.google.cloud.hooks.dataproc import DataprocAsyncHook
+
+BASE_STRING = "airflow.providers.google.common.hooks.base_google.{}"
+DATAPROC_STRING = "airflow.providers.google.cloud.hooks.dataproc.{}"
+GCP_LOCATION = "global"
+GCP_REGION = "us-central1"
+
+
+class TestDataprocAsyncHookClients:
+    def setup_method(self):
+        with mock.patch(BASE_STRING.format("GoogleBaseHook.__init__")):
+            self.hook = DataprocAsyncHook(gcp_conn_id="test")
+
+    @mock.patch(DATAPROC_STRING.format("DataprocAsyncHook.get_credentials"))
+    @mock.patch(DATAPROC_STRING.format("ClusterControllerAsyncClient"))
+    def test_client_is_created_once_per_region(self, mock_client, mock_get_credentials):
+        first = self.hook.get_cluster_client(region=GCP_REGION)
+        second = self.hook.get_cluster_client(region=GCP_REGION)
+
+        assert first is second
+        mock_client.assert_called_once()
+        mock_get_credentials.assert_called_once_with()
+        assert mock_client.call_args.kwargs["client_options"].api_endpoint == (
+            f"{GCP_REGION}-dataproc.googleapis.com:443"
+        )
+
+    @mock.patch(DATAPROC_STRING.format("DataprocAsyncHook.get_credentials"))
+    @mock.patch(DATAPROC_STRING.format("ClusterControllerAsyncClient"))
+    def test_clients_are_not_shared_across_regions(self, mock_client, mock_get_credentials):
+        mock_client.side_effect = lambda **_: mock.MagicMock()
+
+        regional_client = self.hook.get_cluster_client(region=GCP_REGION)
+        global_client = self.hook.get_cluster_client(region=GCP_LOCATION)
+
+        assert regional_client is not global_client
+        assert mock_client.call_count == 2
+        assert mock_client.call_args.kwargs["client_options"] is None
+
+    @mock.patch(DATAPROC_STRING.format("DataprocAsyncHook.get_credentials"))
+    @mock.patch(DATAPROC_STRING.format("JobControllerAsyncClient"))
+    @mock.patch(DATAPROC_STRING.format("ClusterControllerAsyncClient"))
+    def test_clients_are_not_shared_across_client_classes(
+        self, mock_cluster_client, mock_job_client, mock_get_credentials
+    ):
+        cluster_client = self.hook.get_cluster_client(region=GCP_REGION)
+        job_client = self.hook.get_job_client(region=GCP_REGION)
+
+        assert cluster_client is mock_cluster_client.return_value
+        assert job_client is mock_job_client.return_value
@@ -0,0 +1,158 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import itertools
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import MethodNotImplemented
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+
+from airflow.exceptions import AirflowException
+from airflow.providers.google.cloud.hooks.dataproc_metastore import (
+    DataprocMetastoreAsyncHook,
+    DataprocMetastoreHook,
+)
+
+TEST_GCP_CONN_ID: str = "test-gcp-conn-id"
+BASE_STRING = "airflow.providers.google.common.hooks.base_google.{}"
+DATAPROC_METASTORE_STRING = "airflow.providers.google.cloud.hooks.dataproc_metastore.{}"
+TEST_OPERATION_NAME = "projects/test-project/locations/test-location/operations/test-operation"
+TEST_RESPONSE = b"serialized response"
+
+
+def _operation(done: bool = True, error_message: str = "") -> operations_pb2.Operation:
+    operation = operations_pb2.Operation(name=TEST_OPERATION_NAME, done=done)
+    if error_message:
+        operation.error.CopyFrom(status_pb2.Status(code=13, message=error_message))
+    elif done:
+        operation.response.value = TEST_RESPONSE
+    return operation
+
+
+class TestDataprocMetastoreHook:
+    def setup_method(self):
+        with mock.patch(BASE_STRING.format("GoogleBaseHook.__init__")):
+            self.hook = DataprocMetastoreHook(gcp_conn_id=TEST_GCP_CONN_ID)
+        self.operation = mock.MagicMock()
+        self.operation.operation = _operation(done=False)
+
+    @mock.patch(DATAPROC_METASTORE_STRING.format("time.sleep"))
+    @mock.patch(DATAPROC_METASTORE_STRING.format("DataprocMetastoreHook.get_dataproc_metastore_client"))
+    def test_wait_for_operation_response_uses_wait_operation(self, mock_client, mock_sleep):
+        mock_client.return_value.wait_operation.side_effect = [_operation(done=False), _operation()]
+
+        response = self.hook.wait_for_operation_response(timeout=None, operation=self.operation)
+
+        assert response == TEST_RESPONSE
+        assert mock_client.return_value.wait_operation.call_count == 2
+        self.operation.done.assert_not_called()
+        self.operation.result.assert_not_called()
+
+    @mock.patch(DATAPROC_METASTORE_STRING.format("time.sleep"))
+    @mock.patch(DATAPROC_METASTORE_STRING.format("DataprocMetastoreHook.get_dataproc_metastore_client"))
+    def test_wait_for_operation_response_sleeps_when_wait_operation_returns_early(
+        self, mock_client, mock_sleep
+    ):
+        mock_client.return_value.wait_operation.side_effect = [
+            _operation(done=False),
+            _operation(done=False),
+            _operation(),
+        ]
+
+        response = self.hook.wait_for_operation_response(timeout=None, operation=self.operation)
+
+        assert response == TEST_RESPONSE
+        assert mock_client.return_value.wait_operation.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @mock.patch(DATAPROC_METASTORE_STRING.format("time.sleep"))
+    @mock.patch(DATAPROC_METASTORE_STRING.format("time.monotonic"))
+    @mock.patch(DATAPROC_METASTORE_STRING.format("DataprocMetastoreHook.get_dataproc_metastore_client"))
+    def test_wait_for_operation_response_does_not_sleep_after_full_wait(
+        self, mock_client, mock_monotonic, mock_sleep
+    ):
+        mock_client.return_value.wait_operation.side_effect = [_operation(done=False), _operation()]
+        mock_monotonic.side_effect = itertools.count(step=100).__next__
+
+        response = self.hook.wait_for_operation_response(timeout=None, operation=self.operation)
+
+        assert response == TEST_RESPONSE
+        mock_sleep.assert_not_called()
+
+    @mock.patch(DATAPROC_METASTORE_STRING.format("DataprocMetastoreHook.get_dataproc_metastore_client"))
+    def test_wait_for_operation_response_error(self, mock_client):
+        mock_client.return_value.wait_operation.return_value = _operation(error_message="test error")
+
+        with pytest.raises(AirflowException, match="test error"):
+            self.hook.wait_for_operation_response(timeout=None, operation=self.operation)
+
+        self.operation.done.assert_not_called()
+
+    @mock.patch(DATAPROC_METASTORE_STRING.format("time.sleep"))
+    @mock.patch(DATAPROC_METASTORE_STRING.format("DataprocMetastoreHook.get_dataproc_metastore_client"))
+    def test_wait_for_operation_response_falls_back_to_polling(self, mock_client, mock_sleep):
+        mock_client.return_value.wait_operation.side_effect = MethodNotImplemented("not implemented")
+
+        def refresh():
+            self.operation.operation = _operation()
+            return True
+
+        self.operation.done.side_effect = refresh
+
+        response = self.hook.wait_for_operation_response(timeout=None, operation=self.operation)
+
+        assert response == TEST_RESPONSE
+        mock_client.return_value.wait_operation.assert_called_once()
+        self.operation.done.assert_called_once_with()
+        mock_sleep.assert_called_once()
+
+    def test_wait_for_operation(self):
+        result = self.hook.wait_for_operation(timeout=None, operation=self.operation)
+
+        assert result == self.operation.result.return_value
+        self.operation.result.assert_called_once_with(timeout=None)
+
+    def test_wait_for_operation_error(self):
+        self.operation.result.side_effect = Exception("test error")
+        self.operation.exception.return_value = "test error"
+
+        with pytest.raises(AirflowException, match="test error"):
+            self.hook.wait_for_operation(timeout=None, operation=self.operation)
+
+
+class TestDataprocMetastoreAsyncHook:
+    def setup_method(self):
+        with mock.patch(BASE_STRING.format("GoogleBaseHook.__init__")):
+            self.hook = DataprocMetastoreAsyncHook(gcp_conn_id=TEST_GCP_CONN_ID)
+
+    @mock.patch(DATAPROC_METASTORE_STRING.format("DataprocMetastoreAsyncHook.get_credentials"))
+    @mock.patch("google.cloud.metastore_v1.DataprocMetastoreAsyncClient")
+    def test_client_is_created_once(self, mock_client, mock_get_credentials):
+        first = self.hook.get_dataproc_metastore_client()
+        second = self.hook.get_dataproc_metastore_client()
+
+        assert first is second
+        mock_client.assert_called_once_with(
+            credentials=mock_get_credentials.return_value,
+            client_info=mock.ANY,
+            client_options=mock.ANY,
+        )
+        mock_get_credentials.assert_called_once_with()
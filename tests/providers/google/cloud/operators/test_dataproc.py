@@ -0,0 +1,114 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import TaskDeferred
+from airflow.providers.google.cloud.operators.dataproc import (
+    DataprocDeleteClusterOperator,
+    DataprocSubmitJobOperator,
+)
+from airflow.providers.google.cloud.triggers.dataproc import (
+    DataprocDeleteClusterTrigger,
+    DataprocSubmitTrigger,
+)
+
+DATAPROC_PATH = "airflow.providers.google.cloud.operators.dataproc.{}"
+TASK_ID = "task-id"
+GCP_PROJECT = "test-project"
+GCP_REGION = "test-location"
+GCP_CONN_ID = "test-conn"
+TEST_JOB_ID = "test-job"
+TEST_CLUSTER_NAME = "test-cluster"
+TEST_OPERATION_NAME = "projects/test-project/regions/test-location/operations/test-operation"
+JOB = {
+    "placement": {"cluster_name": "cluster"},
+    "pyspark_job": {"main_python_file_uri": "gs://bucket/main.py"},
+}
+
+
+class TestDataprocSubmitJobOperatorPolling:
+    @mock.patch(DATAPROC_PATH.format("DataprocHook"))
+    def test_execute_deferrable_passes_polling_settings(self, mock_hook):
+        mock_hook.return_value.submit_job.return_value.reference.job_id = TEST_JOB_ID
+        op = DataprocSubmitJobOperator(
+            task_id=TASK_ID,
+            region=GCP_REGION,
+            project_id=GCP_PROJECT,
+            job=JOB,
+            gcp_conn_id=GCP_CONN_ID,
+            deferrable=True,
+            polling_interval_seconds=10,
+            polling_backoff_factor=1.5,
+            max_polling_interval_seconds=120,
+            polling_jitter=0.1,
+        )
+
+        with pytest.raises(TaskDeferred) as exc:
+            op.execute(mock.MagicMock())
+
+        trigger = exc.value.trigger
+        assert isinstance(trigger, DataprocSubmitTrigger)
+        assert trigger.polling_interval_seconds == 10
+        assert trigger.backoff_factor == 1.5
+        assert trigger.max_polling_interval_seconds == 120
+        assert trigger.jitter == 0.1
+
+    @mock.patch(DATAPROC_PATH.format("DataprocHook"))
+    def test_execute_deferrable_keeps_constant_polling_by_default(self, mock_hook):
+        mock_hook.return_value.submit_job.return_value.reference.job_id = TEST_JOB_ID
+        op = DataprocSubmitJobOperator(
+            task_id=TASK_ID,
+            region=GCP_REGION,
+            project_id=GCP_PROJECT,
+            job=JOB,
+            gcp_conn_id=GCP_CONN_ID,
+            deferrable=True,
+        )
+
+        with pytest.raises(TaskDeferred) as exc:
+            op.execute(mock.MagicMock())
+
+        trigger = exc.value.trigger
+        assert trigger.backoff_factor == 1.0
+        assert trigger.jitter == 0.0
+
+
+class TestDataprocDeleteClusterOperatorDeferrable:
+    @mock.patch(DATAPROC_PATH.format("DataprocHook"))
+    def test_execute_deferrable_passes_operation_name(self, mock_hook):
+        mock_hook.return_value.delete_cluster.return_value.operation.name = TEST_OPERATION_NAME
+        op = DataprocDeleteClusterOperator(
+            task_id=TASK_ID,
+            region=GCP_REGION,
+            project_id=GCP_PROJECT,
+            cluster_name=TEST_CLUSTER_NAME,
+            gcp_conn_id=GCP_CONN_ID,
+            deferrable=True,
+        )
+
+        with pytest.raises(TaskDeferred) as exc:
+            op.execute(mock.MagicMock())
+
+        trigger = exc.value.trigger
+        assert isinstance(trigger, DataprocDeleteClusterTrigger)
+        assert trigger.operation_name == TEST_OPERATION_NAME
+        mock_hook.return_value.wait_for_operation.assert_not_called()
@@ -0,0 +1,226 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import GoogleAPICallError
+
+from airflow.exceptions import AirflowException
+from airflow.providers.google.cloud.operators.dataproc_metastore import (
+    DataprocMetastoreCreateMetadataImportsOperator,
+    DataprocMetastoreDeleteServiceOperator,
+    DataprocMetastoreGetServiceOperator,
+)
+
+TASK_ID: str = "dataproc_metastore_{}"
+GCP_PROJECT_ID: str = "test-gcp-project-id"
+GCP_CONN_ID: str = "test-gcp-conn-id"
+GCP_LOCATION: str = "test-location"
+TEST_SERVICE_ID: str = "test-service-id"
+IMPERSONATION_CHAIN = ["ACCOUNT_1", "ACCOUNT_2", "ACCOUNT_3"]
+
+DATAPROC_METASTORE_PATH = "airflow.providers.google.cloud.operators.dataproc_metastore.{}"
+
+
+class TestDataprocMetastoreGetServiceOperator:
+    def _operator(self, **kwargs) -> DataprocMetastoreGetServiceOperator:
+        return DataprocMetastoreGetServiceOperator(
+            task_id=TASK_ID.format("get_service"),
+            region=GCP_LOCATION,
+            project_id=GCP_PROJECT_ID,
+            service_id=TEST_SERVICE_ID,
+            gcp_conn_id=GCP_CONN_ID,
+            impersonation_chain=IMPERSONATION_CHAIN,
+            **kwargs,
+        )
+
+    @mock.patch("google.cloud.metastore_v1.types.Service")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute_persists_link(self, mock_hook, mock_service):
+        context = mock.MagicMock()
+
+        self._operator().execute(context=context)
+
+        context["ti"].xcom_push.assert_called_once_with(
+            key="conf",
+            value=(
+                f"https://console.cloud.google.com/dataproc/metastore/services/{GCP_LOCATION}/"
+                f"{TEST_SERVICE_ID}/config?project={GCP_PROJECT_ID}"
+            ),
+            execution_date=None,
+        )
+
+    @mock.patch.dict(os.environ, {"AIRFLOW__GOOGLE_DATAPROC_METASTORE__PERSIST_EXTRA_LINKS": "False"})
+    @mock.patch("google.cloud.metastore_v1.types.Service")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute_skips_link_when_persist_extra_links_is_disabled(self, mock_hook, mock_service):
+        context = mock.MagicMock()
+
+        self._operator().execute(context=context)
+
+        context["ti"].xcom_push.assert_not_called()
+
+    @mock.patch("google.cloud.metastore_v1.types.Service")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute_returns_whole_service(self, mock_hook, mock_service):
+        mock_service.to_dict.return_value = {"name": "test-name", "state": 2, "hive_metastore_config": {}}
+
+        result = self._operator(metadata=[("key", "value")]).execute(context=mock.MagicMock())
+
+        assert result == {"name": "test-name", "state": 2, "hive_metastore_config": {}}
+        mock_hook.return_value.get_service.assert_called_once_with(
+            region=GCP_LOCATION,
+            project_id=GCP_PROJECT_ID,
+            service_id=TEST_SERVICE_ID,
+            retry=mock.ANY,
+            timeout=None,
+            metadata=[("key", "value")],
+        )
+        mock_service.to_dict.assert_called_once_with(mock_hook.return_value.get_service.return_value)
+
+    @mock.patch("google.cloud.metastore_v1.types.Service")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute_with_response_fields(self, mock_hook, mock_service):
+        mock_service.to_dict.return_value = {"name": "test-name", "state": 2, "hive_metastore_config": {}}
+
+        result = self._operator(
+            metadata=[("key", "value")], response_fields=["name", "state", "endpoint_uri"]
+        ).execute(context=mock.MagicMock())
+
+        assert result == {"name": "test-name", "state": 2}
+        assert mock_hook.return_value.get_service.call_args.kwargs["metadata"] == (
+            ("key", "value"),
+            ("x-goog-fieldmask", "name,state,endpoint_uri"),
+        )
+
+
+class TestDataprocMetastoreDeleteServiceOperator:
+    def setup_method(self):
+        self.operator = DataprocMetastoreDeleteServiceOperator(
+            task_id=TASK_ID.format("delete_service"),
+            region=GCP_LOCATION,
+            project_id=GCP_PROJECT_ID,
+            service_id=TEST_SERVICE_ID,
+            gcp_conn_id=GCP_CONN_ID,
+            impersonation_chain=IMPERSONATION_CHAIN,
+        )
+
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_on_kill_cancels_operation(self, mock_hook):
+        operation = mock_hook.return_value.delete_service.return_value
+
+        self.operator.execute(context=mock.MagicMock())
+        self.operator.on_kill()
+
+        mock_hook.return_value.wait_for_operation.assert_called_once_with(None, operation)
+        operation.cancel.assert_called_once_with()
+
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_on_kill_does_not_cancel_when_cancel_on_kill_is_disabled(self, mock_hook):
+        operation = mock_hook.return_value.delete_service.return_value
+        self.operator.cancel_on_kill = False
+
+        self.operator.execute(context=mock.MagicMock())
+        self.operator.on_kill()
+
+        operation.cancel.assert_not_called()
+
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_on_kill_logs_cancel_error(self, mock_hook):
+        operation = mock_hook.return_value.delete_service.return_value
+        operation.cancel.side_effect = GoogleAPICallError("test error")
+
+        self.operator.execute(context=mock.MagicMock())
+        with mock.patch.object(self.operator.log, "exception") as mock_log_exception:
+            self.operator.on_kill()
+
+        operation.cancel.assert_called_once_with()
+        mock_log_exception.assert_called_once()
+
+    def test_on_kill_before_operation_is_started(self):
+        self.operator.on_kill()
+
+
+class TestDataprocMetastoreCreateMetadataImportsOperator:
+    METADATA_IMPORTS = {
+        "import-1": {"database_dump": {"gcs_uri": "gs://test-bucket/dump-1.sql"}},
+        "import-2": {"database_dump": {"gcs_uri": "gs://test-bucket/dump-2.sql"}},
+    }
+
+    def setup_method(self):
+        self.operator = DataprocMetastoreCreateMetadataImportsOperator(
+            task_id=TASK_ID.format("create_metadata_imports"),
+            region=GCP_LOCATION,
+            project_id=GCP_PROJECT_ID,
+            service_id=TEST_SERVICE_ID,
+            metadata_imports=self.METADATA_IMPORTS,
+            gcp_conn_id=GCP_CONN_ID,
+            impersonation_chain=IMPERSONATION_CHAIN,
+        )
+
+    @staticmethod
+    def _context(try_number: int = 1) -> mock.MagicMock:
+        ti = mock.MagicMock(dag_id="test_dag", task_id="test_task", run_id="test_run", map_index=-1)
+        ti.try_number = try_number
+        context = mock.MagicMock()
+        context.__getitem__.side_effect = lambda key: ti if key == "ti" else mock.MagicMock()
+        return context
+
+    @mock.patch("google.cloud.metastore_v1.types.MetadataImport")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute(self, mock_hook, mock_metadata_import):
+        operations = [mock.MagicMock(), mock.MagicMock()]
+        mock_hook.return_value.create_metadata_import.side_effect = operations
+        mock_metadata_import.to_dict.side_effect = [{"name": "import-1"}, {"name": "import-2"}]
+
+        result = self.operator.execute(context=self._context())
+
+        assert result == [{"name": "import-1"}, {"name": "import-2"}]
+        mock_hook.assert_called_once_with(gcp_conn_id=GCP_CONN_ID, impersonation_chain=IMPERSONATION_CHAIN)
+        create_calls = mock_hook.return_value.create_metadata_import.call_args_list
+        assert [c.kwargs["metadata_import_id"] for c in create_calls] == ["import-1", "import-2"]
+        assert [c.kwargs["metadata_import"] for c in create_calls] == list(self.METADATA_IMPORTS.values())
+        assert mock_hook.return_value.wait_for_operation.call_args_list == [
+            mock.call(None, operations[0]),
+            mock.call(None, operations[1]),
+        ]
+
+    @mock.patch("google.cloud.metastore_v1.types.MetadataImport")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute_request_ids_are_stable_across_retries(self, mock_hook, mock_metadata_import):
+        self.operator.execute(context=self._context(try_number=1))
+        self.operator.execute(context=self._context(try_number=2))
+
+        request_ids = [
+            c.kwargs["request_id"] for c in mock_hook.return_value.create_metadata_import.call_args_list
+        ]
+        assert request_ids[:2] == request_ids[2:]
+        assert request_ids[0] != request_ids[1]
+
+    @mock.patch("google.cloud.metastore_v1.types.MetadataImport")
+    @mock.patch(DATAPROC_METASTORE_PATH.format("DataprocMetastoreHook"))
+    def test_execute_stops_at_failed_import(self, mock_hook, mock_metadata_import):
+        mock_hook.return_value.wait_for_operation.side_effect = AirflowException("test error")
+
+        with pytest.raises(AirflowException, match="test error"):
+            self.operator.execute(context=self._context())
+
+        mock_hook.return_value.create_metadata_import.assert_called_once()
@@ -0,0 +1,226 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+import pytest
+from google.cloud.dataproc_v1 import Cluster, ClusterStatus, Job, JobStatus
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+
+from airflow.providers.google.cloud.triggers.dataproc import (
+    DataprocClusterTrigger,
+    DataprocDeleteClusterTrigger,
+    DataprocOperationTrigger,
+    DataprocSubmitTrigger,
+)
+from airflow.providers.google.cloud.utils.dataproc import DataprocOperationType
+from airflow.triggers.base import TriggerEvent
+
+TEST_PROJECT_ID = "project-id"
+TEST_REGION = "region"
+TEST_CLUSTER_NAME = "cluster_name"
+TEST_GCP_CONN_ID = "google_cloud_default"
+TEST_POLL_INTERVAL = 5
+TEST_JOB_ID = "job-id"
+TEST_OPERATION_NAME = "projects/project-id/regions/region/operations/operation-id"
+TEST_DIAGNOSE_OUTPUT_URI = "gs://bucket/diagnostic/output"
+
+TRIGGER_PATH = "airflow.providers.google.cloud.triggers.dataproc.{}"
+
+
+def _cluster_trigger(**kwargs) -> DataprocClusterTrigger:
+    return DataprocClusterTrigger(
+        cluster_name=TEST_CLUSTER_NAME,
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        gcp_conn_id=TEST_GCP_CONN_ID,
+        polling_interval_seconds=TEST_POLL_INTERVAL,
+        **kwargs,
+    )
+
+
+class TestDataprocPollingInterval:
+    @pytest.mark.parametrize("attempt", [0, 1, 5, 100])
+    def test_default_polling_interval_is_constant(self, attempt):
+        assert _cluster_trigger()._get_polling_interval(attempt) == TEST_POLL_INTERVAL
+
+    def test_polling_interval_backs_off_up_to_max(self):
+        trigger = _cluster_trigger(backoff_factor=2.0, max_polling_interval_seconds=30)
+
+        intervals = [trigger._get_polling_interval(attempt) for attempt in range(5)]
+
+        assert intervals == [5, 10, 20, 30, 30]
+
+    def test_polling_interval_jitter(self):
+        trigger = _cluster_trigger(jitter=0.2)
+
+        for _ in range(20):
+            assert TEST_POLL_INTERVAL * 0.8 <= trigger._get_polling_interval(0) <= TEST_POLL_INTERVAL * 1.2
+
+    def test_serialize_keeps_default_polling(self):
+        _, kwargs = _cluster_trigger().serialize()
+
+        assert kwargs["polling_interval_seconds"] == TEST_POLL_INTERVAL
+        assert kwargs["backoff_factor"] == 1.0
+        assert kwargs["max_polling_interval_seconds"] == 300
+        assert kwargs["jitter"] == 0.0
+
+
+def _delete_cluster_trigger(end_time: float) -> DataprocDeleteClusterTrigger:
+    return DataprocDeleteClusterTrigger(
+        cluster_name=TEST_CLUSTER_NAME,
+        end_time=end_time,
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        gcp_conn_id=TEST_GCP_CONN_ID,
+        polling_interval_seconds=TEST_POLL_INTERVAL,
+        operation_name=TEST_OPERATION_NAME,
+    )
+
+
+class TestDataprocDeleteClusterTriggerOperation:
+    def test_serialize(self):
+        _, kwargs = _delete_cluster_trigger(end_time=100).serialize()
+
+        assert kwargs["operation_name"] == TEST_OPERATION_NAME
+
+    @pytest.mark.asyncio
+    @mock.patch("asyncio.sleep")
+    @mock.patch(TRIGGER_PATH.format("DataprocAsyncHook.get_operation"))
+    async def test_run_operation_done(self, mock_get_operation, mock_sleep):
+        mock_get_operation.side_effect = [
+            operations_pb2.Operation(name=TEST_OPERATION_NAME, done=False),
+            operations_pb2.Operation(name=TEST_OPERATION_NAME, done=True),
+        ]
+
+        event = await _delete_cluster_trigger(end_time=time.time() + 60).run().asend(None)
+
+        assert event == TriggerEvent({"status": "success", "message": ""})
+        mock_get_operation.assert_called_with(region=TEST_REGION, operation_name=TEST_OPERATION_NAME)
+        assert mock_get_operation.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @pytest.mark.asyncio
+    @mock.patch("asyncio.sleep")
+    @mock.patch(TRIGGER_PATH.format("DataprocAsyncHook.get_operation"))
+    async def test_run_operation_done_with_error(self, mock_get_operation, mock_sleep):
+        operation = operations_pb2.Operation(name=TEST_OPERATION_NAME, done=True)
+        operation.error.CopyFrom(status_pb2.Status(code=9, message="Cluster is in use"))
+        mock_get_operation.return_value = operation
+
+        event = await _delete_cluster_trigger(end_time=time.time() + 60).run().asend(None)
+
+        assert event == TriggerEvent({"status": "error", "message": "Cluster is in use"})
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @mock.patch(TRIGGER_PATH.format("DataprocAsyncHook.get_operation"))
+    async def test_run_timeout(self, mock_get_operation):
+        event = await _delete_cluster_trigger(end_time=time.time() - 1).run().asend(None)
+
+        assert event == TriggerEvent({"status": "error", "message": "Timeout"})
+        mock_get_operation.assert_not_called()
+
+
+def _diagnose_operation(response: bytes) -> operations_pb2.Operation:
+    operation = operations_pb2.Operation(name=TEST_OPERATION_NAME, done=True)
+    operation.response.value = response
+    return operation
+
+
+class TestDataprocOperationTriggerDiagnose:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response, expected_output_uri",
+        [
+            pytest.param(
+                b"\n\x1e" + TEST_DIAGNOSE_OUTPUT_URI.encode() + b"\x12", TEST_DIAGNOSE_OUTPUT_URI, id="match"
+            ),
+            pytest.param(b"no uri in here", "no uri in here", id="small-unmatched"),
+            pytest.param(b"x" * 4097, "", id="large-unmatched"),
+        ],
+    )
+    @mock.patch(TRIGGER_PATH.format("DataprocAsyncHook.get_operation"))
+    async def test_run_output_uri(self, mock_get_operation, response, expected_output_uri):
+        mock_get_operation.return_value = _diagnose_operation(response)
+        trigger = DataprocOperationTrigger(
+            name=TEST_OPERATION_NAME,
+            operation_type=DataprocOperationType.DIAGNOSE.value,
+            project_id=TEST_PROJECT_ID,
+            region=TEST_REGION,
+            gcp_conn_id=TEST_GCP_CONN_ID,
+        )
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent(
+            {
+                "status": "success",
+                "message": "Operation is successfully ended.",
+                "output_uri": expected_output_uri,
+            }
+        )
+        assert isinstance(event.payload["output_uri"], str)
+
+
+class TestDataprocTriggerEventPayloads:
+    @pytest.mark.asyncio
+    @mock.patch(TRIGGER_PATH.format("DataprocAsyncHook.get_cluster"))
+    async def test_cluster_trigger_sends_cluster_as_dict(self, mock_get_cluster):
+        cluster = Cluster(
+            cluster_name=TEST_CLUSTER_NAME,
+            project_id=TEST_PROJECT_ID,
+            status=ClusterStatus(state=ClusterStatus.State.RUNNING),
+        )
+        mock_get_cluster.return_value = cluster
+
+        event = await _cluster_trigger().run().asend(None)
+
+        assert event.payload["cluster_state"] == ClusterStatus.State.RUNNING
+        assert event.payload["cluster"] == Cluster.to_dict(cluster)
+        assert isinstance(event.payload["cluster"], dict)
+
+    @pytest.mark.asyncio
+    @mock.patch(TRIGGER_PATH.format("DataprocAsyncHook.get_job"))
+    async def test_submit_trigger_sends_only_job_status(self, mock_get_job):
+        job = Job(
+            reference={"job_id": TEST_JOB_ID, "project_id": TEST_PROJECT_ID},
+            status=JobStatus(state=JobStatus.State.ERROR, details="Job failed"),
+            driver_output_resource_uri="gs://bucket/driver-output",
+        )
+        mock_get_job.return_value = job
+        trigger = DataprocSubmitTrigger(
+            job_id=TEST_JOB_ID,
+            project_id=TEST_PROJECT_ID,
+            region=TEST_REGION,
+            gcp_conn_id=TEST_GCP_CONN_ID,
+        )
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent(
+            {
+                "job_id": TEST_JOB_ID,
+                "job_state": JobStatus.State.ERROR,
+                "job": {"status": JobStatus.to_dict(job.status)},
+            }
+        )
+        assert event.payload["job"]["status"]["details"] == "Job failed"
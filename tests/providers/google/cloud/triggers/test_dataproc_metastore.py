@@ -0,0 +1,142 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import base64
+from unittest import mock
+
+import pytest
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+
+from airflow.providers.google.cloud.triggers.dataproc_metastore import DataprocMetastoreOperationTrigger
+from airflow.triggers.base import TriggerEvent
+
+TEST_OPERATION_NAME = "projects/test-project/locations/test-location/operations/test-operation"
+TEST_GCP_CONN_ID = "test-gcp-conn-id"
+TEST_IMPERSONATION_CHAIN = ["ACCOUNT_1", "ACCOUNT_2"]
+TEST_POLL_INTERVAL = 10
+TEST_RESPONSE = b"serialized response"
+
+HOOK_PATH = "airflow.providers.google.cloud.triggers.dataproc_metastore.DataprocMetastoreAsyncHook.{}"
+
+
+@pytest.fixture
+def trigger():
+    return DataprocMetastoreOperationTrigger(
+        operation_name=TEST_OPERATION_NAME,
+        gcp_conn_id=TEST_GCP_CONN_ID,
+        impersonation_chain=TEST_IMPERSONATION_CHAIN,
+        polling_interval_seconds=TEST_POLL_INTERVAL,
+    )
+
+
+def _operation(done: bool = True, error_message: str = "") -> operations_pb2.Operation:
+    operation = operations_pb2.Operation(name=TEST_OPERATION_NAME, done=done)
+    if error_message:
+        operation.error.CopyFrom(status_pb2.Status(code=13, message=error_message))
+    elif done:
+        operation.response.value = TEST_RESPONSE
+    return operation
+
+
+class TestDataprocMetastoreOperationTrigger:
+    def test_serialize(self, trigger):
+        classpath, kwargs = trigger.serialize()
+
+        assert (
+            classpath
+            == "airflow.providers.google.cloud.triggers.dataproc_metastore.DataprocMetastoreOperationTrigger"
+        )
+        assert kwargs == {
+            "operation_name": TEST_OPERATION_NAME,
+            "gcp_conn_id": TEST_GCP_CONN_ID,
+            "impersonation_chain": TEST_IMPERSONATION_CHAIN,
+            "polling_interval_seconds": TEST_POLL_INTERVAL,
+            "timeout": None,
+        }
+
+    def test_async_hook_is_reused(self, trigger):
+        assert trigger.get_async_hook() is trigger.get_async_hook()
+
+    @pytest.mark.asyncio
+    @mock.patch("asyncio.sleep")
+    @mock.patch(HOOK_PATH.format("get_operation"))
+    async def test_run_success(self, mock_get_operation, mock_sleep, trigger):
+        mock_get_operation.side_effect = [_operation(done=False), _operation(done=False), _operation()]
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent(
+            {
+                "status": "success",
+                "operation_name": TEST_OPERATION_NAME,
+                "response": base64.b64encode(TEST_RESPONSE).decode("ascii"),
+            }
+        )
+        assert mock_get_operation.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @pytest.mark.asyncio
+    @mock.patch(HOOK_PATH.format("get_operation"))
+    async def test_run_operation_error(self, mock_get_operation, trigger):
+        mock_get_operation.return_value = _operation(error_message="test error")
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent(
+            {"status": "error", "operation_name": TEST_OPERATION_NAME, "message": "test error"}
+        )
+
+    @pytest.mark.asyncio
+    @mock.patch(HOOK_PATH.format("get_operation"))
+    async def test_run_exception(self, mock_get_operation, trigger):
+        mock_get_operation.side_effect = Exception("test exception")
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent({"status": "error", "message": "test exception"})
+
+    @pytest.mark.asyncio
+    @mock.patch("asyncio.sleep")
+    @mock.patch(HOOK_PATH.format("get_operation"))
+    async def test_run_timeout(self, mock_get_operation, mock_sleep, trigger):
+        trigger.timeout = 0
+        mock_get_operation.return_value = _operation(done=False)
+
+        event = await trigger.run().asend(None)
+
+        assert event == TriggerEvent(
+            {
+                "status": "error",
+                "operation_name": TEST_OPERATION_NAME,
+                "message": f"Operation {TEST_OPERATION_NAME} is not done after 0s.",
+            }
+        )
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @mock.patch("asyncio.sleep")
+    @mock.patch(HOOK_PATH.format("get_operation"))
+    async def test_run_logs_in_progress_once(self, mock_get_operation, mock_sleep, trigger):
+        mock_get_operation.side_effect = [_operation(done=False)] * 3 + [_operation()]
+
+        with mock.patch.object(trigger.log, "info") as mock_log_info:
+            await trigger.run().asend(None)
+
+        mock_log_info.assert_called_once_with("Operation %s is in progress.", TEST_OPERATION_NAME)
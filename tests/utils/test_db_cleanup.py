@@ -0,0 +1,193 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pendulum
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select, text
+from sqlalchemy.orm import Session, aliased
+
+from airflow.utils.db_cleanup import (
+    ARCHIVE_TABLE_PREFIX,
+    CreateTableAs,
+    _cleanup_table,
+    _do_delete,
+    _get_batch_keys,
+    _primary_key_in,
+    config_dict,
+    run_cleanup,
+)
+
+MODULE = "airflow.utils.db_cleanup"
+
+
+class TestBatchedCleanup:
+    @pytest.mark.parametrize(
+        "batches, expected_deletes",
+        [
+            pytest.param([[("a",), ("b",)], [("c",), ("d",)], [("e",)]], 3, id="stops-after-short-batch"),
+            pytest.param([[("a",), ("b",)], []], 1, id="stops-after-empty-batch"),
+        ],
+    )
+    @mock.patch(f"{MODULE}.reflect_tables")
+    @mock.patch(f"{MODULE}._do_delete")
+    @mock.patch(f"{MODULE}._get_batch_keys")
+    @mock.patch(f"{MODULE}._check_for_rows", return_value=5)
+    @mock.patch(f"{MODULE}._build_query")
+    def test_cleanup_table_archives_all_batches_into_one_table(
+        self,
+        mock_build_query,
+        mock_check_for_rows,
+        mock_get_batch_keys,
+        mock_do_delete,
+        mock_reflect,
+        batches,
+        expected_deletes,
+    ):
+        mock_get_batch_keys.side_effect = batches
+
+        _cleanup_table(
+            **config_dict["task_instance"].__dict__,
+            clean_before_timestamp=pendulum.datetime(2024, 1, 1, tz="UTC"),
+            dry_run=False,
+            batch_size=2,
+            session=mock.MagicMock(),
+        )
+
+        assert mock_get_batch_keys.call_count == len(batches)
+        assert mock_get_batch_keys.call_args.kwargs["batch_size"] == 2
+        assert mock_do_delete.call_count == expected_deletes
+        assert [c.kwargs["batch_keys"] for c in mock_do_delete.call_args_list] == batches[:expected_deletes]
+        target_table_names = {c.kwargs["target_table_name"] for c in mock_do_delete.call_args_list}
+        assert len(target_table_names) == 1
+        assert target_table_names.pop().startswith(f"{ARCHIVE_TABLE_PREFIX}task_instance__")
+
+    @mock.patch(f"{MODULE}._do_delete")
+    @mock.patch(f"{MODULE}._check_for_rows", return_value=5)
+    @mock.patch(f"{MODULE}._build_query")
+    def test_cleanup_table_without_batch_size(self, mock_build_query, mock_check_for_rows, mock_do_delete):
+        session = mock.MagicMock()
+
+        _cleanup_table(
+            **config_dict["task_instance"].__dict__,
+            clean_before_timestamp=pendulum.datetime(2024, 1, 1, tz="UTC"),
+            dry_run=False,
+            session=session,
+        )
+
+        mock_build_query.return_value.limit.assert_not_called()
+        mock_do_delete.assert_called_once_with(
+            query=mock_build_query.return_value,
+            orm_model=config_dict["task_instance"].orm_model,
+            skip_archive=False,
+            session=session,
+        )
+
+    @pytest.mark.parametrize("dialect_name", ["postgresql", "mysql", "sqlite"])
+    @mock.patch(f"{MODULE}.reflect_tables")
+    @mock.patch(f"{MODULE}.inspect")
+    def test_do_delete_inserts_into_existing_archive_table(self, mock_inspect, mock_reflect, dialect_name):
+        mock_inspect.return_value.has_table.return_value = True
+        session = mock.MagicMock()
+        session.get_bind.return_value.dialect.name = dialect_name
+        target_table = mock_reflect.return_value.tables.__getitem__.return_value
+        target_table_name = f"{ARCHIVE_TABLE_PREFIX}task_instance__20240101000000"
+
+        with mock.patch(f"{MODULE}.tuple_"), mock.patch(f"{MODULE}.select"), mock.patch(f"{MODULE}.and_"):
+            _do_delete(
+                query=mock.MagicMock(),
+                orm_model=config_dict["task_instance"].orm_model,
+                skip_archive=False,
+                session=session,
+                target_table_name=target_table_name,
+            )
+
+        mock_inspect.return_value.has_table.assert_called_once_with(target_table_name)
+        target_table.insert.return_value.from_select.assert_called_once()
+        executed = [c.args[0] for c in session.execute.call_args_list]
+        assert not any(isinstance(stmt, CreateTableAs) for stmt in executed)
+        assert not any("CREATE TABLE" in str(stmt) for stmt in executed)
+
+    @mock.patch(f"{MODULE}.and_")
+    @mock.patch(f"{MODULE}._primary_key_in")
+    @mock.patch(f"{MODULE}.reflect_tables")
+    @mock.patch(f"{MODULE}.inspect")
+    def test_do_delete_batch_only_deletes_batch_keys(
+        self, mock_inspect, mock_reflect, mock_primary_key_in, mock_and
+    ):
+        mock_inspect.return_value.has_table.return_value = True
+        session = mock.MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        table = mock_reflect.return_value.tables.__getitem__.return_value
+
+        _do_delete(
+            query=mock.MagicMock(),
+            orm_model=config_dict["task_instance"].orm_model,
+            skip_archive=False,
+            session=session,
+            target_table_name=f"{ARCHIVE_TABLE_PREFIX}task_instance__20240101000000",
+            batch_keys=[("a",), ("b",)],
+        )
+
+        mock_primary_key_in.assert_called_with(table, [("a",), ("b",)])
+        session.query.return_value.filter.assert_called_once_with(mock_primary_key_in.return_value)
+        table.insert.return_value.from_select.assert_called_once_with(
+            table.c, session.query.return_value.filter.return_value
+        )
+        table.delete.return_value.where.assert_called_once_with(mock_primary_key_in.return_value)
+        mock_and.assert_not_called()
+
+    def test_batch_keys_select_and_delete_one_batch(self):
+        engine = create_engine("sqlite://")
+        metadata = MetaData()
+        source_table = Table(
+            "source",
+            metadata,
+            Column("dag_id", String(50), primary_key=True),
+            Column("map_index", Integer, primary_key=True),
+        )
+        metadata.create_all(engine)
+
+        with Session(engine) as session:
+            session.execute(source_table.insert(), [{"dag_id": "dag", "map_index": i} for i in range(5)])
+            query = session.query(aliased(source_table, name="base")).with_entities(text("base.*"))
+
+            batch_keys = _get_batch_keys(
+                query=query, pk_col_names=["dag_id", "map_index"], batch_size=2, session=session
+            )
+            session.execute(source_table.delete().where(_primary_key_in(source_table, batch_keys)))
+
+            assert len(batch_keys) == 2
+            remaining = {tuple(row) for row in session.execute(select(source_table))}
+            assert remaining == {("dag", i) for i in range(5)} - set(batch_keys)
+
+    @mock.patch(f"{MODULE}._cleanup_table")
+    @mock.patch(f"{MODULE}.reflect_tables")
+    def test_run_cleanup_passes_batch_size(self, mock_reflect, mock_cleanup_table):
+        mock_reflect.return_value.tables = {"task_instance": mock.MagicMock()}
+
+        run_cleanup(
+            clean_before_timestamp=pendulum.datetime(2024, 1, 1, tz="UTC"),
+            table_names=["task_instance"],
+            confirm=False,
+            batch_size=100,
+            session=mock.MagicMock(),
+        )
+
+        assert mock_cleanup_table.call_args.kwargs["batch_size"] == 100